@@ -0,0 +1,31 @@
+"""
+Validated versus trusted construction of DANJAResourceList from BaseModels.
+"""
+
+from typing import Optional
+
+from harness import measure, report
+from pydantic import BaseModel, Field
+
+from pydanja import DANJAResourceList
+
+
+class Article(BaseModel):
+    article_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    title: str
+    body: str
+
+
+def main() -> None:
+    for size in (1_000, 10_000, 100_000):
+        models = [Article(id=index, title=f"Title {index}", body="x" * 64) for index in range(size)]
+        for container in (DANJAResourceList, DANJAResourceList[Article]):
+            label = f"{container.__name__} {size}"
+            report(f"validated {label}", measure(lambda: container.from_basemodel_list(models), repeat=3))
+            report(
+                f"trusted   {label}", measure(lambda: container.from_basemodel_list(models, trusted=True), repeat=3)
+            )
+
+
+if __name__ == "__main__":
+    main()
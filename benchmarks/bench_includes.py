@@ -0,0 +1,101 @@
+"""
+Loader calls and time for resolving `include=author,comments.author`, batched per
+type and level by IncludeResolver versus one load per relationship per resource.
+"""
+
+import asyncio
+from typing import Optional
+
+from harness import measure, report
+from pydantic import BaseModel, ConfigDict, Field
+
+from pydanja import CompoundDocument, DANJAResourceList, IncludeResolver, InMemoryLoader
+
+
+class Person(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "people"})
+
+    person_id: int = Field(json_schema_extra={"resource_id": True})
+    name: str
+
+
+class Comment(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "comments"})
+
+    comment_id: int = Field(json_schema_extra={"resource_id": True})
+    body: str
+    author_id: int = Field(json_schema_extra={"relationship": "author", "resource_type": "people"})
+
+
+class Article(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "articles"})
+
+    article_id: int = Field(json_schema_extra={"resource_id": True})
+    title: str
+    author_id: Optional[int] = Field(
+        default=None, json_schema_extra={"relationship": "author", "resource_type": "people"}
+    )
+    comment_ids: list[int] = Field(
+        default=[], json_schema_extra={"relationship": "comments", "resource_type": "comments"}
+    )
+
+
+def fixtures(size: int) -> tuple[list[Article], dict[int, Person], dict[int, Comment]]:
+    people = {index: Person(person_id=index, name=f"Person {index}") for index in range(size // 10 + 1)}
+    comments = {
+        index: Comment(comment_id=index, body="x" * 32, author_id=index % len(people)) for index in range(size * 5)
+    }
+    articles = [
+        Article(
+            article_id=index,
+            title=f"Title {index}",
+            author_id=index % len(people),
+            comment_ids=list(range(index * 5, index * 5 + 5)),
+        )
+        for index in range(size)
+    ]
+    return articles, people, comments
+
+
+async def naive(document: DANJAResourceList, people: InMemoryLoader, comments: InMemoryLoader) -> None:
+    """Follow every relationship of every resource with its own load"""
+    compound = CompoundDocument(document)
+    for resource in document.data:
+        compound.add_included(await people([resource.relationships["author"].data.id]))
+        for identifier in resource.relationships["comments"].data:
+            for comment in await comments([identifier.id]):
+                compound.add_included([comment])
+                compound.add_included(await people([str(comment.author_id)]))
+    compound.build()
+
+
+def main() -> None:
+    # asyncio.run reprs the main task when installing its SIGINT handler, which is
+    # costly with large documents in scope, so every run shares one plain event loop
+    loop = asyncio.new_event_loop()
+    for size in (100, 1_000, 10_000):
+        articles, people, comments = fixtures(size)
+
+        def batched() -> tuple[InMemoryLoader, InMemoryLoader]:
+            people_loader, comments_loader = InMemoryLoader(people), InMemoryLoader(comments)
+            include_resolver = IncludeResolver(trusted=True)
+            include_resolver.register("people", people_loader)
+            include_resolver.register("comments", comments_loader)
+            document = DANJAResourceList.from_basemodel_list(articles, trusted=True)
+            loop.run_until_complete(include_resolver.include(document, "author,comments.author"))
+            return people_loader, comments_loader
+
+        def one_by_one() -> tuple[InMemoryLoader, InMemoryLoader]:
+            people_loader, comments_loader = InMemoryLoader(people), InMemoryLoader(comments)
+            document = DANJAResourceList.from_basemodel_list(articles, trusted=True)
+            loop.run_until_complete(naive(document, people_loader, comments_loader))
+            return people_loader, comments_loader
+
+        for label, func in (("batched", batched), ("naive", one_by_one)):
+            calls = sum(len(loader.calls) for loader in func())
+            report(f"{label:<8} {size} articles, {calls} loader calls", measure(func, repeat=3))
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+danja_openapi on a synthetic schema shaped like a large FastAPI application.
+"""
+
+import copy
+
+from harness import measure, report
+
+from pydanja import danja_openapi
+
+
+def ref(name: str) -> dict:
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def build_schema(routes: int, models: int) -> dict:
+    schemas: dict = {
+        "DANJALink": {"properties": {"href": {"type": "string"}}, "type": "object"},
+        "DANJAError": {"properties": {"links": {"additionalProperties": ref("DANJALink")}}, "type": "object"},
+        "DANJAErrorList": {"properties": {"errors": {"items": ref("DANJAError")}}, "type": "object"},
+    }
+    for index in range(models):
+        model = f"Model{index}"
+        schemas[model] = {"properties": {"name": {"type": "string"}}, "type": "object"}
+        schemas[f"DANJASingleResource_{model}_"] = {
+            "properties": {"attributes": ref(model), "links": {"additionalProperties": ref("DANJALink")}},
+            "type": "object",
+        }
+        schemas[f"DANJAResource_{model}_"] = {
+            "properties": {"data": ref(f"DANJASingleResource_{model}_"), "links": ref("DANJALink")},
+            "type": "object",
+        }
+        schemas[f"DANJAResourceList_{model}_"] = {
+            "properties": {"data": {"items": ref(f"DANJASingleResource_{model}_")}, "links": ref("DANJALink")},
+            "type": "object",
+        }
+
+    paths = {}
+    for index in range(routes):
+        model = f"Model{index % models}"
+        container = "DANJAResource" if index % 2 else "DANJAResourceList"
+        paths[f"/route{index}"] = {
+            "get": {
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"anyOf": [ref(f"{container}_{model}_"), ref("DANJAErrorList")]}
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    return {"openapi": "3.1.0", "paths": paths, "components": {"schemas": schemas}}
+
+
+def main() -> None:
+    for routes, models in ((40, 10), (400, 60), (2000, 200)):
+        schema = build_schema(routes, models)
+        label = f"{routes} routes, {models} models"
+        report(f"uncached {label}", measure(lambda: danja_openapi(copy.deepcopy(schema), cache=False)))
+        report(f"deepcopy only {label}", measure(lambda: copy.deepcopy(schema)))
+        danja_openapi(copy.deepcopy(schema))
+        report(f"cached {label}", measure(lambda: danja_openapi(schema)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Scaling of parallel_dump_json across 1-N workers against model_dump_json, for thread and
+process pools. Pass the largest worker count as the first argument, the CPU count by default.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from harness import measure, report
+from pydantic import BaseModel, Field
+
+from pydanja import DANJAResourceList, parallel_dump_json
+from pydanja.parallel import free_threaded
+
+
+class Reading(BaseModel):
+    reading_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    sensor: str
+    value: float
+    unit: str
+    note: Optional[str] = None
+
+
+def main() -> None:
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    size = 100_000
+    document = DANJAResourceList.from_basemodel_list(
+        [Reading(id=index, sensor=f"sensor-{index % 50}", value=index / 7, unit="C") for index in range(size)],
+        trusted=True,
+    )
+    print(f"{size} resources, free-threaded: {free_threaded()}")
+    report("model_dump_json", measure(lambda: document.model_dump_json(), repeat=3))
+
+    workers = 1
+    while workers <= max_workers:
+        for label, pool in (("threads", ThreadPoolExecutor), ("processes", ProcessPoolExecutor)):
+            with pool(workers) as executor:
+                # Warm the pool up so worker start up is not measured
+                parallel_dump_json(document, executor, chunk_size=size // workers)
+                for chunk_size in (5_000, 20_000):
+                    report(
+                        f"{label:<9} x{workers} chunks of {chunk_size}",
+                        measure(lambda: parallel_dump_json(document, executor, chunk_size=chunk_size), repeat=3),
+                    )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
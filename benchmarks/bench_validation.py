@@ -0,0 +1,54 @@
+"""
+Validation cost of DANJAResourceList documents with and without `included`.
+
+The "deepcopy" rows reproduce the cost of the previous wrap validator, which
+deep copied the whole payload before handing it to pydantic.
+"""
+
+from copy import deepcopy
+from typing import Optional
+
+from harness import measure, report
+from pydantic import BaseModel, Field
+
+from pydanja import DANJAResourceList
+
+
+class Article(BaseModel):
+    article_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    title: str
+    body: str
+    tags: list[str]
+
+
+def build_payload(size: int, included: bool) -> dict:
+    payload: dict = {
+        "data": [
+            {
+                "id": str(index),
+                "type": "article",
+                "attributes": {"id": index, "title": f"Title {index}", "body": "x" * 64, "tags": ["a", "b", "c"]},
+            }
+            for index in range(size)
+        ]
+    }
+    if included:
+        payload["included"] = [
+            {"id": str(index), "type": "people", "attributes": {"name": f"Person {index}"}}
+            for index in range(size // 10)
+        ]
+    return payload
+
+
+def main() -> None:
+    container = DANJAResourceList[Article]
+    for size in (1_000, 10_000):
+        for included in (False, True):
+            payload = build_payload(size, included)
+            label = f"{size} resources{' + included' if included else ''}"
+            report(f"deepcopy {label}", measure(lambda: container.model_validate(deepcopy(payload))))
+            report(f"shallow  {label}", measure(lambda: container.model_validate(payload)))
+
+
+if __name__ == "__main__":
+    main()
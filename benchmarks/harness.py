@@ -0,0 +1,59 @@
+"""
+Small timing and allocation helpers shared by the benchmark scripts.
+
+Run the scripts from the project root, e.g. `python benchmarks/bench_validation.py`
+"""
+
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+# Make the in-tree package importable without installing it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+
+def measure(func: Callable[[], Any], repeat: int = 5) -> dict[str, float]:
+    """
+    Time `func` `repeat` times and trace the memory of one further call.
+    Returns the best and median wall time in seconds, the peak traced memory
+    in bytes and the number of memory blocks the call left allocated.
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del result
+
+    return {
+        "best": min(timings),
+        "median": statistics.median(timings),
+        "peak": float(peak),
+        "retained": float(retained),
+    }
+
+
+def report(name: str, result: dict[str, float]) -> None:
+    """Print a single benchmark result line"""
+    print(
+        f"{name:<48} best {result['best'] * 1000:10.2f} ms"
+        f"  median {result['median'] * 1000:10.2f} ms"
+        f"  peak {result['peak'] / 1024:10.1f} KiB"
+        f"  retained {int(result['retained']):>9}"
+    )
@@ -0,0 +1,247 @@
+"""
+Benchmark suite for the pydanja hot paths, across payload sizes and attribute widths.
+Every case reports time, peak traced memory and retained allocations, and results can be
+stored as a baseline and compared with later runs, e.g. before and after a commit:
+
+    python benchmarks/suite.py --save main           # writes benchmarks/baselines/main.json
+    python benchmarks/suite.py --compare main        # compares against it
+    python benchmarks/suite.py --quick --filter validate
+"""
+
+import argparse
+import copy
+import json
+import platform
+import subprocess
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pydantic
+from bench_openapi import build_schema
+from harness import measure, report
+from pydantic import BaseModel, Field, create_model
+
+from pydanja import DANJADocumentView, DANJAResource, DANJAResourceList, danja_openapi
+
+BASELINES = Path(__file__).resolve().parent / "baselines"
+SIZES = (100, 1_000, 10_000)
+QUICK_SIZES = (100, 1_000)
+WIDTHS = (4, 32)
+
+Case = Callable[[int, int], Callable[[], Any]]
+CASES: dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    def register(setup: Case) -> Case:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+@lru_cache
+def attributes_model(width: int) -> type[BaseModel]:
+    """An attribute model with an aliased id and `width` str, int and float fields, one class per width"""
+    types = (str, int, float)
+    fields: dict[str, Any] = {f"field_{index}": (types[index % len(types)], ...) for index in range(width)}
+    return create_model(  # ty: ignore
+        f"Attributes{width}",
+        item_id=(Optional[int], Field(alias="id", default=None, json_schema_extra={"resource_id": True})),
+        **fields,
+    )
+
+
+def attribute_values(width: int, index: int) -> dict[str, Any]:
+    samples = (f"value {index}", index, index / 7)
+    return {f"field_{field}": samples[field % len(samples)] for field in range(width)}
+
+
+def models(size: int, width: int) -> list[BaseModel]:
+    model = attributes_model(width)
+    return [model(id=index, **attribute_values(width, index)) for index in range(size)]
+
+
+def payload(size: int, width: int, included: bool) -> dict[str, Any]:
+    document: dict[str, Any] = {
+        "data": [
+            {
+                "id": str(index),
+                "type": f"attributes{width}",
+                "attributes": {"id": index, **attribute_values(width, index)},
+            }
+            for index in range(size)
+        ]
+    }
+    if included:
+        document["included"] = [
+            {"id": str(index), "type": "people", "attributes": {"name": f"Person {index}"}}
+            for index in range(max(size // 10, 1))
+        ]
+    return document
+
+
+@case("from_basemodel")
+def from_basemodel(size: int, width: int) -> Callable[[], Any]:
+    resources = models(size, width)
+    return lambda: [DANJAResource.from_basemodel(resource) for resource in resources]
+
+
+@case("from_basemodel_list")
+def from_basemodel_list(size: int, width: int) -> Callable[[], Any]:
+    resources = models(size, width)
+    return lambda: DANJAResourceList.from_basemodel_list(resources)
+
+
+@case("from_basemodel_list trusted")
+def from_basemodel_list_trusted(size: int, width: int) -> Callable[[], Any]:
+    resources = models(size, width)
+    container = DANJAResourceList[attributes_model(width)]  # ty: ignore
+    return lambda: container.from_basemodel_list(resources, trusted=True)
+
+
+def validate_dict(included: bool) -> Case:
+    def setup(size: int, width: int) -> Callable[[], Any]:
+        container = DANJAResourceList[attributes_model(width)]  # ty: ignore
+        document = payload(size, width, included)
+        return lambda: container.model_validate(document)
+
+    return setup
+
+
+def validate_json(included: bool) -> Case:
+    def setup(size: int, width: int) -> Callable[[], Any]:
+        container = DANJAResourceList[attributes_model(width)]  # ty: ignore
+        document = json.dumps(payload(size, width, included)).encode()
+        return lambda: container.from_json_bytes(document)
+
+    return setup
+
+
+case("validate dict")(validate_dict(False))
+case("validate dict + included")(validate_dict(True))
+case("validate json")(validate_json(False))
+case("validate json + included")(validate_json(True))
+
+
+@case("lazy view json, ids + one read")
+def lazy_view(size: int, width: int) -> Callable[[], Any]:
+    model = attributes_model(width)
+    document = json.dumps(payload(size, width, False)).encode()
+
+    def run() -> Any:
+        view = DANJADocumentView(document, model)
+        return list(view.ids()), view.get(str(size // 2))
+
+    return run
+
+
+@case("model_dump_json")
+def model_dump_json(size: int, width: int) -> Callable[[], Any]:
+    document = DANJAResourceList.from_basemodel_list(models(size, width), trusted=True)
+    return lambda: document.model_dump_json()
+
+
+@case("include_from_basemodels")
+def include_from_basemodels(size: int, width: int) -> Callable[[], Any]:
+    document = DANJAResourceList.from_basemodel_list(models(size, width), trusted=True)
+    includes = payload(size, width, True)["included"] * 10
+    return lambda: document.include_from_basemodels(includes)
+
+
+@case("danja_openapi")
+def openapi(size: int, width: int) -> Callable[[], Any]:
+    # Routes scale with the size, the schema does not depend on the attribute width
+    routes = max(size // 25, 4)
+    schema = build_schema(routes, max(routes // 4, 1))
+    # danja_openapi rewrites the schema in place, so each run gets a copy made up front
+    copies = [copy.deepcopy(schema) for _ in range(32)]
+
+    def run() -> Any:
+        return danja_openapi(copies.pop() if copies else copy.deepcopy(schema), cache=False)
+
+    return run
+
+
+def git_revision() -> Optional[str]:
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def run(sizes: tuple[int, ...], widths: tuple[int, ...], repeat: int, name_filter: str) -> dict[str, dict[str, float]]:
+    results = {}
+    for name, setup in CASES.items():
+        if name_filter not in name:
+            continue
+        for size in sizes:
+            for width in widths if name != "danja_openapi" else widths[:1]:
+                key = f"{name} size={size} width={width}"
+                results[key] = measure(setup(size, width), repeat=repeat)
+                report(key, results[key])
+    return results
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, Any], threshold: float) -> int:
+    """
+    Print the median time and peak memory of each case relative to the baseline,
+    returning the number of cases slower than the threshold allows
+    """
+    print(f"\nCompared with {baseline['metadata'].get('revision')} ({baseline['metadata'].get('created')})")
+    regressions = 0
+    for key, result in results.items():
+        previous = baseline["results"].get(key)
+        if previous is None:
+            continue
+        time_ratio = result["median"] / previous["median"] if previous["median"] else 1.0
+        peak_ratio = result["peak"] / previous["peak"] if previous["peak"] else 1.0
+        flag = ""
+        if time_ratio > 1 + threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        elif time_ratio < 1 - threshold:
+            flag = "  improved"
+        print(f"{key:<48} time x{time_ratio:5.2f}  peak x{peak_ratio:5.2f}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help=f"only run sizes {QUICK_SIZES}")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--save", metavar="NAME", help="store the results as a named baseline")
+    parser.add_argument("--compare", metavar="NAME", help="compare the results with a named baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slow down reported as a regression")
+    parser.add_argument("--fail", action="store_true", help="exit with status 1 on regressions")
+    args = parser.parse_args()
+
+    results = run(QUICK_SIZES if args.quick else SIZES, WIDTHS, args.repeat, args.filter)
+
+    if args.save:
+        BASELINES.mkdir(exist_ok=True)
+        metadata = {
+            "revision": git_revision(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pydantic": pydantic.VERSION,
+            "machine": platform.platform(),
+        }
+        path = BASELINES / f"{args.save}.json"
+        path.write_text(json.dumps({"metadata": metadata, "results": results}, indent=2))
+        print(f"\nSaved baseline {path}")
+
+    if args.compare:
+        baseline = json.loads((BASELINES / f"{args.compare}.json").read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions and args.fail:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
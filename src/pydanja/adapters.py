@@ -0,0 +1,141 @@
+import dataclasses
+from collections.abc import Mapping
+from operator import attrgetter, itemgetter, methodcaller
+from typing import Any, Callable, Iterable, Iterator, Optional, Protocol
+from weakref import WeakKeyDictionary
+
+from .resolver import ResourceResolver
+
+
+class ResourceAccessor(Protocol):
+    """Reads the attributes and single fields of one class of source objects"""
+
+    def attributes(self, source: Any) -> dict[str, Any]: ...
+
+    def getter(self, field: str) -> Callable[[Any], Any]: ...
+
+
+class MappingAccessor:
+    """Dicts and other mappings, attributes are a copy of the mapping"""
+
+    def attributes(self, source: Any) -> dict[str, Any]:
+        return dict(source)
+
+    def getter(self, field: str) -> Callable[[Any], Any]:
+        return methodcaller("get", field)
+
+
+class FieldsAccessor:
+    """Objects with a fixed set of attribute names, such as dataclasses and attrs classes"""
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names = tuple(names)
+        self._get = attrgetter(*self.names) if self.names else None
+
+    def attributes(self, source: Any) -> dict[str, Any]:
+        if self._get is None:
+            return {}
+        if len(self.names) == 1:
+            return {self.names[0]: self._get(source)}
+        return dict(zip(self.names, self._get(source)))
+
+    def getter(self, field: str) -> Callable[[Any], Any]:
+        return attrgetter(field)
+
+
+class TupleAccessor:
+    """Named tuples, values are read by position"""
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names = tuple(names)
+
+    def attributes(self, source: Any) -> dict[str, Any]:
+        return dict(zip(self.names, source))
+
+    def getter(self, field: str) -> Callable[[Any], Any]:
+        return itemgetter(self.names.index(field))
+
+
+class RowAccessor:
+    """ORM and DB driver rows exposing their columns as a `_mapping`, such as SQLAlchemy rows"""
+
+    def attributes(self, source: Any) -> dict[str, Any]:
+        return dict(source._mapping)
+
+    def getter(self, field: str) -> Callable[[Any], Any]:
+        get = methodcaller("get", field)
+        return lambda source: get(source._mapping)
+
+
+def _default_accessor(source_class: type) -> Optional[ResourceAccessor]:
+    if issubclass(source_class, Mapping):
+        return MappingAccessor()
+    if dataclasses.is_dataclass(source_class):
+        return FieldsAccessor(field.name for field in dataclasses.fields(source_class))
+    if hasattr(source_class, "__attrs_attrs__"):
+        return FieldsAccessor(attribute.name for attribute in source_class.__attrs_attrs__)  # ty: ignore
+    if issubclass(source_class, tuple) and isinstance(getattr(source_class, "_fields", None), tuple):
+        return TupleAccessor(source_class._fields)  # ty: ignore
+    if hasattr(source_class, "_mapping"):
+        return RowAccessor()
+    return None
+
+
+_accessor_factories: list[Callable[[type], Optional[ResourceAccessor]]] = [_default_accessor]
+
+# Accessors keyed by source class, built once per class
+_accessors: "WeakKeyDictionary[type, ResourceAccessor]" = WeakKeyDictionary()
+
+
+def register_accessor(accessor_factory: Callable[[type], Optional[ResourceAccessor]]) -> None:
+    """
+    Add a factory returning a ResourceAccessor for the source classes it supports, or None.
+    Factories registered later are tried first.
+    """
+    _accessor_factories.insert(0, accessor_factory)
+    _accessors.clear()
+
+
+def accessor_for(source_class: type) -> ResourceAccessor:
+    accessor = _accessors.get(source_class)
+    if accessor is None:
+        for factory in _accessor_factories:
+            accessor = factory(source_class)
+            if accessor is not None:
+                break
+        else:
+            raise TypeError(f"No resource accessor for {source_class.__name__}")
+        _accessors[source_class] = accessor
+    return accessor
+
+
+def object_rows(
+    sources: Iterable[Any], resource_name: Optional[str] = None, resource_id: Optional[str] = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield the values of a single resource per source object, with its attributes read
+    into a dict. The resource name and ID field are resolved per source class like
+    `from_basemodel`, the ID field defaults to `id`. Mappings, named tuples and rows are
+    generic containers whose class name is no resource type, so they need `resource_name`.
+    """
+    source_class: Optional[type] = None
+    for source in sources:
+        if source.__class__ is not source_class:
+            source_class = source.__class__
+            accessor = accessor_for(source_class)
+            if not resource_name and isinstance(accessor, (MappingAccessor, TupleAccessor, RowAccessor)):
+                raise Exception(f"No resource name for {source_class.__name__} sources, pass resource_name")
+            metadata = ResourceResolver.resolve(source_class, resource_name, resource_id)
+            name, id_field = metadata.resource_name, metadata.resource_id or "id"
+            id_getter = None
+
+        try:
+            id_getter = id_getter or accessor.getter(id_field)
+            id_value = id_getter(source)
+        except (AttributeError, ValueError):
+            raise Exception(f"Resource ID field not found in {name}: {id_field}")
+
+        values = {"type": name, "lid": None, "attributes": accessor.attributes(source)}
+        if id_value:
+            values["id"] = str(id_value)
+        yield values
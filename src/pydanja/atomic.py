@@ -0,0 +1,318 @@
+"""
+The JSON:API Atomic Operations extension, https://jsonapi.org/ext/atomic/
+"""
+
+from functools import lru_cache
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Generic, Iterable, Literal, Optional, Union
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    ValidationInfo,
+    model_serializer,
+    model_validator,
+)
+from pydantic.functional_serializers import SerializerFunctionWrapHandler
+from pydantic_core import PydanticCustomError
+from typing_extensions import Self
+
+from .models import DANJALink, DANJAResource, DANJASingleResource, ResourceType
+
+if TYPE_CHECKING:
+    from .registry import ResourceTypeRegistry
+
+ATOMIC_EXTENSION = "https://jsonapi.org/ext/atomic"
+ATOMIC_MEDIA_TYPE = f'application/vnd.api+json; ext="{ATOMIC_EXTENSION}"'
+
+AtomicOp = Literal["add", "update", "remove"]
+
+
+class DANJALocalIdentifier(BaseModel):
+    """
+    JSON:API Resource Identifier that may refer to a resource created earlier in the same
+    request by its local ID. One of `id` or `lid` is required.
+    """
+
+    type: str
+    id: Optional[str] = None
+    lid: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _id_or_lid(self) -> Self:
+        if self.id is None and self.lid is None:
+            raise ValueError("A resource identifier needs an id or a lid")
+        return self
+
+
+class DANJALocalRelationship(BaseModel):
+    """JSON:API Relationship whose linkage may use local IDs"""
+
+    links: Optional[dict[str, Union[str, DANJALink, None]]] = None
+    data: Optional[Union[DANJALocalIdentifier, list[DANJALocalIdentifier]]] = None
+    meta: Optional[dict[str, Any]] = None
+
+
+class DANJAAtomicResource(DANJASingleResource[ResourceType], Generic[ResourceType]):
+    """A resource in an operation, its relationships may refer to resources by local ID"""
+
+    relationships: Optional[dict[str, DANJALocalRelationship]] = None  # ty: ignore
+
+
+class DANJAAtomicRef(DANJALocalIdentifier):
+    """The target of an operation, a resource or one of its relationships"""
+
+    relationship: Optional[str] = None
+
+
+class DANJAAtomicOperation(BaseModel):
+    """
+    One operation. `data` is a DANJAAtomicResource, or for relationship operations the
+    DANJALocalIdentifier linkage, once validated by `DANJAAtomicOperations`.
+    """
+
+    op: AtomicOp
+    ref: Optional[DANJAAtomicRef] = None
+    href: Optional[str] = None
+    data: Any = None
+    meta: Optional[dict[str, Any]] = None
+
+    @property
+    def resource_type(self) -> Optional[str]:
+        """The type of the resource operated on"""
+        if self.ref is not None:
+            return self.ref.type
+        if isinstance(self.data, DANJASingleResource):
+            return self.data.type
+        if isinstance(self.data, dict):
+            return self.data.get("type")
+        return None
+
+    @property
+    def relationship(self) -> Optional[str]:
+        return self.ref.relationship if self.ref is not None else None
+
+
+class _AtomicDocument(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    @model_serializer(mode="wrap")
+    def _serialize_members(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        """The extension members are always written by their `atomic:` names"""
+        data = handler(self)
+        return {
+            (field.alias if field.alias else name): data[name]
+            for name, field in type(self).model_fields.items()
+            if name in data
+        }
+
+
+class DANJAAtomicResult(BaseModel):
+    """The result of one operation"""
+
+    data: Optional[DANJASingleResource] = None
+    meta: Optional[dict[str, Any]] = None
+
+
+class DANJAAtomicResults(_AtomicDocument):
+    """JSON:API Atomic Operations results document"""
+
+    results: list[DANJAAtomicResult] = Field(alias="atomic:results")
+    meta: Optional[dict[str, Any]] = None
+
+
+@lru_cache(maxsize=256)
+def _resources_adapter(attributes: Any) -> TypeAdapter:
+    return TypeAdapter(list[DANJAAtomicResource[attributes]])  # ty: ignore
+
+
+_linkage_adapter: TypeAdapter = TypeAdapter(list[Optional[Union[DANJALocalIdentifier, list[DANJALocalIdentifier]]]])
+
+
+def _relocated(error: ValidationError, title: str, locations: list[tuple[Any, ...]]) -> ValidationError:
+    """
+    Re-raise the errors of a batch validated as a list at the locations of its items
+    """
+    details = [
+        {
+            "type": detail["type"],
+            "loc": (*locations[detail["loc"][0]], *detail["loc"][1:]),
+            "input": detail["input"],
+            "ctx": detail.get("ctx", {}),
+        }
+        for detail in error.errors()
+    ]
+    try:
+        return ValidationError.from_exception_data(title, details)  # ty: ignore
+    except (KeyError, TypeError, ValueError):
+        # Custom error types are not known to pydantic-core, keep their messages
+        for detail, original in zip(details, error.errors()):
+            detail["type"] = PydanticCustomError(original["type"], original["msg"])
+            detail.pop("ctx")
+        return ValidationError.from_exception_data(title, details)  # ty: ignore
+
+
+class DANJAAtomicOperations(_AtomicDocument):
+    """
+    JSON:API Atomic Operations request document. Validating it checks the operations, then
+    validates their `data` in one pass per resource type, into the models registered in a
+    ResourceTypeRegistry given as the `resource_types` validation context, or with plain
+    attributes otherwise.
+
+        operations = DANJAAtomicOperations.model_validate(payload, context={"resource_types": registry})
+    """
+
+    operations: list[DANJAAtomicOperation] = Field(alias="atomic:operations")
+    meta: Optional[dict[str, Any]] = None
+
+    @model_validator(mode="after")
+    def _validate_data(self, info: ValidationInfo) -> Self:
+        resource_types = info.context.get("resource_types") if isinstance(info.context, dict) else None
+        self.validate_data(resource_types)
+        return self
+
+    @classmethod
+    def from_json_bytes(
+        cls, json_data: Union[str, bytes, bytearray], resource_types: Optional["ResourceTypeRegistry"] = None
+    ) -> Self:
+        return cls.model_validate_json(json_data, context={"resource_types": resource_types})
+
+    def validate_data(self, resource_types: Optional["ResourceTypeRegistry"] = None) -> None:
+        """
+        Validate the `data` of every operation, grouped by resource type, in place
+        """
+        resources: dict[Any, list[int]] = {}
+        linkage: list[int] = []
+        for index, operation in enumerate(self.operations):
+            if operation.data is None or isinstance(operation.data, BaseModel):
+                continue
+            if operation.relationship is not None:
+                linkage.append(index)
+                continue
+            resource_type = operation.resource_type
+            attributes = resource_types.get(resource_type) if resource_types is not None and resource_type else None
+            if attributes is None and resource_types is not None and not resource_types.allow_unknown:
+                raise ValueError(f"Unknown resource type {resource_type} in operation {index}")
+            resources.setdefault(attributes or Any, []).append(index)
+
+        batches = [(_resources_adapter(attributes), indexes) for attributes, indexes in resources.items()]
+        if linkage:
+            batches.append((_linkage_adapter, linkage))
+        for adapter, indexes in batches:
+            try:
+                validated = adapter.validate_python([self.operations[index].data for index in indexes])
+            except ValidationError as error:
+                locations = [("atomic:operations", index, "data") for index in indexes]
+                raise _relocated(error, type(self).__name__, locations) from None
+            for index, data in zip(indexes, validated):
+                self.operations[index].data = data
+
+
+AtomicHandler = Callable[[list[DANJAAtomicOperation]], Union[Iterable[Any], Awaitable[Iterable[Any]]]]
+
+
+class AtomicDispatcher:
+    """
+    Executes Atomic Operations by handing each run of consecutive operations with the same
+    resource type and `op` to one batch handler, registered per (type, op). Handlers take a
+    list of operations and return one result per operation, a BaseModel, a
+    DANJASingleResource or None, and may be async.
+
+    Local IDs are resolved as the operations run: once an `add` returns its resource, `lid`
+    references to it in later refs, resources and linkage get its `id` filled in.
+
+        dispatcher = AtomicDispatcher()
+        dispatcher.register("articles", "add", create_articles)
+        results = await dispatcher.dispatch(operations)
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[tuple[str, str], AtomicHandler] = {}
+
+    def register(self, resource_type: str, op: AtomicOp, handler: AtomicHandler) -> None:
+        self._handlers[(resource_type, op)] = handler
+
+    def _resolve(self, identifier: Any, lids: dict[tuple[str, str], str]) -> None:
+        if identifier is not None and identifier.id is None and identifier.lid is not None:
+            resolved = lids.get((identifier.type, identifier.lid))
+            if resolved is None:
+                raise ValueError(f"Unknown lid {identifier.lid} for {identifier.type}")
+            identifier.id = resolved
+
+    def _references(self, operation: DANJAAtomicOperation) -> Iterable[DANJALocalIdentifier]:
+        """The identifiers of an operation that may refer to other resources by local ID"""
+        if operation.ref is not None:
+            yield operation.ref
+        data = operation.data
+        if isinstance(data, DANJAAtomicResource):
+            if operation.op != "add":
+                yield data  # ty: ignore
+            linkage = [relationship.data for relationship in (data.relationships or {}).values()]
+        else:
+            linkage = [data]
+        for identifiers in linkage:
+            for identifier in identifiers if isinstance(identifiers, list) else [identifiers]:
+                if isinstance(identifier, DANJALocalIdentifier):
+                    yield identifier
+
+    def _runs(self, operations: list[DANJAAtomicOperation]) -> Iterable[tuple[str, str, list[DANJAAtomicOperation]]]:
+        """
+        Runs of consecutive operations with the same type and op. A run also ends before an
+        operation referring to a local ID added earlier in it, which only gets its `id` once
+        the handler of the run has created the resource.
+        """
+        run: list[DANJAAtomicOperation] = []
+        added: set[tuple[str, str]] = set()
+        key = None
+        for operation in operations:
+            operation_key = (operation.resource_type, operation.op)
+            refers_to_run = any(
+                identifier.id is None and (identifier.type, identifier.lid) in added
+                for identifier in self._references(operation)
+            )
+            if run and (operation_key != key or refers_to_run):
+                yield (*key, run)  # ty: ignore
+                run = []
+                added = set()
+            key = operation_key
+            run.append(operation)
+            data = operation.data
+            if operation.op == "add" and isinstance(data, DANJASingleResource) and data.lid:
+                added.add((data.type, data.lid))
+        if run:
+            yield (*key, run)  # ty: ignore
+
+    async def dispatch(self, operations: DANJAAtomicOperations) -> DANJAAtomicResults:
+        """
+        Run every operation in order, returning their results
+        """
+        results: list[DANJAAtomicResult] = []
+        lids: dict[tuple[str, str], str] = {}
+        for resource_type, op, run in self._runs(operations.operations):
+            handler = self._handlers.get((resource_type, op))
+            if handler is None:
+                raise ValueError(f"No handler for {op} operations on {resource_type}")
+            for operation in run:
+                for identifier in self._references(operation):
+                    self._resolve(identifier, lids)
+
+            outcome = handler(run)
+            if isawaitable(outcome):
+                outcome = await outcome
+            outcome = list(outcome)  # ty: ignore
+            if len(outcome) != len(run):
+                raise ValueError(
+                    f"The {op} handler for {resource_type} returned {len(outcome)} results for {len(run)}"
+                )
+
+            for operation, result in zip(run, outcome):
+                if isinstance(result, BaseModel) and not isinstance(result, DANJASingleResource):
+                    result = DANJAResource.from_basemodel(result, trusted=True).data
+                if op == "add" and isinstance(operation.data, DANJASingleResource) and result is not None:
+                    if operation.data.lid and result.id:
+                        lids[(operation.data.type, operation.data.lid)] = result.id
+                results.append(DANJAAtomicResult(data=result))
+        return DANJAAtomicResults(results=results)
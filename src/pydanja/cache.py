@@ -0,0 +1,204 @@
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Union
+
+from pydantic_core import to_json
+
+from .instrumentation import resource_count, stage_finished, stage_started
+from .models import DANJAResource, DANJAResourceList, DANJASingleResource
+from .streaming import _links_adapter, _meta_adapter, splice_document
+
+
+CacheKey = tuple[str, str, Hashable, bool, bool]
+
+
+class CacheStats(NamedTuple):
+    """Counters of a ResourceCache"""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an `If-None-Match` header value matches an ETag, using the weak comparison
+    required for GET and HEAD requests
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == tag for candidate in if_none_match.split(","))
+
+
+class ResourceCache:
+    """
+    A bounded LRU cache of serialized resource objects, keyed by (type, id, version).
+    Documents are written by splicing the cached JSON fragments of their resources, so
+    hot resources are serialized once per version. `version` reads the version of a
+    resource, e.g. an `updated_at` attribute. One of `version` or `ttl` (seconds) is
+    required, so a changed resource is never served stale for longer than the `ttl`.
+    Resources without an ID are never cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        version: Optional[Callable[[DANJASingleResource], Hashable]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if version is None and ttl is None:
+            raise ValueError("A ResourceCache needs a version reader or a ttl")
+        self.maxsize = max(maxsize, 1)
+        self.ttl = ttl
+        self.version = version
+        self.clock = clock
+        self._entries: "OrderedDict[CacheKey, tuple[bytes, float]]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, self.expirations, len(self._entries))
+
+    def _key(self, resource: DANJASingleResource, exclude_none: bool, by_alias: bool) -> Optional[CacheKey]:
+        if not resource.id:
+            return None
+        version = self.version(resource) if self.version else None
+        return (resource.type, resource.id, version, exclude_none, by_alias)
+
+    def fragment(
+        self,
+        resource: Union[DANJASingleResource, dict[str, Any]],
+        exclude_none: bool = False,
+        by_alias: bool = False,
+    ) -> bytes:
+        """
+        The JSON of one resource object, from the cache when its version is unchanged
+        """
+        if isinstance(resource, dict):
+            return to_json(resource, exclude_none=exclude_none, by_alias=by_alias)
+
+        key = self._key(resource, exclude_none, by_alias)
+        if key is None:
+            return resource.__pydantic_serializer__.to_json(resource, exclude_none=exclude_none, by_alias=by_alias)
+
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self.ttl is None or now - entry[1] < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+
+        encoded = resource.__pydantic_serializer__.to_json(resource, exclude_none=exclude_none, by_alias=by_alias)
+        with self._lock:
+            self._entries[key] = (encoded, now)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return encoded
+
+    def invalidate(self, resource_type: Optional[str] = None, resource_id: Optional[Any] = None) -> int:
+        """
+        Drop every version of a resource, every resource of a type, or everything, returning
+        the number of entries dropped
+        """
+        with self._lock:
+            if resource_type is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            keys = [
+                key
+                for key in self._entries
+                if key[0] == resource_type and (resource_id is None or key[1] == str(resource_id))
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def dump_json(
+        self,
+        document: Union[DANJAResource, DANJAResourceList],
+        exclude_none: bool = False,
+        by_alias: bool = False,
+    ) -> bytes:
+        """
+        Serialize a document like `model_dump_json`, splicing in the cached resource fragments
+        """
+        started = stage_started()
+        if isinstance(document.data, list):
+            fragments = [self.fragment(resource, exclude_none, by_alias) for resource in document.data]
+            data = b"[" + b",".join(fragments) + b"]"
+        else:
+            data = self.fragment(document.data, exclude_none, by_alias)
+
+        included = None
+        if document.included is not None:
+            fragments = [self.fragment(resource, exclude_none, by_alias) for resource in document.included]
+            included = b"[" + b",".join(fragments) + b"]"
+        body = splice_document(data, included, document.links, document.meta, exclude_none)
+        stage_finished("serialize", started, resource_count(document.data))
+        return body
+
+    def etag(
+        self,
+        document: Union[DANJAResource, DANJAResourceList],
+        exclude_none: bool = False,
+        by_alias: bool = False,
+    ) -> str:
+        """
+        A strong ETag for the document. With a `version` reader it is computed from the
+        resource keys and versions plus `links` and `meta`, without serializing any resource.
+        Otherwise it is a digest of the (cached, so at most `ttl` old) serialized document.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        if self.version is None:
+            digest.update(self.dump_json(document, exclude_none, by_alias))
+            return f'"{digest.hexdigest()}"'
+
+        data = document.data if isinstance(document.data, list) else [document.data]
+        for section in (data, document.included or []):
+            for resource in section:
+                if isinstance(resource, dict) or not resource.id:
+                    # Resources that can not be versioned count by content
+                    digest.update(self.fragment(resource, exclude_none, by_alias))
+                else:
+                    digest.update(to_json([resource.type, resource.id, str(self.version(resource))]))
+            digest.update(b"|")
+        digest.update(_links_adapter.dump_json(document.links, exclude_none=exclude_none))
+        digest.update(_meta_adapter.dump_json(document.meta, exclude_none=exclude_none))
+        digest.update(b"|%d%d" % (exclude_none, by_alias))
+        return f'"{digest.hexdigest()}"'
+
+    def conditional(
+        self,
+        document: Union[DANJAResource, DANJAResourceList],
+        if_none_match: Optional[str] = None,
+        exclude_none: bool = False,
+        by_alias: bool = False,
+    ) -> tuple[Optional[bytes], str]:
+        """
+        Return the serialized document and its ETag, or None and the ETag when `if_none_match`
+        already matches it, in which case a 304 Not Modified can be sent instead
+        """
+        etag = self.etag(document, exclude_none, by_alias)
+        if etag_matches(if_none_match, etag):
+            return None, etag
+        return self.dump_json(document, exclude_none, by_alias), etag
@@ -0,0 +1,88 @@
+from itertools import repeat
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+from pydantic import BaseModel
+
+from .resolver import ResourceResolver
+
+Columns = Mapping[str, Any]
+
+
+def column_values(column: Any) -> list[Any]:
+    """
+    Convert a whole column to Python values at once. NumPy arrays are converted by a
+    single `tolist` call, which also turns masked entries of masked arrays into None.
+    """
+    tolist = getattr(column, "tolist", None)
+    return tolist() if callable(tolist) else list(column)
+
+
+def records_columns(records: Any, names: Optional[Iterable[str]] = None) -> dict[str, Any]:
+    """
+    Split records into columns, either a NumPy structured array or a sequence of tuples
+    with their column `names`
+    """
+    dtype_names = getattr(getattr(records, "dtype", None), "names", None)
+    if dtype_names:
+        return {name: records[name] for name in dtype_names}
+    if names is None:
+        raise ValueError("Column names are required for records without named fields")
+    names = list(names)
+    rows = list(records)
+    if not rows:
+        return {name: [] for name in names}
+    return dict(zip(names, zip(*rows)))
+
+
+def _column_layout(
+    columns: Columns, model: Optional[type[BaseModel]], resource_name: Optional[str], resource_id: Optional[str]
+) -> tuple[str, str, list[tuple[str, str, str]]]:
+    """
+    Resolve the resource name, the ID column and the (column, field name, alias) of every
+    attribute column. With a model, only columns matching its fields or their aliases are used.
+    """
+    if model is None:
+        if not resource_name or not resource_id:
+            raise Exception("A resource name and ID column are required without a model")
+        attributes = [(column, column, column) for column in columns]
+    else:
+        metadata = ResourceResolver.resolve(model, resource_name, resource_id)
+        resource_name, resource_id = metadata.resource_name, metadata.resource_id
+        attributes = []
+        for field_name, field in model.model_fields.items():
+            alias = field.alias if isinstance(field.alias, str) else field_name
+            if field_name in columns:
+                attributes.append((field_name, field_name, alias))
+            elif alias in columns:
+                attributes.append((alias, field_name, alias))
+            if resource_id == field_name and resource_id not in columns:
+                resource_id = alias
+
+    if resource_id not in columns:
+        raise Exception(f"Resource ID column not found in {resource_name}: {resource_id}")
+    return resource_name, resource_id, attributes  # ty: ignore
+
+
+def resource_rows(
+    columns: Columns,
+    model: Optional[type[BaseModel]] = None,
+    resource_name: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    by_alias: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield the values of a single resource per row of `columns`. Each column is converted
+    and the IDs stringified once per column, attributes are plain dicts keyed by field
+    name, or by alias for validating into the model.
+    """
+    resource_name, id_column, layout = _column_layout(columns, model, resource_name, resource_id)
+
+    names = [alias if by_alias else field_name for _, field_name, alias in layout]
+    values = [column_values(columns[column]) for column, _, _ in layout]
+    ids = [str(id_value) if id_value else None for id_value in column_values(columns[id_column])]
+    if any(len(column) != len(ids) for column in values):
+        raise ValueError("Columns must all have the same length")
+
+    rows = zip(*values) if values else repeat((), len(ids))
+    for id_value, row in zip(ids, rows):
+        yield {"id": id_value, "type": resource_name, "lid": None, "attributes": dict(zip(names, row))}
@@ -0,0 +1,109 @@
+from typing import Any, Iterable, Optional, Union
+
+from pydantic import BaseModel
+
+from .models import DANJAResource, DANJAResourceList, DANJASingleResource, _linked_values, _RelationshipLinker
+from .resolver import ResourceResolver
+
+ResourceKey = tuple[str, Optional[str], Optional[str]]
+
+_validate_resource = DANJASingleResource.__pydantic_validator__.validate_python
+
+
+def _resource_key(resource_type: str, resource_id: Any, resource_lid: Any = None) -> Optional[ResourceKey]:
+    """
+    Identify a resource by type and id, or by type and local id. Resources
+    with neither can not be identified.
+    """
+    if resource_id:
+        return (resource_type, str(resource_id), None)
+    if resource_lid:
+        return (resource_type, None, str(resource_lid))
+    return None
+
+
+class CompoundDocument:
+    """
+    Builds the `included` resources of a compound document incrementally. Resources
+    are indexed on (type, id), so duplicates and resources already in the primary
+    `data` are skipped in constant time, across any number of `add_included` calls.
+    `included` keeps the order resources were first added in.
+    """
+
+    def __init__(self, document: Union[DANJAResource, DANJAResourceList]) -> None:
+        self.document = document
+        primary = document.data if isinstance(document.data, list) else [document.data]
+        self._primary: dict[ResourceKey, DANJASingleResource] = {}
+        for resource in primary:
+            key = _resource_key(resource.type, resource.id, resource.lid)
+            if key:
+                self._primary[key] = resource
+        self._included: dict[ResourceKey, DANJASingleResource] = {}
+        self._unidentified: list[DANJASingleResource] = []
+        if document.included:
+            self.add_included(document.included)
+
+    def __contains__(self, key: ResourceKey) -> bool:
+        return key in self._primary or key in self._included
+
+    def get(self, key: ResourceKey) -> Optional[DANJASingleResource]:
+        """
+        The primary or included resource with this key, if any
+        """
+        resource = self._included.get(key)
+        return resource if resource is not None else self._primary.get(key)
+
+    def __len__(self) -> int:
+        return len(self._included) + len(self._unidentified)
+
+    def add_included(
+        self, includes: Iterable[Any], resource_name: Optional[str] = None, resource_id: Optional[str] = None
+    ) -> int:
+        """
+        Add resources to `included`, returning how many were new. Each resource may be a
+        DANJASingleResource, a resource dict as taken by `include_from_basemodels`, or a
+        BaseModel which is wrapped like `from_basemodel`, using `resource_name` and
+        `resource_id` when given, with its declared relationships.
+        """
+        added = 0
+        linkers: dict[type, Optional[_RelationshipLinker]] = {}
+        for include in includes:
+            values: Optional[dict[str, Any]] = None
+            if isinstance(include, DANJASingleResource):
+                key = _resource_key(include.type, include.id, include.lid)
+            elif isinstance(include, dict):
+                key = _resource_key(include["type"], include.get("id"), include.get("lid"))
+            elif isinstance(include, BaseModel):
+                metadata = ResourceResolver.resolve(include.__class__, resource_name, resource_id)
+                if include.__class__ not in linkers:
+                    linkers[include.__class__] = _RelationshipLinker.for_class(include.__class__)
+                values = _linked_values(metadata, include, linkers[include.__class__])
+                key = _resource_key(values["type"], values.get("id"))
+            else:
+                raise TypeError(f"Can not include {type(include).__name__}")
+
+            if key is not None and (key in self._included or key in self._primary):
+                continue
+
+            if values is not None:
+                include = _validate_resource(values)
+            elif isinstance(include, dict):
+                include = DANJASingleResource(**include)
+
+            if key is None:
+                self._unidentified.append(include)
+            else:
+                self._included[key] = include
+            added += 1
+        return added
+
+    @property
+    def included(self) -> list[DANJASingleResource]:
+        return [*self._included.values(), *self._unidentified]
+
+    def build(self) -> Union[DANJAResource, DANJAResourceList]:
+        """
+        Set the document's `included` resources, or None when there are none, and return it
+        """
+        self.document.included = self.included or None
+        return self.document
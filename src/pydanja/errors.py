@@ -0,0 +1,202 @@
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Union, get_args
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_json
+
+from .models import DANJAErrorList, DANJAResource, DANJAResourceList
+
+# Union member labels pydantic puts in `loc` for built in types
+_TYPE_LABELS = frozenset({"str", "int", "float", "bool", "bytes", "none", "dict", "list", "tuple", "set"})
+_MAX_TEMPLATES = 4096
+_MISSING = object()
+
+Loc = tuple[Union[str, int], ...]
+
+_validate_error_list = DANJAErrorList.__pydantic_validator__.validate_python
+
+
+@lru_cache(maxsize=4096)
+def _escape(segment: Union[str, int]) -> str:
+    """A JSON pointer reference token (RFC 6901)"""
+    return str(segment).replace("~", "~0").replace("/", "~1")
+
+
+def _model_names(annotation: Any, names: set[str]) -> None:
+    """Collect the names of the models reachable from an annotation"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if annotation.__name__ in names:
+            return
+        names.add(annotation.__name__)
+        for field in annotation.model_fields.values():
+            _model_names(field.annotation, names)
+        return
+    for argument in get_args(annotation):
+        _model_names(argument, names)
+
+
+class _PointerBuilder:
+    """
+    Maps validation error locations to JSON pointers, dropping the union member labels
+    pydantic adds to `loc`. The kept positions are cached per location shape, with list
+    indexes wildcarded, so the thousands of errors of a bulk document share a few templates.
+    """
+
+    def __init__(self, labels: frozenset[str]) -> None:
+        self.labels = labels
+        self.templates: dict[Loc, tuple[int, ...]] = {}
+
+    def _is_label(self, segment: Union[str, int]) -> bool:
+        return isinstance(segment, str) and (segment in self.labels or segment in _TYPE_LABELS or "[" in segment)
+
+    def pointer(self, loc: Loc) -> str:
+        shape = tuple(None if isinstance(segment, int) else segment for segment in loc)
+        kept = self.templates.get(shape)  # ty: ignore
+        if kept is None:
+            kept = tuple(position for position, segment in enumerate(loc) if not self._is_label(segment))
+            if len(self.templates) >= _MAX_TEMPLATES:
+                self.templates.clear()
+            self.templates[shape] = kept  # ty: ignore
+        return "".join("/" + _escape(loc[position]) for position in kept)
+
+
+def _reachable_names(*models: type) -> frozenset[str]:
+    names: set[str] = set()
+    for model in models:
+        _model_names(model, names)
+    return frozenset(names)
+
+
+_builders: "WeakKeyDictionary[type, _PointerBuilder]" = WeakKeyDictionary()
+# Without a model the union labels of the DANJA containers themselves are still known
+_default_builder = _PointerBuilder(_reachable_names(DANJAResource, DANJAResourceList))
+
+
+def pointer_builder(model: Optional[type] = None) -> _PointerBuilder:
+    """
+    The pointer builder of a model, knowing the names of every model reachable from it,
+    built once per model. Warm it up front with `pointer_builder(DANJAResourceList[Article])`.
+    """
+    if model is None:
+        return _default_builder
+    builder = _builders.get(model)
+    if builder is None:
+        builder = _PointerBuilder(_reachable_names(model) | _default_builder.labels)
+        _builders[model] = builder
+    return builder
+
+
+def document_pointer(loc: Loc, document: Any, missing: bool = False) -> str:
+    """
+    The JSON pointer of a location, following the input document so only the segments
+    present in it are kept. With `missing` the last segment names a missing member.
+    """
+    parts = []
+    current = document
+    for position, segment in enumerate(loc):
+        if isinstance(current, dict) and segment in current:
+            current = current[segment]
+        elif isinstance(current, list) and isinstance(segment, int) and -len(current) <= segment < len(current):
+            current = current[segment]
+        elif missing and position == len(loc) - 1 and isinstance(current, dict):
+            current = _MISSING
+        else:
+            continue
+        parts.append("/" + _escape(segment))
+    return "".join(parts)
+
+
+def _error_objects(
+    error: Union[ValidationError, Iterable[dict[str, Any]]],
+    model: Optional[type],
+    document: Any,
+    max_errors: Optional[int],
+    aggregate: bool,
+    status: str,
+) -> list[dict[str, Any]]:
+    """The JSON:API error objects of a validation error, as dicts without empty members"""
+    details = error.errors(include_url=False, include_input=False) if isinstance(error, ValidationError) else error
+    builder = pointer_builder(model)
+    errors: list[dict[str, Any]] = []
+    merged: dict[tuple[str, str], dict[str, Any]] = {}
+    total = 0
+    for detail in details:
+        total += 1
+        loc = tuple(detail["loc"])
+        if aggregate:
+            key = (detail["type"], builder.pointer(tuple(-1 if isinstance(part, int) else part for part in loc)))
+            previous = merged.get(key)
+            if previous is not None:
+                previous["meta"]["count"] += 1
+                continue
+        if max_errors is not None and len(errors) >= max_errors:
+            continue
+
+        error_object: dict[str, Any] = {
+            "status": status,
+            "code": detail["type"],
+            "title": "Invalid value",
+            "detail": detail["msg"],
+        }
+        if loc:
+            if document is None:
+                pointer = builder.pointer(loc)
+            else:
+                pointer = document_pointer(loc, document, detail["type"] == "missing")
+            error_object["source"] = {"pointer": pointer}
+        if aggregate:
+            error_object["meta"] = {"count": 1}
+            merged[key] = error_object  # ty: ignore
+        errors.append(error_object)
+
+    reported = sum(error_object["meta"]["count"] for error_object in errors) if aggregate else len(errors)
+    if reported < total:
+        errors.append(
+            {
+                "status": status,
+                "code": "too_many_errors",
+                "title": "Too many errors",
+                "detail": f"{total - reported} more validation errors were not reported",
+                "meta": {"total": total},
+            }
+        )
+    return errors
+
+
+def danja_errors(
+    error: Union[ValidationError, Iterable[dict[str, Any]]],
+    model: Optional[type] = None,
+    document: Any = None,
+    max_errors: Optional[int] = 100,
+    aggregate: bool = False,
+    status: str = "422",
+) -> DANJAErrorList:
+    """
+    Convert a pydantic ValidationError, or its `errors()`, to a JSON:API error list in one
+    pass. Each error gets the pydantic error type as `code`, its message as `detail` and a
+    `source.pointer` into the document, e.g. `/data/1234/attributes/name`.
+
+    Pointers come from `loc`, without the union member labels pydantic adds to it. Pass the
+    validated `model` to recognize its model names, or the input `document` to follow it
+    exactly. With `aggregate` errors of the same type at the same place in every list item
+    are merged, with their number in `meta`. Past `max_errors` a last error summarizes the
+    rest.
+    """
+    errors = _error_objects(error, model, document, max_errors, aggregate, status)
+    return _validate_error_list({"errors": errors})
+
+
+def danja_errors_json(
+    error: Union[ValidationError, Iterable[dict[str, Any]]],
+    model: Optional[type] = None,
+    document: Any = None,
+    max_errors: Optional[int] = 100,
+    aggregate: bool = False,
+    status: str = "422",
+) -> bytes:
+    """
+    `danja_errors` serialized straight to JSON bytes, leaving out empty members, without
+    building the error models
+    """
+    return to_json({"errors": _error_objects(error, model, document, max_errors, aggregate, status)})
@@ -0,0 +1,79 @@
+import re
+from functools import lru_cache
+from typing import Any, Iterable, Mapping, Optional, Union
+
+Fieldsets = Mapping[str, Iterable[str]]
+
+_FIELDS_PARAMETER = re.compile(r"^fields\[([^\]]+)\]$")
+
+
+def parse_fieldsets(query_params: Union[Mapping[str, str], Iterable[tuple[str, str]]]) -> dict[str, frozenset[str]]:
+    """
+    Read JSON:API sparse fieldsets from query parameters, `fields[articles]=title,body`
+    becomes `{"articles": frozenset({"title", "body"})}`
+    """
+    items = query_params.items() if isinstance(query_params, Mapping) else query_params
+    fieldsets = {}
+    for key, value in items:
+        match = _FIELDS_PARAMETER.match(key)
+        if match:
+            fieldsets[match.group(1)] = frozenset(field for field in value.split(",") if field)
+    return fieldsets
+
+
+@lru_cache(maxsize=1024)
+def _resource_include(attributes_class: Optional[type], fields: frozenset[str]) -> dict[str, Any]:
+    """
+    The include spec for one resource of a type, cached per attributes class and fieldset.
+    Fieldset members may be attribute aliases, pydantic includes by field name.
+    """
+    attributes = set(fields)
+    for field_name, field in getattr(attributes_class, "model_fields", {}).items():
+        if field.alias in fields or field.serialization_alias in fields:
+            attributes.add(field_name)
+    return {
+        "id": True,
+        "type": True,
+        "lid": True,
+        "attributes": attributes,
+        "relationships": set(fields),
+        "links": True,
+        "meta": True,
+    }
+
+
+def _resources_include(resources: list[Any], fieldsets: Mapping[str, frozenset[str]]) -> Any:
+    specs: list[Any] = []
+    for resource in resources:
+        if isinstance(resource, dict):
+            resource_type, attributes = resource.get("type"), None
+        else:
+            resource_type, attributes = resource.type, resource.attributes
+        fields = fieldsets.get(resource_type) if isinstance(resource_type, str) else None
+        specs.append(True if fields is None else _resource_include(type(attributes), fields))
+
+    if not specs or all(spec is specs[0] for spec in specs):
+        return {"__all__": specs[0]} if specs and specs[0] is not True else True
+    return dict(enumerate(specs))
+
+
+def sparse_fieldsets(document: Any, fieldsets: Fieldsets) -> dict[str, Any]:
+    """
+    Build the pydantic `include` spec applying JSON:API sparse fieldsets to a DANJAResource
+    or DANJAResourceList, restricting the attributes and relationships of resources in
+    `data` and `included` whose type has a fieldset. Types without one are left whole.
+    """
+    normalized = {resource_type: frozenset(fields) for resource_type, fields in fieldsets.items()}
+
+    if isinstance(document.data, list):
+        data = _resources_include(document.data, normalized)
+    else:
+        data = _resources_include([document.data], normalized)
+        data = data["__all__"] if isinstance(data, dict) else data
+
+    return {
+        "data": data,
+        "links": True,
+        "meta": True,
+        "included": _resources_include(document.included or [], normalized),
+    }
@@ -0,0 +1,131 @@
+import asyncio
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Union
+
+from pydantic import BaseModel
+
+from .compound import CompoundDocument
+from .models import DANJAResource, DANJAResourceList, DANJASingleResource
+
+IncludeTree = dict[str, "IncludeTree"]
+
+# Loads the resources of one type for a list of IDs, returning BaseModels, resource
+# dicts or DANJASingleResources. Missing IDs are simply left out.
+BatchLoader = Callable[[list[str]], Union[Iterable[Any], Awaitable[Iterable[Any]]]]
+
+
+def parse_include(include: Union[str, Iterable[str]]) -> IncludeTree:
+    """
+    Parse JSON:API include paths into a tree, `author,comments.author` becomes
+    `{"author": {}, "comments": {"author": {}}}`
+    """
+    paths = include.split(",") if isinstance(include, str) else include
+    tree: IncludeTree = {}
+    for path in paths:
+        node = tree
+        for name in path.strip().split("."):
+            if name:
+                node = node.setdefault(name, {})
+    return tree
+
+
+def _merge(tree: IncludeTree, other: IncludeTree) -> None:
+    for name, child in other.items():
+        _merge(tree.setdefault(name, {}), child)
+
+
+class InMemoryLoader:
+    """
+    A batch loader serving resources from a mapping of ID to resource, recording
+    the IDs of every call. Intended for tests and benchmarks.
+    """
+
+    def __init__(self, resources: Mapping[Any, Any]) -> None:
+        self.resources = {str(resource_id): resource for resource_id, resource in resources.items()}
+        self.calls: list[list[str]] = []
+
+    async def __call__(self, ids: list[str]) -> list[Any]:
+        self.calls.append(ids)
+        return [self.resources[resource_id] for resource_id in ids if resource_id in self.resources]
+
+
+class IncludeResolver:
+    """
+    Resolves `include` paths for a document level by level. At each level the related
+    resources still missing across every resource of the level are collected and loaded
+    with a single call to the batch loader registered for their type, all types of a level
+    loading concurrently. Loaded resources are added to `included` without duplicates.
+    """
+
+    def __init__(self, trusted: bool = False) -> None:
+        self.trusted = trusted
+        self.loaders: dict[str, BatchLoader] = {}
+
+    def register(self, resource_type: str, loader: BatchLoader) -> None:
+        """
+        Register the batch loader, sync or async, for a resource type
+        """
+        self.loaders[resource_type] = loader
+
+    async def _load(self, resource_type: str, ids: list[str]) -> list[DANJASingleResource]:
+        loader = self.loaders.get(resource_type)
+        if loader is None:
+            raise ValueError(f"No loader registered for {resource_type}")
+        loaded = loader(ids)
+        if isawaitable(loaded):
+            loaded = await loaded
+
+        # Models are wrapped per class, so their own relationships are linked for the batch
+        resources: list[Any] = []
+        models: dict[type, list[BaseModel]] = {}
+        for resource in loaded:  # ty: ignore
+            if isinstance(resource, BaseModel) and not isinstance(resource, DANJASingleResource):
+                models.setdefault(resource.__class__, []).append(resource)
+            else:
+                resources.append(resource)
+        for batch in models.values():
+            resources.extend(DANJAResourceList.from_basemodel_list(batch, resource_type, trusted=self.trusted).data)
+        return resources
+
+    async def include(
+        self, document: Union[DANJAResource, DANJAResourceList], include: Union[str, Iterable[str], IncludeTree]
+    ) -> Union[DANJAResource, DANJAResourceList]:
+        """
+        Add the resources on the `include` paths to the document's `included` and return it
+        """
+        tree = include if isinstance(include, dict) else parse_include(include)
+        compound = CompoundDocument(document)
+        primary = document.data if isinstance(document.data, list) else [document.data]
+        level: list[tuple[DANJASingleResource, IncludeTree]] = [(resource, tree) for resource in primary]
+
+        while level:
+            # The subtree still to follow from every target of this level, by type and ID
+            targets: dict[str, dict[str, IncludeTree]] = {}
+            for resource, subtree in level:
+                relationships = resource.relationships or {}
+                for name, child in subtree.items():
+                    relationship = relationships.get(name)
+                    if relationship is None or relationship.data is None:
+                        continue
+                    data = relationship.data
+                    for identifier in data if isinstance(data, list) else [data]:
+                        _merge(targets.setdefault(identifier.type, {}).setdefault(identifier.id, {}), child)
+
+            loads = []
+            for resource_type, ids in targets.items():
+                missing = [
+                    resource_id for resource_id in ids if compound.get((resource_type, resource_id, None)) is None
+                ]
+                if missing:
+                    loads.append(self._load(resource_type, missing))
+            for loaded in await asyncio.gather(*loads):
+                compound.add_included(loaded)
+
+            level = []
+            for resource_type, ids in targets.items():
+                for resource_id, child in ids.items():
+                    target = compound.get((resource_type, resource_id, None))
+                    if child and target is not None:
+                        level.append((target, child))
+
+        return compound.build()
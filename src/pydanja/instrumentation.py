@@ -0,0 +1,105 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+# Called with the stage name, its duration in seconds and the number of resources handled
+StageHook = Callable[[str, float, int], None]
+
+# Installed hooks. While the list is empty, stages are not timed at all and only cost
+# the emptiness checks in stage_started and stage_finished.
+_hooks: list[StageHook] = []
+
+
+class StageRecord(NamedTuple):
+    """One timed stage"""
+
+    stage: str
+    duration: float
+    count: int
+
+
+class StageCollector:
+    """
+    A hook collecting stage records in memory, for tests and local profiling
+
+        with instrument() as collector:
+            DANJAResourceList.from_basemodel_list(articles).model_dump_json()
+        collector.totals()  # {"resolve": ..., "wrap": ..., "validate": ...}
+    """
+
+    def __init__(self) -> None:
+        self.records: list[StageRecord] = []
+
+    def __call__(self, stage: str, duration: float, count: int) -> None:
+        self.records.append(StageRecord(stage, duration, count))
+
+    @property
+    def stages(self) -> list[str]:
+        return [record.stage for record in self.records]
+
+    def totals(self) -> dict[str, float]:
+        """Total duration per stage"""
+        totals: dict[str, float] = {}
+        for record in self.records:
+            totals[record.stage] = totals.get(record.stage, 0.0) + record.duration
+        return totals
+
+    def counts(self) -> dict[str, int]:
+        """Total resources handled per stage"""
+        counts: dict[str, int] = {}
+        for record in self.records:
+            counts[record.stage] = counts.get(record.stage, 0) + record.count
+        return counts
+
+    def clear(self) -> None:
+        self.records.clear()
+
+
+def add_hook(hook: StageHook) -> None:
+    """
+    Install a hook called after each instrumented stage, e.g. to forward durations to a
+    metrics client. Hooks are process wide and run synchronously in the timed call, so
+    keep them cheap.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: StageHook) -> None:
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+@contextmanager
+def instrument(hook: Optional[StageHook] = None) -> Iterator[Any]:
+    """
+    Install a hook, a new StageCollector by default, for the duration of the block
+    """
+    installed: StageHook = hook if hook is not None else StageCollector()
+    add_hook(installed)
+    try:
+        yield installed
+    finally:
+        remove_hook(installed)
+
+
+def stage_started() -> float:
+    """The start time of a stage, or 0.0 with no hooks installed"""
+    return perf_counter() if _hooks else 0.0
+
+
+def resource_count(data: Any) -> int:
+    """The number of resources in a `data` or `included` member"""
+    if data is None:
+        return 0
+    return len(data) if isinstance(data, list) else 1
+
+
+def stage_finished(stage: str, started: float, count: int = 1) -> None:
+    """
+    Report a stage begun at `started` to the installed hooks. Stages begun while no hook
+    was installed are not reported.
+    """
+    if started and _hooks:
+        duration = perf_counter() - started
+        for hook in tuple(_hooks):
+            hook(stage, duration, count)
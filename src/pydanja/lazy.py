@@ -0,0 +1,173 @@
+from typing import TYPE_CHECKING, Any, Generic, Iterator, Optional, Union
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+from typing_extensions import NotRequired, TypedDict
+
+from .models import DANJAResource, DANJAResourceList, DANJASingleResource, ResourceType
+
+if TYPE_CHECKING:
+    from .registry import ResourceTypeRegistry
+
+
+class _RawResource(TypedDict):
+    id: NotRequired[Optional[str]]
+    type: str
+    lid: NotRequired[Optional[str]]
+    attributes: NotRequired[Any]
+    relationships: NotRequired[Optional[dict[str, Any]]]
+    links: NotRequired[Optional[dict[str, Any]]]
+    meta: NotRequired[Optional[dict[str, Any]]]
+
+
+class _RawDocument(TypedDict):
+    data: Union[list[_RawResource], _RawResource, None]
+    links: NotRequired[Optional[dict[str, Any]]]
+    meta: NotRequired[Optional[dict[str, Any]]]
+    included: NotRequired[Optional[list[Any]]]
+    jsonapi: NotRequired[Optional[dict[str, Any]]]
+
+
+# Checks the envelope and resource members, leaving attributes and relationships as they are
+_validate_envelope = TypeAdapter(_RawDocument).validate_python
+
+
+class DANJADocumentView(Generic[ResourceType]):
+    """
+    Read only view of a JSON:API document that validates the envelope (`data`, and the
+    `id` and `type` of each resource) up front, but builds the attribute model of a
+    resource only when it is first read, caching it. Reading a few resources or only
+    their IDs from a large document skips validating the rest.
+
+        view = DANJADocumentView(await request.body(), Article)
+        ids = list(view.ids())
+        article = view.get("12")  # Article, validated on first access
+
+    Attribute validation errors are raised on access, located within the resource.
+    """
+
+    def __init__(
+        self,
+        document: Union[dict[str, Any], str, bytes, bytearray],
+        resource_type: Optional[type[ResourceType]] = None,
+        resource_types: Optional["ResourceTypeRegistry"] = None,
+    ) -> None:
+        if isinstance(document, (str, bytes, bytearray)):
+            document = from_json(document)
+        self._document = _validate_envelope(document)
+        data = self._document["data"]
+        self.many = isinstance(data, list)
+        self._raw: list[_RawResource] = data if isinstance(data, list) else ([] if data is None else [data])
+        self.resource_type = resource_type
+        self.resource_types = resource_types
+        resource_class = DANJASingleResource[resource_type] if resource_type else DANJASingleResource  # ty: ignore
+        self._validate_resource = resource_class.__pydantic_validator__.validate_python
+        self._validate_attributes = resource_type.__pydantic_validator__.validate_python if resource_type else None
+        self._attributes: dict[int, Any] = {}
+        self._resources: dict[int, DANJASingleResource] = {}
+        self._index: Optional[dict[str, int]] = None
+        self._included: Optional[list[Any]] = None
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @property
+    def links(self) -> Optional[dict[str, Any]]:
+        return self._document.get("links")
+
+    @property
+    def meta(self) -> Optional[dict[str, Any]]:
+        return self._document.get("meta")
+
+    @property
+    def jsonapi(self) -> Optional[dict[str, Any]]:
+        return self._document.get("jsonapi")
+
+    @property
+    def included(self) -> Optional[list[Any]]:
+        """`included` as given, or validated through the ResourceTypeRegistry on first access"""
+        included = self._document.get("included")
+        if included is None or self.resource_types is None:
+            return included
+        if self._included is None:
+            self._included = self.resource_types.validate_included(included)
+        return self._included
+
+    def ids(self) -> Iterator[Optional[str]]:
+        """The resource IDs, without building any resource"""
+        return (raw.get("id") for raw in self._raw)
+
+    def index_of(self, resource_id: Any) -> Optional[int]:
+        """The position of a resource by ID, indexing the IDs on first use"""
+        if self._index is None:
+            self._index = {}
+            for index, raw in enumerate(self._raw):
+                identifier = raw.get("id")
+                if identifier is not None:
+                    self._index.setdefault(identifier, index)
+        return self._index.get(str(resource_id))
+
+    def raw(self, index: int) -> _RawResource:
+        """The resource object at a position as it was given"""
+        return self._raw[index]
+
+    def attributes(self, index: int) -> Any:
+        """The attributes of the resource at a position, as the resource type's model"""
+        if index < 0:
+            index += len(self._raw)
+        if index in self._attributes:
+            return self._attributes[index]
+        attributes = self._raw[index].get("attributes")
+        if self._validate_attributes is not None:
+            attributes = self._validate_attributes(attributes)
+        self._attributes[index] = attributes
+        return attributes
+
+    def resource(self, index: int) -> DANJASingleResource:
+        """The whole resource object at a position, validated on first access"""
+        if index < 0:
+            index += len(self._raw)
+        resource = self._resources.get(index)
+        if resource is None:
+            values = dict(self._raw[index])
+            values["attributes"] = self.attributes(index)
+            resource = self._validate_resource(values)
+            self._resources[index] = resource
+        return resource
+
+    def __getitem__(self, index: int) -> Any:
+        return self.attributes(index)
+
+    def get(self, resource_id: Any) -> Optional[Any]:
+        """The attributes of a resource by ID, None when there is none"""
+        index = self.index_of(resource_id)
+        return None if index is None else self.attributes(index)
+
+    def get_resource(self, resource_id: Any) -> Optional[DANJASingleResource]:
+        index = self.index_of(resource_id)
+        return None if index is None else self.resource(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iter_attributes()
+
+    def iter_attributes(self, cache: bool = True) -> Iterator[Any]:
+        """
+        The attributes of each resource in turn. Without `cache` the ones not read before
+        are validated and dropped again, so a pass over a large document holds one at a time.
+        """
+        for index in range(len(self._raw)):
+            if cache or index in self._attributes:
+                yield self.attributes(index)
+            else:
+                attributes = self._raw[index].get("attributes")
+                yield attributes if self._validate_attributes is None else self._validate_attributes(attributes)
+
+    def materialize(self) -> Union[DANJAResource, DANJAResourceList]:
+        """The whole document as a DANJAResourceList, or a DANJAResource for a single resource"""
+        resources = [self.resource(index) for index in range(len(self._raw))]
+        container: Any = DANJAResourceList if self.many else DANJAResource
+        if self.resource_type is not None:
+            container = container[self.resource_type]
+        values = {key: value for key, value in self._document.items() if key in ("links", "meta")}
+        data: Any = resources if self.many else (resources[0] if resources else None)
+        return container.model_construct(data=data, included=self.included, **values)
@@ -0,0 +1,576 @@
+from copy import copy
+from typing import TYPE_CHECKING, Any, Generic, Iterable, Optional, TypeVar, Union, get_args
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel, ConfigDict, ValidationInfo, create_model, model_validator
+from pydantic.functional_validators import ModelWrapValidatorHandler
+from typing_extensions import Self
+
+from .adapters import object_rows
+from .columnar import Columns, records_columns, resource_rows
+from .fieldsets import Fieldsets, sparse_fieldsets
+from .instrumentation import resource_count, stage_finished, stage_started
+from .relationships import RelationshipField, relationship_fields
+from .resolver import ResourceMetadata, ResourceResolver
+
+if TYPE_CHECKING:
+    from .registry import ResourceTypeRegistry
+
+ResourceType = TypeVar("ResourceType")
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+def _validate_ignoring_included(
+    data: Any, handler: ModelWrapValidatorHandler[ModelType], info: Optional[ValidationInfo] = None
+) -> ModelType:
+    """
+    Validate a resource container while bypassing validation for `included`.
+
+    The incoming payload is never copied deeply or mutated, `included` is split
+    away from a shallow copy of the top level only. When a ResourceTypeRegistry is
+    passed as the `resource_types` validation context, `included` is validated
+    through it instead.
+    """
+    included = None
+
+    # dict payloads (e.g. DANJAResource(...))
+    if isinstance(data, dict):
+        if "included" in data:
+            included = data["included"]
+            data = {key: value for key, value in data.items() if key != "included"}
+    # model payloads (e.g. DANJAResource.model_validate(existing_model))
+    elif isinstance(data, BaseModel):
+        included = getattr(data, "included", None)
+        if included is not None:
+            data = data.model_copy(update={"included": None})
+    # any other object exposing `included`
+    elif hasattr(data, "included"):
+        included = getattr(data, "included")
+        data = copy(data)
+        delattr(data, "included")
+
+    started = stage_started()
+    validated = handler(data)
+    if started:
+        stage_finished("validate", started, resource_count(getattr(validated, "data", None)))
+
+    if included is not None:
+        resource_types = info.context.get("resource_types") if info and isinstance(info.context, dict) else None
+        if resource_types is not None:
+            started = stage_started()
+            included = resource_types.validate_included(included)
+            stage_finished("included", started, resource_count(included))
+        setattr(validated, "included", included)
+
+    return validated
+
+
+# Per container class JSON validation models keyed by `included` annotation,
+# see _validate_json_ignoring_included
+_json_models: "WeakKeyDictionary[type[BaseModel], dict[Any, type[BaseModel]]]" = WeakKeyDictionary()
+
+
+def _json_model(
+    container: type[BaseModel], resource_types: Optional["ResourceTypeRegistry"] = None
+) -> type[BaseModel]:
+    """
+    The copy of a container that raw JSON is validated against, built once per container
+    and `included` annotation
+    """
+    included_type = resource_types.included_type if resource_types is not None else Any
+    json_models = _json_models.setdefault(container, {})
+    json_model = json_models.get(included_type)
+    if json_model is None:
+        fields: dict[str, Any] = {
+            field_name: (field.annotation, field) for field_name, field in container.model_fields.items()
+        }
+        fields["included"] = (included_type, None)
+        json_model = create_model(f"{container.__name__}JSON", **fields)
+        json_models[included_type] = json_model
+    return json_model
+
+
+def _validates_as_is(container: type[BaseModel]) -> bool:
+    """
+    Whether a container subclass has its own config or validators, which the JSON
+    validation copy does not carry over, so it has to be validated itself
+    """
+    decorators = container.__pydantic_decorators__
+    model_validators = set(decorators.model_validators) - {"ignore_included"}
+    own_validators = decorators.validators or decorators.field_validators or decorators.root_validators
+    return bool(container.model_config or own_validators or model_validators)
+
+
+def _validate_json_ignoring_included(
+    container: type[ModelType],
+    json_data: Union[str, bytes, bytearray],
+    resource_types: Optional["ResourceTypeRegistry"] = None,
+) -> ModelType:
+    """
+    Validate raw JSON into a resource container while bypassing validation for `included`.
+
+    The wrap validator would make pydantic parse the whole document into a dict first,
+    so raw JSON is validated against a copy of the container without it, where
+    `included` accepts anything, or the registry's typed resources. The container is
+    then constructed from the result. Containers with their own config or validators
+    are validated with `model_validate_json` instead.
+    """
+    if _validates_as_is(container):
+        return container.model_validate_json(json_data, context={"resource_types": resource_types})
+
+    json_model = _json_model(container, resource_types)
+
+    started = stage_started()
+    validated = json_model.model_validate_json(json_data)
+    if started:
+        stage_finished("validate", started, resource_count(getattr(validated, "data", None)))
+
+    return container.model_construct(_fields_set=validated.model_fields_set, **dict(validated))
+
+
+class DANJALink(BaseModel):
+    """JSON:API Link"""
+
+    href: str
+    rel: Optional[str] = None
+    describedby: Optional[str] = None
+    title: Optional[str] = None
+    type: Optional[str] = None
+    hreflang: Optional[str] = None
+    meta: Optional[dict[str, Any]] = None
+
+
+class DANJASource(BaseModel):
+    """JSON:API Source"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    pointer: Optional[str] = None
+    parameter: Optional[str] = None
+    header: Optional[str] = None
+
+
+class DANJAResourceIdentifier(BaseModel):
+    """JSON:API Resource Identifier"""
+
+    type: str
+    id: str
+    lid: Optional[str] = None
+
+
+class DANJARelationship(BaseModel):
+    """JSON:API Relationship"""
+
+    links: Optional[dict[str, Union[str, DANJALink, None]]] = None
+    data: Optional[Union[DANJAResourceIdentifier, list[DANJAResourceIdentifier]]] = None
+    meta: Optional[dict[str, Any]] = None
+
+
+class DANJAError(BaseModel):
+    """JSON:API Error object"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    id: Optional[str] = None
+    links: Optional[dict[str, Union[str, DANJALink, None]]] = None
+    status: Optional[str] = None
+    code: Optional[str] = None
+    title: Optional[str] = None
+    detail: Optional[str] = None
+    source: Optional[DANJASource] = None
+    meta: Optional[dict[str, Any]] = None
+
+
+class DANJAErrorList(BaseModel):
+    """JSON:API Error list"""
+
+    errors: list[DANJAError]
+
+
+class DANJASingleResource(BaseModel, Generic[ResourceType]):
+    """A single resource. The only JSON:API required field is type"""
+
+    id: Optional[str] = None
+    type: str
+    lid: Optional[str] = None
+    attributes: ResourceType
+    relationships: Optional[dict[str, DANJARelationship]] = None
+    links: Optional[dict[str, Any]] = None
+    meta: Optional[dict[str, Any]] = None
+
+
+_validate_resource = DANJASingleResource.__pydantic_validator__.validate_python
+_validate_identifier = DANJAResourceIdentifier.__pydantic_validator__.validate_python
+_validate_relationship = DANJARelationship.__pydantic_validator__.validate_python
+
+
+class _RelationshipLinker:
+    """
+    Builds the relationships declared on a resource class for a batch of resources.
+    Identifiers and relationships to the same targets are built once, by the core
+    validators which keep the shared instances as they are, so treat them as read only.
+    """
+
+    def __init__(self, fields: tuple[RelationshipField, ...]) -> None:
+        self.fields = fields
+        self.identifiers: dict[tuple[str, str], DANJAResourceIdentifier] = {}
+        self.relationships: dict[tuple[str, Any], DANJARelationship] = {}
+
+    @classmethod
+    def for_class(cls, resource_class: type) -> Optional["_RelationshipLinker"]:
+        fields = relationship_fields(resource_class)
+        return cls(fields) if fields else None
+
+    def target(self, value: Any) -> Optional[str]:
+        """
+        The ID of a related resource, given as an ID or as the related BaseModel
+        """
+        if isinstance(value, BaseModel):
+            value = ResourceResolver.resolve_metadata(value.__class__).id_getter(value)  # ty: ignore
+        return None if value is None else str(value)
+
+    def identifier(self, resource_type: str, resource_id: str) -> DANJAResourceIdentifier:
+        key = (resource_type, resource_id)
+        identifier = self.identifiers.get(key)
+        if identifier is None:
+            identifier = _validate_identifier({"type": resource_type, "id": resource_id})
+            self.identifiers[key] = identifier
+        return identifier
+
+    def link(self, resource: Any) -> dict[str, DANJARelationship]:
+        linked = {}
+        for field in self.fields:
+            value = field.getter(resource)
+            if field.many or isinstance(value, (list, tuple, set, frozenset)):
+                key = (field.resource_type, tuple(self.target(item) for item in value or ()))
+            else:
+                key = (field.resource_type, self.target(value))
+
+            relationship = self.relationships.get(key)
+            if relationship is None:
+                resource_type, target = key
+                if isinstance(target, tuple):
+                    data: Any = [self.identifier(resource_type, item) for item in target if item is not None]
+                else:
+                    data = None if target is None else self.identifier(resource_type, target)
+                relationship = _validate_relationship({"data": data})
+                self.relationships[key] = relationship
+            linked[field.name] = relationship
+        return linked
+
+
+def _linked_values(
+    metadata: ResourceMetadata, resource: Any, linker: Optional[_RelationshipLinker]
+) -> dict[str, Any]:
+    """
+    The DANJASingleResource values wrapping a BaseModel like `from_basemodel_list`, its
+    declared relationships linked through the linker of the batch it belongs to
+    """
+    values = metadata.resource_values(resource)
+    if linker:
+        values["relationships"] = linker.link(resource)
+    return values
+
+
+class DANJAResource(BaseModel, ResourceResolver, Generic[ResourceType]):
+    """JSON:API base for a single resource"""
+
+    data: DANJASingleResource[ResourceType]
+    links: Optional[dict[str, Union[str, DANJALink, None]]] = None
+    meta: Optional[dict[str, Any]] = None
+    included: Optional[list[DANJASingleResource]] = None
+
+    @property
+    def resource(self) -> ResourceType:
+        return self.data.attributes
+
+    @classmethod
+    def from_basemodel(
+        cls,
+        resource: ResourceType,
+        resource_name: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        trusted: bool = False,
+    ) -> "DANJAResource":
+        """
+        Wrap a BaseModel in a JSON:API container. With `trusted` the model is not
+        revalidated and the container is constructed without validation, only use this
+        for models you built yourself.
+        """
+        try:
+            """
+            Any resource name or ID field not supplied is looked up in the model config
+            and fields, once per model class
+            """
+            started = stage_started()
+            metadata = cls.resolve(resource.__class__, resource_name, resource_id)
+            stage_finished("resolve", started)
+            resource_name, resource_id = metadata.resource_name, metadata.resource_id
+            if not metadata.id_getter:
+                raise Exception(f"No fields defined in {resource_name}")
+
+            started = stage_started()
+            values = {"type": resource_name, "lid": None, "attributes": resource}
+
+            id_value = metadata.id_getter(resource)
+            if id_value:
+                values["id"] = str(id_value)
+
+            linker = _RelationshipLinker.for_class(resource.__class__)
+            if linker:
+                values["relationships"] = linker.link(resource)
+
+            if trusted:
+                resource_class = cls.model_fields["data"].annotation
+                data = resource_class.__pydantic_validator__.validate_python(values)  # ty: ignore
+                stage_finished("wrap", started)
+                return cls.model_construct(data=data)
+
+            single = DANJASingleResource(**values)  # ty: ignore
+            stage_finished("wrap", started)
+            return cls(data=single)
+        except AttributeError:
+            raise Exception(f"Resource ID field not found in {resource_name}: {resource_id}")
+
+    @classmethod
+    def from_object(
+        cls,
+        source: Any,
+        resource_name: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        validate: bool = False,
+    ) -> "DANJAResource":
+        """
+        Wrap a mapping, dataclass, attrs instance, named tuple or ORM row without building
+        a BaseModel. Attributes are a plain dict in an unparametrized DANJAResource, unless
+        `validate` validates them into the model this class is parametrized with.
+        """
+        values = next(object_rows([source], resource_name, resource_id))
+        if validate:
+            resource_class = cls.model_fields["data"].annotation
+            return cls.model_construct(data=resource_class.__pydantic_validator__.validate_python(values))  # ty: ignore
+        return DANJAResource.model_construct(data=_validate_resource(values))
+
+    def include_from_basemodels(self, includes: list[Any]) -> None:
+        """
+        Add the list to the includes
+        """
+        started = stage_started()
+        self.included = []
+        for include in includes:
+            # Convert these to resource types
+            self.included.append(DANJASingleResource(**include))
+        stage_finished("included", started, len(self.included))
+
+    def model_dump_sparse(self, fieldsets: Fieldsets, **kwargs: Any) -> dict[str, Any]:
+        """
+        `model_dump` restricted to JSON:API sparse fieldsets, a map of resource type to
+        the attribute and relationship names to keep, e.g. from `parse_fieldsets`
+        """
+        return self.model_dump(include=sparse_fieldsets(self, fieldsets), **kwargs)
+
+    def model_dump_json_sparse(self, fieldsets: Fieldsets, **kwargs: Any) -> str:
+        """
+        `model_dump_json` restricted to JSON:API sparse fieldsets
+        """
+        return self.model_dump_json(include=sparse_fieldsets(self, fieldsets), **kwargs)
+
+    @classmethod
+    def from_json_bytes(
+        cls, json_data: Union[str, bytes, bytearray], resource_types: Optional["ResourceTypeRegistry"] = None
+    ) -> Self:
+        """
+        Validate a raw JSON:API document straight from JSON, without building an
+        intermediate dict for `data`. `included` is kept as parsed, as with `model_validate`,
+        unless a ResourceTypeRegistry is given to validate it into typed resources.
+        """
+        return _validate_json_ignoring_included(cls, json_data, resource_types)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def ignore_included(cls, data: Any, handler: ModelWrapValidatorHandler[Self], info: ValidationInfo) -> Self:
+        """
+        Pydantic will attempt to validate any generic in a model against a single TypeVar[] resulting
+        in failures of validation for the `included` resource listing, which may not be the same
+        resource type as the top level data block. So in the meantime, we exclude `included` resources
+        from the validation process. A ResourceTypeRegistry given as the `resource_types`
+        validation context validates them by type instead.
+        """
+        return _validate_ignoring_included(data, handler, info)
+
+
+class DANJAResourceList(BaseModel, ResourceResolver, Generic[ResourceType]):
+    """JSON:API base for a list of resources"""
+
+    data: list[DANJASingleResource[ResourceType]]
+    links: Optional[dict[str, Union[str, DANJALink, None]]] = None
+    meta: Optional[dict[str, Any]] = None
+    included: Optional[list[DANJASingleResource]] = None
+
+    @property
+    def resources(self) -> list[ResourceType]:
+        return [data.attributes for data in self.data]
+
+    @classmethod
+    def from_basemodel_list(
+        cls,
+        resources: list[ResourceType],
+        resource_name: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        trusted: bool = False,
+    ) -> "DANJAResourceList":
+        """
+        Wrap a list of BaseModels in a JSON:API container. With `trusted` the models are
+        not revalidated and the container is constructed without validation, only use
+        this for models you built yourself.
+        """
+        try:
+            id_getter = None
+            linker = None
+            if len(resources) > 0:
+                """
+                Any resource name or ID field not supplied is looked up in the model config
+                and fields, once per model class
+                """
+                started = stage_started()
+                metadata = cls.resolve(resources[0].__class__, resource_name, resource_id)
+                stage_finished("resolve", started)
+                resource_name, resource_id, id_getter = metadata
+                if not id_getter:
+                    raise Exception(f"No fields defined in {resource_name}")
+                # Declared relationships are linked for the whole list, sharing identifiers
+                linker = _RelationshipLinker.for_class(resources[0].__class__)
+
+            build = DANJASingleResource
+            if trusted:
+                # Wrapped models are accepted as they are by the parametrized resource type's
+                # core validator, so each resource is built in one pass with no __init__ overhead
+                resource_class = get_args(cls.model_fields["data"].annotation)[0]
+                build = resource_class.__pydantic_validator__.validate_python
+
+            started = stage_started()
+            data: list[DANJASingleResource] = []
+            for sub_resource in resources:
+                values = {"type": resource_name, "lid": None, "attributes": sub_resource}
+                id_value = id_getter(sub_resource)  # ty: ignore
+                if id_value:
+                    values["id"] = str(id_value)
+                if linker:
+                    values["relationships"] = linker.link(sub_resource)
+                data.append(build(values) if trusted else build(**values))  # ty: ignore
+            stage_finished("wrap", started, len(data))
+
+            if trusted:
+                return cls.model_construct(data=data)
+
+            return cls(data=data)
+        except AttributeError:
+            raise Exception(f"Resource ID field not found in {resource_name}: {resource_id}")
+
+    @classmethod
+    def from_objects(
+        cls,
+        sources: Iterable[Any],
+        resource_name: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        validate: bool = False,
+    ) -> "DANJAResourceList":
+        """
+        Wrap mappings, dataclasses, attrs instances, named tuples or ORM rows without building
+        BaseModels, reading each source class through accessors built once per class.
+        Attributes are plain dicts as with `from_columns`, unless `validate` is set.
+        """
+        rows = object_rows(sources, resource_name, resource_id)
+        if validate:
+            resource_class = get_args(cls.model_fields["data"].annotation)[0]
+            build = resource_class.__pydantic_validator__.validate_python
+            return cls.model_construct(data=[build(values) for values in rows])
+        return DANJAResourceList.model_construct(data=[_validate_resource(values) for values in rows])
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Columns,
+        model: Optional[type[BaseModel]] = None,
+        resource_name: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        validate: bool = False,
+    ) -> "DANJAResourceList":
+        """
+        Build a resource list from column arrays (lists, tuples or NumPy arrays) keyed by
+        attribute name, without a BaseModel per row. The resource name and ID column are
+        resolved from `model` like `from_basemodel_list` unless given. Attributes are plain
+        dicts in an unparametrized DANJAResourceList, unless `validate` validates them into
+        the model this class is parametrized with.
+        """
+        if validate:
+            resource_class = get_args(cls.model_fields["data"].annotation)[0]
+            build = resource_class.__pydantic_validator__.validate_python
+            rows = resource_rows(columns, model, resource_name, resource_id, by_alias=True)
+            return cls.model_construct(data=[build(values) for values in rows])
+
+        rows = resource_rows(columns, model, resource_name, resource_id)
+        return DANJAResourceList.model_construct(data=[_validate_resource(values) for values in rows])
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Any,
+        model: Optional[type[BaseModel]] = None,
+        resource_name: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        names: Optional[Iterable[str]] = None,
+        validate: bool = False,
+    ) -> "DANJAResourceList":
+        """
+        Build a resource list from a NumPy structured array, or a sequence of tuples with
+        their column `names`, as `from_columns`
+        """
+        return cls.from_columns(records_columns(records, names), model, resource_name, resource_id, validate)
+
+    def include_from_basemodels(self, includes: list[Any]) -> None:
+        """
+        Add the list to the includes
+        """
+        started = stage_started()
+        self.included = []
+        for include in includes:
+            # Convert these to resource types
+            self.included.append(DANJASingleResource(**include))
+        stage_finished("included", started, len(self.included))
+
+    def model_dump_sparse(self, fieldsets: Fieldsets, **kwargs: Any) -> dict[str, Any]:
+        """
+        `model_dump` restricted to JSON:API sparse fieldsets, a map of resource type to
+        the attribute and relationship names to keep, e.g. from `parse_fieldsets`
+        """
+        return self.model_dump(include=sparse_fieldsets(self, fieldsets), **kwargs)
+
+    def model_dump_json_sparse(self, fieldsets: Fieldsets, **kwargs: Any) -> str:
+        """
+        `model_dump_json` restricted to JSON:API sparse fieldsets
+        """
+        return self.model_dump_json(include=sparse_fieldsets(self, fieldsets), **kwargs)
+
+    @classmethod
+    def from_json_bytes(
+        cls, json_data: Union[str, bytes, bytearray], resource_types: Optional["ResourceTypeRegistry"] = None
+    ) -> Self:
+        """
+        Validate a raw JSON:API document straight from JSON, without building an
+        intermediate dict for `data`. `included` is kept as parsed, as with `model_validate`,
+        unless a ResourceTypeRegistry is given to validate it into typed resources.
+        """
+        return _validate_json_ignoring_included(cls, json_data, resource_types)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def ignore_included(cls, data: Any, handler: ModelWrapValidatorHandler[Self], info: ValidationInfo) -> Self:
+        """
+        Pydantic will attempt to validate any generic in a model against a single TypeVar[] resulting
+        in failures of validation for the `included` resource listing, which may not be the same
+        resource type as the top level data block. So in the meantime, we exclude `included` resources
+        from the validation process. A ResourceTypeRegistry given as the `resource_types`
+        validation context validates them by type instead.
+        """
+        return _validate_ignoring_included(data, handler, info)
@@ -0,0 +1,195 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Union
+
+from pydantic import TypeAdapter, ValidationError
+
+from .models import DANJASingleResource, _linked_values, _RelationshipLinker
+from .parsing import aread_chunks, read_chunks
+from .resolver import ResourceMetadata, ResourceResolver
+from .streaming import _aiterate
+
+if TYPE_CHECKING:
+    from .registry import ResourceTypeRegistry
+
+_validate_resource = DANJASingleResource.__pydantic_validator__.validate_python
+_dump_resource = DANJASingleResource.__pydantic_serializer__.to_json
+
+
+class _LineWriter:
+    """
+    Writes resources as NDJSON, one resource object per line, wrapping BaseModels exactly
+    like `DANJAResourceList.from_basemodel_list` with the resource name and ID field
+    resolved from the first one. Declared relationships share identifiers within a batch.
+    """
+
+    def __init__(self, resource_name: Optional[str], resource_id: Optional[str], exclude_none: bool) -> None:
+        self.resource_name = resource_name
+        self.resource_id = resource_id
+        self.exclude_none = exclude_none
+        self.metadata: Optional[ResourceMetadata] = None
+        self.linker: Optional[_RelationshipLinker] = None
+
+    def line(self, resource: Any) -> bytes:
+        if not isinstance(resource, DANJASingleResource):
+            if self.metadata is None:
+                self.metadata = ResourceResolver.resolve(resource.__class__, self.resource_name, self.resource_id)
+                self.linker = _RelationshipLinker.for_class(resource.__class__)
+            resource = _validate_resource(_linked_values(self.metadata, resource, self.linker))  # ty: ignore
+        return _dump_resource(resource, exclude_none=self.exclude_none) + b"\n"
+
+    def batch(self, resources: list[Any]) -> bytes:
+        encoded = b"".join([self.line(resource) for resource in resources])
+        if self.linker:
+            # Start each batch afresh so shared identifiers stay bounded
+            self.linker = _RelationshipLinker(self.linker.fields)
+        return encoded
+
+
+def write_ndjson(
+    resources: Iterable[Any],
+    resource_name: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    exclude_none: bool = False,
+    batch_size: int = 1000,
+) -> Iterator[bytes]:
+    """
+    Encode BaseModels (or DANJASingleResource instances) as NDJSON, one JSON:API resource
+    object per line, yielding a bytes chunk per `batch_size` resources. Only one batch is
+    held in memory, so the output can be written to a file or a StreamingResponse.
+    """
+    writer = _LineWriter(resource_name, resource_id, exclude_none)
+    batch: list[Any] = []
+    for resource in resources:
+        batch.append(resource)
+        if len(batch) >= batch_size:
+            yield writer.batch(batch)
+            batch = []
+    if batch:
+        yield writer.batch(batch)
+
+
+async def awrite_ndjson(
+    resources: Union[AsyncIterable[Any], Iterable[Any]],
+    resource_name: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    exclude_none: bool = False,
+    batch_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """
+    Async version of `write_ndjson`, `resources` may be an async or regular iterable
+    """
+    writer = _LineWriter(resource_name, resource_id, exclude_none)
+    batch: list[Any] = []
+    async for resource in _aiterate(resources):
+        batch.append(resource)
+        if len(batch) >= batch_size:
+            yield writer.batch(batch)
+            batch = []
+    if batch:
+        yield writer.batch(batch)
+
+
+@lru_cache(maxsize=256)
+def _batch_adapter(resource_type: Any) -> TypeAdapter:
+    resource_class = DANJASingleResource[resource_type] if resource_type else DANJASingleResource  # ty: ignore
+    return TypeAdapter(list[resource_class])  # ty: ignore
+
+
+class NDJSONReader:
+    """
+    Reads NDJSON resource objects, one per line, from a binary file-like object (with
+    `read`), an iterable of bytes, or for `async for` an async iterable of bytes or an
+    object with an async `read`. Lines are validated in batches of `batch_size`, one
+    pydantic-core call per batch, into DANJASingleResource[resource_type], or into the
+    typed resources of a ResourceTypeRegistry for mixed types. Blank lines are skipped.
+
+        for batch in NDJSONReader(open("articles.ndjson", "rb"), Article).batches():
+            save_all(resource.attributes for resource in batch)
+
+    An invalid line raises a ValueError giving its line number.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        resource_type: Optional[type] = None,
+        resource_types: Optional["ResourceTypeRegistry"] = None,
+        batch_size: int = 1000,
+        chunk_size: int = 65536,
+    ) -> None:
+        self.source = source
+        self.batch_size = max(batch_size, 1)
+        self.chunk_size = chunk_size
+        if resource_types is not None:
+            self._validate_json = resource_types.validate_included
+            self._validate_line = lambda line: resource_types.validate_included(b"[" + line + b"]")[0]
+        else:
+            self._validate_json = _batch_adapter(resource_type).validate_json
+            resource_class = DANJASingleResource[resource_type] if resource_type else DANJASingleResource  # ty: ignore
+            self._validate_line = resource_class.__pydantic_validator__.validate_json
+        self.count = 0
+        self._lines: list[bytes] = []
+        self._line_numbers: list[int] = []
+        self._line_number = 0
+        self._partial = b""
+
+    def _add(self, line: bytes) -> None:
+        self._line_number += 1
+        line = line.strip()
+        if line:
+            self._lines.append(line)
+            self._line_numbers.append(self._line_number)
+
+    def _flush(self) -> list[DANJASingleResource]:
+        lines, line_numbers = self._lines, self._line_numbers
+        self._lines, self._line_numbers = [], []
+        try:
+            resources = self._validate_json(b"[" + b",".join(lines) + b"]")
+        except ValidationError:
+            # Find the first invalid line to report where it is
+            for line, line_number in zip(lines, line_numbers):
+                try:
+                    self._validate_line(line)
+                except ValidationError as error:
+                    raise ValueError(f"Invalid resource on line {line_number}: {error}") from error
+            raise
+        self.count += len(resources)
+        return resources
+
+    def _feed(self, chunk: bytes) -> Iterator[list[DANJASingleResource]]:
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._add(line)
+            if len(self._lines) >= self.batch_size:
+                yield self._flush()
+
+    def _close(self) -> Iterator[list[DANJASingleResource]]:
+        if self._partial:
+            self._add(self._partial)
+            self._partial = b""
+        if self._lines:
+            yield self._flush()
+
+    def batches(self) -> Iterator[list[DANJASingleResource]]:
+        """Validated resources in lists of up to `batch_size`"""
+        for chunk in read_chunks(self.source, self.chunk_size):
+            yield from self._feed(chunk)
+        yield from self._close()
+
+    async def abatches(self) -> AsyncIterator[list[DANJASingleResource]]:
+        """Async version of `batches`"""
+        async for chunk in aread_chunks(self.source, self.chunk_size):
+            for batch in self._feed(chunk):
+                yield batch
+        for batch in self._close():
+            yield batch
+
+    def __iter__(self) -> Iterator[DANJASingleResource]:
+        for batch in self.batches():
+            yield from batch
+
+    async def __aiter__(self) -> AsyncIterator[DANJASingleResource]:
+        async for batch in self.abatches():
+            for resource in batch:
+                yield resource
@@ -1,100 +1,160 @@
-from typing import Any
-import dpath
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Optional
 
+_SCHEMA_REF = "#/components/schemas/"
 
-def danja_openapi(openapi_schema: dict[str, Any]) -> dict[str, Any]:
+# Rewritten schemas keyed by a fingerprint of their input
+_cache: "OrderedDict[str, dict[str, Any]]" = OrderedDict()
+_CACHE_SIZE = 8
+
+
+def _ref_holders(node: Any) -> list[dict[str, Any]]:
+    """
+    Collect every object holding a `$ref` below `node` in a single traversal
+    """
+    holders = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            if isinstance(item.get("$ref"), str):
+                holders.append(item)
+            stack.extend(value for value in item.values() if isinstance(value, (dict, list)))
+        elif isinstance(item, list):
+            stack.extend(value for value in item if isinstance(value, (dict, list)))
+    return holders
+
+
+def _pointer_get(document: Any, ref: str) -> Any:
+    """
+    Resolve a local JSON pointer reference such as `#/components/schemas/Name`
+    """
+    target = document
+    for token in ref[2:].split("/") if ref != "#" else []:
+        token = token.replace("~1", "/").replace("~0", "~")
+        target = target[int(token)] if isinstance(target, list) else target[token]
+    return target
+
+
+class _Dereferencer:
+    """
+    Replaces `$ref` objects with the objects they reference, in place. Every referenced
+    object is dereferenced once and then shared, references back into an object that
+    is still being dereferenced are left in place so recursive schemas terminate.
+    """
+
+    def __init__(self, document: dict[str, Any]) -> None:
+        self.document = document
+        self.done: set[int] = set()
+        self.active: set[int] = set()
+        self.kept_refs: set[str] = set()
+
+    def resolve(self, ref: str) -> Optional[Any]:
+        if not ref.startswith("#"):
+            return None
+        target = _pointer_get(self.document, ref)
+        if id(target) in self.active:
+            self.kept_refs.add(ref)
+            return None
+        self.dereference(target)
+        return target
+
+    def dereference(self, node: Any) -> Any:
+        if id(node) in self.done or not isinstance(node, (dict, list)):
+            return node
+        self.active.add(id(node))
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in list(items):
+            if isinstance(value, dict) and isinstance(value.get("$ref"), str):
+                target = self.resolve(value["$ref"])
+                if target is not None:
+                    node[key] = target
+            else:
+                self.dereference(value)
+        self.active.discard(id(node))
+        self.done.add(id(node))
+        return node
+
+
+def _rename(key: str) -> str:
+    """
+    Rename the DANJA objects
+    DANJAErrorList -> Error_List
+    DANJAResourceList_model -> model_List
+    DANJAResource_model -> model
+    """
+    if key.startswith("DANJAResource_"):
+        return key.replace("DANJAResource_", "")[:-1]
+    if key.startswith("DANJAResourceList_"):
+        return f"{key.replace('DANJAResourceList_', '')}List"
+    if key == "DANJAErrorList":
+        return "Error_List"
+    return key
+
+
+def _fingerprint(openapi_schema: dict[str, Any]) -> str:
+    encoded = json.dumps(openapi_schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def danja_openapi(openapi_schema: dict[str, Any], cache: bool = True) -> dict[str, Any]:
     """
     This is an optional function that will assist in de-cluttering the OpenAPI
     schema space. This function will de-reference and flatten a lot of the
     DANJA namespace while leaving non-DANJA classes alone.
+
+    The schema is rewritten in place using one traversal of `paths` and one of the
+    component schemas. The result for an unchanged input schema is cached, hits
+    return a copy of it.
     """
-    
+    fingerprint = _fingerprint(openapi_schema) if cache else ""
+    if fingerprint in _cache:
+        _cache.move_to_end(fingerprint)
+        return copy.deepcopy(_cache[fingerprint])
+
     # Get all referenced schemas
-    ref_schemas = set([
-        result[1][21:]
-        for result in dpath.search(openapi_schema, "paths/**/$ref", yielded=True)
-    ])
+    path_refs = _ref_holders(openapi_schema.get("paths", {}))
+    ref_schemas = set(holder["$ref"][len(_SCHEMA_REF) :] for holder in path_refs)
 
     # Resolve all schema references
+    schemas = openapi_schema.setdefault("components", {}).get("schemas", {})
+    dereferencer = _Dereferencer(openapi_schema)
     ex_schemas = {}
-    for key, value in openapi_schema.get("components", {}).get("schemas", {}).items():
+    for key, value in schemas.items():
         # Flatten and add to the schemas
-        for result in dpath.search(value, "/**/$ref", yielded=True):
-            parent, _, _ = result[0].rpartition("/")
-            dpath.set(value, parent, dpath.get(openapi_schema, result[1][1:]))
-        
+        if isinstance(value.get("$ref"), str):
+            value = dereferencer.resolve(value["$ref"]) or value
+        dereferencer.dereference(value)
+
         if key in ref_schemas:
             ex_schemas[key] = value
 
-    # Rename the DANJA objects
-    # DANJAErrorList -> Error_List
-    # DANJAResourceList_model -> model_List
-    # DANJAResource_model -> model
-    rn_schemas = {}
+    # Schemas still referenced by recursive models must be kept under their own name
+    for ref in dereferencer.kept_refs:
+        key = ref[len(_SCHEMA_REF) :]
+        if ref.startswith(_SCHEMA_REF) and key in schemas and key not in ex_schemas:
+            ex_schemas[key] = schemas[key]
+
+    # Rename the DANJA objects and their references from paths, unless the new
+    # name is taken by a schema that keeps its own name
+    kept_keys = set(ex_schemas) - ref_schemas
+    new_keys = {}
     for key in ex_schemas:
-        old_key = f"#/components/schemas/{key}"
-        # Find the key in the paths and rename the key and reference
-        if key.startswith("DANJAResource_"):
-            new_key = key.replace("DANJAResource_", "")
-            # Find all path references to the old key
-            for result in dpath.search(
-                openapi_schema,
-                "paths|**|$ref",
-                yielded=True,
-                separator="|"
-            ):
-                if result[1] == old_key:
-                    # Rename to the new key
-                    dpath.set(
-                        openapi_schema,
-                        result[0],
-                        f"#/components/schemas/{new_key[:-1]}",
-                        separator="|"
-                    )
-
-            rn_schemas[new_key[:-1]] = ex_schemas[key]
-        elif key.startswith("DANJAResourceList_"):
-            new_key = key.replace("DANJAResourceList_", "")
-            # Find all path references to the old key
-            for result in dpath.search(
-                openapi_schema,
-                "paths|**|$ref",
-                yielded=True,
-                separator="|"
-            ):
-                if result[1] == old_key:
-                    # Rename to the new key
-                    dpath.set(
-                        openapi_schema,
-                        result[0],
-                        f"#/components/schemas/{new_key}List",
-                        separator="|"
-                    )
-
-            rn_schemas[f"{new_key}List"] = ex_schemas[key]
-        elif key == "DANJAErrorList":
-            new_key = "Error_List"
-            # Find all path references to the old key
-            for result in dpath.search(
-                openapi_schema,
-                "paths|**|$ref",
-                yielded=True,
-                separator="|"
-            ):
-                if result[1] == old_key:
-                    # Rename to the new key
-                    dpath.set(
-                        openapi_schema,
-                        result[0],
-                        f"#/components/schemas/{new_key}",
-                        separator="|"
-                    )
-
-            rn_schemas[new_key] = ex_schemas[key]
-        else:
-            # Don't rename
-            rn_schemas[key] = ex_schemas[key]
-
-    openapi_schema["components"]["schemas"] = rn_schemas
+        new_key = _rename(key) if key in ref_schemas else key
+        new_keys[key] = key if new_key in kept_keys and new_key != key else new_key
+    for holder in path_refs:
+        key = holder["$ref"][len(_SCHEMA_REF) :]
+        if holder["$ref"].startswith(_SCHEMA_REF) and new_keys.get(key, key) != key:
+            holder["$ref"] = f"{_SCHEMA_REF}{new_keys[key]}"
+
+    openapi_schema["components"]["schemas"] = {new_keys[key]: value for key, value in ex_schemas.items()}
+
+    if cache:
+        _cache[fingerprint] = copy.deepcopy(openapi_schema)
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
 
     return openapi_schema
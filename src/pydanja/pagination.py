@@ -0,0 +1,239 @@
+import base64
+import json
+from itertools import islice
+from typing import Any, AsyncIterable, Callable, Iterable, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .models import DANJAResourceList
+
+Links = dict[str, Optional[str]]
+
+
+def encode_cursor(value: Any) -> str:
+    """An opaque, URL safe cursor for any JSON serializable value, e.g. a sort key"""
+    encoded = json.dumps(value, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(encoded).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Any:
+    """The value of a cursor from `encode_cursor`, raising a ValueError for anything else"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as error:
+        raise ValueError(f"Invalid page cursor {cursor!r}") from error
+
+
+def take_page(items: Iterable[Any], page_size: int) -> tuple[list[Any], bool]:
+    """
+    Read one page from an iterator, consuming exactly `page_size` + 1 items at most.
+    Returns the page and whether another item followed it.
+    """
+    page = list(islice(items, page_size + 1))
+    return page[:page_size], len(page) > page_size
+
+
+async def atake_page(items: Union[AsyncIterable[Any], Iterable[Any]], page_size: int) -> tuple[list[Any], bool]:
+    """Async version of `take_page`, also taking an async iterable"""
+    if not isinstance(items, AsyncIterable):
+        return take_page(items, page_size)
+    page: list[Any] = []
+    iterator = items.__aiter__()
+    try:
+        async for item in iterator:
+            page.append(item)
+            if len(page) > page_size:
+                break
+    finally:
+        close = getattr(iterator, "aclose", None)
+        if close is not None:
+            await close()
+    return page[:page_size], len(page) > page_size
+
+
+def _page_url(url: str, page: dict[str, Any]) -> str:
+    """`url` with its `page[...]` query parameters replaced"""
+    parts = urlsplit(url)
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if not key.startswith("page[")
+    ]
+    query.extend((f"page[{key}]", str(value)) for key, value in page.items())
+    return urlunsplit(parts._replace(query=urlencode(query, safe="[]")))
+
+
+def _total_meta(total: Optional[int], estimated: bool) -> dict[str, Any]:
+    """Page totals as in the JSON:API cursor pagination profile"""
+    if total is None:
+        return {}
+    if estimated:
+        return {"estimatedTotal": {"bestGuess": total}}
+    return {"total": total}
+
+
+def _cursor_links(
+    url: str,
+    page_size: int,
+    first_cursor: Optional[str],
+    last_cursor: Optional[str],
+    has_prev: bool,
+    has_next: bool,
+) -> Links:
+    """
+    The `first`, `prev` and `next` links of a cursor page, `prev` and `next` being null
+    when there is no such page. `last` is unknown with cursors and always null.
+    """
+    return {
+        "first": _page_url(url, {"size": page_size}),
+        "prev": _page_url(url, {"size": page_size, "before": first_cursor}) if has_prev and first_cursor else None,
+        "next": _page_url(url, {"size": page_size, "after": last_cursor}) if has_next and last_cursor else None,
+        "last": None,
+    }
+
+
+def _offset_links(url: str, offset: int, limit: int, has_next: bool, total: Optional[int] = None) -> Links:
+    """
+    The `first`, `prev`, `next` and `last` links of an offset page. `last` needs an exact
+    total and is null otherwise.
+    """
+    last = None
+    if total is not None:
+        last = _page_url(url, {"offset": max(total - 1, 0) // limit * limit, "limit": limit})
+    return {
+        "first": _page_url(url, {"offset": 0, "limit": limit}),
+        "prev": _page_url(url, {"offset": max(offset - limit, 0), "limit": limit}) if offset > 0 else None,
+        "next": _page_url(url, {"offset": offset + limit, "limit": limit}) if has_next else None,
+        "last": last,
+    }
+
+
+def _cursor_ordered(
+    page: list[Any],
+    has_more: bool,
+    url: str,
+    page_size: int,
+    cursor: Callable[[Any], Any],
+    encode: Callable[[Any], str],
+    after: Optional[str],
+    before: Optional[str],
+) -> tuple[list[Any], Links]:
+    """
+    Put a page read with `take_page` in order and link it. A page read `before` a cursor
+    comes from items in reverse order, so `has_more` tells whether a previous page exists.
+    """
+    if before is not None:
+        page.reverse()
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = after is not None, has_more
+    first_cursor = encode(cursor(page[0])) if page else None
+    last_cursor = encode(cursor(page[-1])) if page else None
+    return page, _cursor_links(url, page_size, first_cursor, last_cursor, has_prev, has_next)
+
+
+def _page_list(
+    page: list[Any],
+    links: Links,
+    meta: dict[str, Any],
+    resource_name: Optional[str],
+    resource_id: Optional[str],
+    trusted: bool,
+) -> DANJAResourceList:
+    resource_list = DANJAResourceList.from_basemodel_list(page, resource_name, resource_id, trusted)
+    resource_list.links = links  # ty: ignore
+    resource_list.meta = {**(resource_list.meta or {}), "page": meta}
+    return resource_list
+
+
+def paginate_cursor(
+    resources: Iterable[Any],
+    page_size: int,
+    url: str,
+    cursor: Callable[[Any], Any],
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    encode: Callable[[Any], str] = encode_cursor,
+    resource_name: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    trusted: bool = False,
+    total: Optional[int] = None,
+    estimated: bool = False,
+) -> DANJAResourceList:
+    """
+    One page of a cursor paginated collection, following the JSON:API cursor pagination
+    profile. `resources` are the BaseModels from the requested cursor on, e.g. a query
+    `WHERE id > :after ORDER BY id`; exactly `page_size` + 1 are read to tell whether there
+    is a next page, and the page is wrapped with `DANJAResourceList.from_basemodel_list`.
+    When paginating `before` a cursor, give the resources in reverse order.
+
+    `cursor` returns the sort key of a resource, which `encode` makes into the opaque
+    `page[after]` and `page[before]` values of the links, `decode_cursor` reads them back.
+    A `total` goes in `meta.page`, as `estimatedTotal` when `estimated`.
+
+        page = paginate_cursor(query(after=decode_cursor(after)), 50, str(request.url), lambda a: a.id, after)
+    """
+    page, has_more = take_page(resources, page_size)
+    page, links = _cursor_ordered(page, has_more, url, page_size, cursor, encode, after, before)
+    meta = {"size": page_size, **_total_meta(total, estimated)}
+    return _page_list(page, links, meta, resource_name, resource_id, trusted)
+
+
+async def apaginate_cursor(
+    resources: Union[AsyncIterable[Any], Iterable[Any]],
+    page_size: int,
+    url: str,
+    cursor: Callable[[Any], Any],
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    encode: Callable[[Any], str] = encode_cursor,
+    resource_name: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    trusted: bool = False,
+    total: Optional[int] = None,
+    estimated: bool = False,
+) -> DANJAResourceList:
+    """Async version of `paginate_cursor`, `resources` may be an async or regular iterable"""
+    page, has_more = await atake_page(resources, page_size)
+    page, links = _cursor_ordered(page, has_more, url, page_size, cursor, encode, after, before)
+    meta = {"size": page_size, **_total_meta(total, estimated)}
+    return _page_list(page, links, meta, resource_name, resource_id, trusted)
+
+
+def paginate_offset(
+    resources: Iterable[Any],
+    url: str,
+    offset: int = 0,
+    limit: int = 50,
+    resource_name: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    trusted: bool = False,
+    total: Optional[int] = None,
+    estimated: bool = False,
+) -> DANJAResourceList:
+    """
+    One page of an offset paginated collection, linked with `page[offset]` and
+    `page[limit]`. `resources` are the BaseModels from `offset` on, e.g. a query with
+    `OFFSET :offset LIMIT :limit + 1`; exactly `limit` + 1 are read to tell whether there
+    is a next page, so nothing needs counting. The `last` link needs an exact `total`, an
+    `estimated` one only goes in `meta.page` as `estimatedTotal`.
+    """
+    page, has_next = take_page(resources, limit)
+    links = _offset_links(url, offset, limit, has_next, None if estimated else total)
+    meta = {"offset": offset, "limit": limit, **_total_meta(total, estimated)}
+    return _page_list(page, links, meta, resource_name, resource_id, trusted)
+
+
+async def apaginate_offset(
+    resources: Union[AsyncIterable[Any], Iterable[Any]],
+    url: str,
+    offset: int = 0,
+    limit: int = 50,
+    resource_name: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    trusted: bool = False,
+    total: Optional[int] = None,
+    estimated: bool = False,
+) -> DANJAResourceList:
+    """Async version of `paginate_offset`, `resources` may be an async or regular iterable"""
+    page, has_next = await atake_page(resources, limit)
+    links = _offset_links(url, offset, limit, has_next, None if estimated else total)
+    meta = {"offset": offset, "limit": limit, **_total_meta(total, estimated)}
+    return _page_list(page, links, meta, resource_name, resource_id, trusted)
@@ -0,0 +1,120 @@
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from .instrumentation import resource_count, stage_finished, stage_started
+from .models import DANJAResource, DANJAResourceList
+from .streaming import splice_document
+
+
+def free_threaded() -> bool:
+    """True on a free-threaded Python build running without the GIL"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def default_executor(max_workers: Optional[int] = None) -> Executor:
+    """
+    A thread pool on free-threaded builds, where serializing threads run in parallel,
+    otherwise a process pool. A process pool only pays off when serializing a resource
+    costs more than pickling it, e.g. with custom serializers doing real work.
+    """
+    if free_threaded():
+        return ThreadPoolExecutor(max_workers)
+    return ProcessPoolExecutor(max_workers)
+
+
+@lru_cache(maxsize=256)
+def _list_adapter(resource_class: type) -> TypeAdapter:
+    return TypeAdapter(list[resource_class])  # ty: ignore
+
+
+def _picklable(resources: list[Any]) -> list[Any]:
+    """
+    Parametrized containers such as DANJASingleResource[Article] are created at runtime
+    and can not be pickled, so their resources are sent to a process pool as the
+    unparametrized class with the field values, the attribute models included
+    """
+    payload: list[Any] = []
+    for resource in resources:
+        origin = getattr(resource.__class__, "__pydantic_generic_metadata__", {}).get("origin")
+        if origin is not None:
+            resource = (origin, resource.__dict__, resource.__pydantic_fields_set__)
+        payload.append(resource)
+    return payload
+
+
+def _encode_chunk(resources: list[Any], exclude_none: bool) -> bytes:
+    """
+    Serialize a chunk of resources to their JSON joined by commas, in one serializer call
+    when they share a class. Run in the workers, so resources sent to a process pool must
+    be picklable, with importable attribute models.
+    """
+    resources = [
+        resource[0].model_construct(resource[2], **resource[1]) if isinstance(resource, tuple) else resource
+        for resource in resources
+    ]
+    resource_class = resources[0].__class__ if resources else None
+    if isinstance(resource_class, type) and issubclass(resource_class, BaseModel):
+        if all(resource.__class__ is resource_class for resource in resources):
+            return _list_adapter(resource_class).dump_json(resources, exclude_none=exclude_none)[1:-1]
+    return b",".join(
+        to_json(resource, exclude_none=exclude_none)
+        if isinstance(resource, dict)
+        else resource.__pydantic_serializer__.to_json(resource, exclude_none=exclude_none)
+        for resource in resources
+    )
+
+
+def _encode_list(resources: list[Any], executor: Optional[Executor], chunk_size: int, exclude_none: bool) -> bytes:
+    if executor is None or len(resources) <= chunk_size:
+        return b"[" + _encode_chunk(resources, exclude_none) + b"]"
+    if not isinstance(executor, ThreadPoolExecutor):
+        resources = _picklable(resources)
+    chunks = [resources[start : start + chunk_size] for start in range(0, len(resources), chunk_size)]
+    # map returns results in submission order, so chunks are concatenated in document order
+    return b"[" + b",".join(executor.map(_encode_chunk, chunks, repeat(exclude_none))) + b"]"
+
+
+def parallel_dump_json(
+    document: Union[DANJAResource, DANJAResourceList],
+    executor: Optional[Executor] = None,
+    chunk_size: int = 5000,
+    exclude_none: bool = False,
+    max_workers: Optional[int] = None,
+) -> bytes:
+    """
+    Serialize a document like `model_dump_json`, encoding `data` and `included` in chunks
+    of `chunk_size` resources concurrently on `executor`, and concatenating them in order.
+    Lists no longer than a chunk are serialized in the calling thread.
+
+    Without an executor a temporary thread pool of `max_workers` is used on free-threaded
+    builds. With the GIL the document is serialized in the calling thread: threads can not
+    run the serializer in parallel there, and sending resources to a process pool costs
+    several times more than serializing them. Pass a long lived executor to tune this.
+    """
+    started = stage_started()
+    chunk_size = max(chunk_size, 1)
+    owned = executor is None and free_threaded()
+    if owned:
+        executor = ThreadPoolExecutor(max_workers)
+
+    try:
+        if isinstance(document.data, list):
+            data = _encode_list(document.data, executor, chunk_size, exclude_none)
+        else:
+            data = _encode_chunk([document.data], exclude_none)
+        included = None
+        if document.included is not None:
+            included = _encode_list(document.included, executor, chunk_size, exclude_none)
+        body = splice_document(data, included, document.links, document.meta, exclude_none)
+        stage_finished("serialize", started, resource_count(document.data))
+        return body
+    finally:
+        if owned:
+            executor.shutdown()  # ty: ignore
@@ -0,0 +1,337 @@
+import codecs
+import json
+import re
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, Optional, Union
+
+from .models import DANJASingleResource
+
+if TYPE_CHECKING:
+    from .registry import ResourceTypeRegistry
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Runs of characters that may appear outside strings, other than brackets and quotes
+_TOKENS = re.compile(r"[ \t\n\r,:0-9+\-.eEaeflnrstu]*")
+_SCALAR = re.compile(r"[0-9+\-.eEaeflnrstu]*")
+_STRING_SPECIAL = re.compile(r'["\\]')
+_CLOSING = {"}": "{", "]": "["}
+_decoder = json.JSONDecoder()
+
+# Parser states, positions within the top level document
+_START, _KEY, _FIRST_KEY, _COLON, _VALUE, _ITEM, _FIRST_ITEM, _ITEM_END, _MEMBER_END, _DONE = range(10)
+
+
+def read_chunks(source: Any, chunk_size: int) -> Iterator[bytes]:
+    """
+    The bytes of a binary file-like object (with `read`) in chunks, or of an iterable of bytes
+    """
+    read = getattr(source, "read", None)
+    if read is None:
+        yield from source
+        return
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def aread_chunks(source: Any, chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    Like `read_chunks`, also reading async iterables and objects with an async `read`
+    """
+    read = getattr(source, "read", None)
+    if read is None:
+        if hasattr(source, "__aiter__"):
+            async for chunk in source:
+                yield chunk
+        else:
+            for chunk in source:
+                yield chunk
+        return
+    while True:
+        chunk = read(chunk_size)
+        if isawaitable(chunk):
+            chunk = await chunk
+        if not chunk:
+            return
+        yield chunk
+
+
+class _ValueScanner:
+    """
+    Finds where a JSON value ends, across as many chunks as it spans, by tracking string
+    and nesting state, without decoding it. Each chunk is scanned once, and characters
+    that can not appear in JSON outside strings are rejected straight away.
+    """
+
+    def __init__(self) -> None:
+        self.stack: list[str] = []
+        self.started = False
+        self.scalar = False
+        self.in_string = False
+        self.escaped = False
+
+    def scan(self, text: str, pos: int, eof: bool) -> int:
+        """The position in `text` just past the end of the value, or -1 when it continues"""
+        if not self.started:
+            self.started = True
+            char = text[pos]
+            if char in "{[":
+                self.stack.append(char)
+                pos += 1
+            elif char == '"':
+                self.in_string = True
+                pos += 1
+            else:
+                self.scalar = True
+        if self.scalar:
+            # A number at the end of a chunk may continue in the next one
+            end = _SCALAR.match(text, pos).end()  # ty: ignore
+            return end if end < len(text) or eof else -1
+
+        while pos < len(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                    pos += 1
+                    continue
+                match = _STRING_SPECIAL.search(text, pos)
+                if match is None:
+                    return -1
+                pos = match.end()
+                if match.group() == "\\":
+                    self.escaped = True
+                    continue
+                self.in_string = False
+                if not self.stack:
+                    return pos
+                continue
+
+            pos = _TOKENS.match(text, pos).end()  # ty: ignore
+            if pos >= len(text):
+                return -1
+            char = text[pos]
+            pos += 1
+            if char == '"':
+                self.in_string = True
+            elif char in "{[":
+                self.stack.append(char)
+            elif char in _CLOSING:
+                if not self.stack or self.stack.pop() != _CLOSING[char]:
+                    raise ValueError(f"Invalid JSON:API document, unexpected {char!r}")
+                if not self.stack:
+                    return pos
+            else:
+                raise ValueError(f"Invalid JSON:API document, unexpected {char!r}")
+        return -1
+
+
+class ResourceListParser:
+    """
+    Push parser for a JSON:API resource list document. Bytes are fed in chunks of any
+    size and every resource in `data` is validated and returned as soon as it is complete,
+    so only the resource being parsed is buffered. A value spanning several chunks is
+    scanned once per chunk and decoded once it is complete. The other top level members
+    are kept as they are seen.
+    """
+
+    def __init__(
+        self, resource_type: Optional[type] = None, resource_types: Optional["ResourceTypeRegistry"] = None
+    ) -> None:
+        resource_class = DANJASingleResource[resource_type] if resource_type else DANJASingleResource  # ty: ignore
+        self._validate = resource_class.__pydantic_validator__.validate_python
+        self.resource_types = resource_types
+        self.links: Optional[dict[str, Any]] = None
+        self.meta: Optional[dict[str, Any]] = None
+        self.jsonapi: Optional[dict[str, Any]] = None
+        self.included: Optional[list[Any]] = None
+        self.count = 0
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = ""
+        # The value being read across chunks, its parts and where it ends once known
+        self._scanner: Optional[_ValueScanner] = None
+        self._parts: list[str] = []
+        self._parts_length = 0
+        self._value_end = -1
+
+    def _extend(self, text: str, eof: bool) -> bool:
+        """Add text to the buffer, returning False while a value spanning chunks goes on"""
+        if self._scanner is None:
+            self._buffer = self._buffer[self._pos :] + text
+        else:
+            start = self._parts_length
+            end = self._scanner.scan(text, 0, eof)
+            self._parts.append(text)
+            self._parts_length += len(text)
+            if end < 0 and not eof:
+                return False
+            self._buffer = "".join(self._parts)
+            self._parts = []
+            self._value_end = -1 if end < 0 else start + end
+        self._pos = 0
+        return True
+
+    def feed(self, chunk: Union[bytes, str]) -> list[DANJASingleResource]:
+        """
+        Parse the next chunk, returning the resources it completed
+        """
+        text = chunk if isinstance(chunk, str) else self._text.decode(chunk)
+        if not self._extend(text, eof=False):
+            return []
+        return list(self._parse(eof=False))
+
+    def close(self) -> list[DANJASingleResource]:
+        """
+        Finish parsing, raising a ValueError for an incomplete document
+        """
+        self._extend(self._text.decode(b"", final=True), eof=True)
+        resources = list(self._parse(eof=True))
+        if self._state != _DONE:
+            raise ValueError("Incomplete JSON:API document")
+        return resources
+
+    def _error(self, expected: str) -> ValueError:
+        return ValueError(
+            f"Invalid JSON:API document, expected {expected} at {self._buffer[self._pos : self._pos + 20]!r}"
+        )
+
+    def _decode(self, eof: bool) -> tuple[bool, Any]:
+        """
+        Decode the JSON value at the current position once it is complete, or report that
+        more input is needed, keeping the rest of the buffer as the first part of the value
+        """
+        if self._scanner is None:
+            scanner = _ValueScanner()
+            end = scanner.scan(self._buffer, self._pos, eof)
+            if end < 0:
+                if not eof:
+                    self._scanner = scanner
+                    self._parts = [self._buffer[self._pos :]]
+                    self._parts_length = len(self._parts[0])
+                    self._buffer, self._pos = "", 0
+                return False, None
+        else:
+            end, self._scanner = self._value_end, None
+            if end < 0:
+                return False, None
+        try:
+            value, _ = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Invalid JSON:API document: {error}") from error
+        self._pos = end
+        return True, value
+
+    def _member(self, key: str, value: Any) -> Iterator[DANJASingleResource]:
+        if key == "data":
+            if value is not None:
+                self.count += 1
+                yield self._validate(value)
+        elif key == "included":
+            self.included = value if self.resource_types is None else self.resource_types.validate_included(value)
+        elif key in ("links", "meta", "jsonapi"):
+            setattr(self, key, value)
+
+    def _parse(self, eof: bool) -> Iterator[DANJASingleResource]:
+        buffer = self._buffer
+        while True:
+            self._pos = _WHITESPACE.match(buffer, self._pos).end()  # ty: ignore
+            if self._pos >= len(buffer):
+                return
+            char = buffer[self._pos]
+            state = self._state
+
+            if state == _START:
+                if char != "{":
+                    raise self._error("'{'")
+                self._pos += 1
+                self._state = _FIRST_KEY
+            elif state in (_KEY, _FIRST_KEY):
+                if char == "}" and state == _FIRST_KEY:
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                if char != '"':
+                    raise self._error("a member name")
+                complete, self._key = self._decode(eof)
+                if not complete:
+                    return
+                self._state = _COLON
+            elif state == _COLON:
+                if char != ":":
+                    raise self._error("':'")
+                self._pos += 1
+                self._state = _VALUE
+            elif state == _VALUE:
+                if self._key == "data" and char == "[":
+                    self._pos += 1
+                    self._state = _FIRST_ITEM
+                    continue
+                complete, value = self._decode(eof)
+                if not complete:
+                    return
+                yield from self._member(self._key, value)
+                self._state = _MEMBER_END
+            elif state in (_ITEM, _FIRST_ITEM):
+                if char == "]" and state == _FIRST_ITEM:
+                    self._pos += 1
+                    self._state = _MEMBER_END
+                    continue
+                complete, value = self._decode(eof)
+                if not complete:
+                    return
+                self.count += 1
+                yield self._validate(value)
+                self._state = _ITEM_END
+            elif state == _ITEM_END:
+                if char not in ",]":
+                    raise self._error("',' or ']'")
+                self._pos += 1
+                self._state = _ITEM if char == "," else _MEMBER_END
+            elif state == _MEMBER_END:
+                if char not in ",}":
+                    raise self._error("',' or '}'")
+                self._pos += 1
+                self._state = _KEY if char == "," else _DONE
+            else:
+                raise self._error("the end of the document")
+
+
+class ResourceListReader(ResourceListParser):
+    """
+    Reads a JSON:API resource list document incrementally from a binary file-like object
+    (with `read`), an iterable of bytes, or for `async for` an async iterable of bytes or an
+    object with an async `read`, such as a Starlette `request.stream()`. Validated resources
+    are yielded one at a time at bounded memory.
+
+        reader = ResourceListReader(request.stream(), Article)
+        async for resource in reader:
+            ...
+        reader.meta  # top level members are available once they have been read
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        resource_type: Optional[type] = None,
+        resource_types: Optional["ResourceTypeRegistry"] = None,
+        chunk_size: int = 65536,
+    ) -> None:
+        super().__init__(resource_type, resource_types)
+        self.source = source
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[DANJASingleResource]:
+        for chunk in read_chunks(self.source, self.chunk_size):
+            yield from self.feed(chunk)
+        yield from self.close()
+
+    async def __aiter__(self) -> AsyncIterator[DANJASingleResource]:
+        async for chunk in aread_chunks(self.source, self.chunk_size):
+            for resource in self.feed(chunk):
+                yield resource
+        for resource in self.close():
+            yield resource
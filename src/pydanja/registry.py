@@ -0,0 +1,93 @@
+from functools import lru_cache
+from typing import Annotated, Any, Optional, Union
+
+from pydantic import Discriminator, Tag, TypeAdapter
+
+from .models import DANJASingleResource
+from .resolver import ResourceResolver
+
+# Tag for included resources whose type has no registered model
+_UNKNOWN_TYPE = "*"
+
+
+def _included_type_of(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        return value.get("type")
+    return getattr(value, "type", None)
+
+
+@lru_cache(maxsize=None)
+def _included_annotation(resource_types: tuple[tuple[str, type], ...], allow_unknown: bool) -> Any:
+    """
+    Build the `included` annotation for a set of resource types, cached so that
+    registries with the same types share one compiled schema.
+    """
+    known = frozenset(resource_type for resource_type, _ in resource_types)
+
+    def discriminate(value: Any) -> Optional[str]:
+        resource_type = _included_type_of(value)
+        if resource_type in known or not allow_unknown:
+            return resource_type
+        return _UNKNOWN_TYPE
+
+    choices: list[Any] = [
+        Annotated[DANJASingleResource[model], Tag(resource_type)]  # ty: ignore
+        for resource_type, model in resource_types
+    ]
+    choices.append(Annotated[DANJASingleResource[Any], Tag(_UNKNOWN_TYPE)])
+    if len(choices) == 1 and allow_unknown:
+        return Optional[list[DANJASingleResource[Any]]]
+    return Optional[list[Annotated[Union[tuple(choices)], Discriminator(discriminate)]]]  # ty: ignore
+
+
+@lru_cache(maxsize=None)
+def _included_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+class ResourceTypeRegistry:
+    """
+    Maps JSON:API resource types to attribute models so `included` resources can be
+    validated into typed DANJASingleResource objects, in one pass as a union
+    discriminated on `type`. Pass the registry as the `resource_types` validation
+    context, e.g. `DANJAResource[Article].model_validate(payload, context={"resource_types": registry})`,
+    or to `from_json_bytes`.
+
+    Included resources of unregistered types keep plain attributes, unless
+    `allow_unknown` is False in which case they fail validation.
+    """
+
+    def __init__(self, allow_unknown: bool = True) -> None:
+        self.allow_unknown = allow_unknown
+        self._models: dict[str, type] = {}
+
+    def register(self, model: type, resource_type: Optional[str] = None) -> str:
+        """
+        Register an attribute model, by default under the resource name resolved
+        for it by ResourceResolver. Returns the resource type registered.
+        """
+        if not resource_type:
+            resource_type = ResourceResolver.resolve_metadata(model).resource_name
+        self._models[resource_type] = model
+        return resource_type
+
+    def get(self, resource_type: str) -> Optional[type]:
+        return self._models.get(resource_type)
+
+    def __contains__(self, resource_type: str) -> bool:
+        return resource_type in self._models
+
+    @property
+    def included_type(self) -> Any:
+        """The annotation `included` is validated against"""
+        return _included_annotation(tuple(self._models.items()), self.allow_unknown)
+
+    @property
+    def included_adapter(self) -> TypeAdapter:
+        return _included_adapter(self.included_type)
+
+    def validate_included(self, included: Any) -> Optional[list[DANJASingleResource]]:
+        """Validate a list of included resources, or their raw JSON"""
+        if isinstance(included, (str, bytes, bytearray)):
+            return self.included_adapter.validate_json(included)
+        return self.included_adapter.validate_python(included)
@@ -0,0 +1,51 @@
+from collections.abc import Set
+from operator import attrgetter
+from typing import Any, Callable, NamedTuple, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
+
+
+class RelationshipField(NamedTuple):
+    """A relationship declared on an attribute field, read once per resource class"""
+
+    name: str
+    resource_type: str
+    getter: Callable[[Any], Any]
+    many: bool
+
+
+# Declared relationships keyed by resource class
+_relationship_fields: "WeakKeyDictionary[type, tuple[RelationshipField, ...]]" = WeakKeyDictionary()
+
+
+def _is_many(annotation: Any) -> bool:
+    """
+    True for list, tuple and set annotations, optional or not
+    """
+    origin = get_origin(annotation)
+    if origin is Union:
+        return any(_is_many(arg) for arg in get_args(annotation) if arg is not type(None))
+    origin = origin or annotation
+    return isinstance(origin, type) and issubclass(origin, (list, tuple, Set))
+
+
+def relationship_fields(resource_class: type) -> tuple[RelationshipField, ...]:
+    """
+    Fields declaring a relationship, e.g. `Field(json_schema_extra={"relationship": "author"})`.
+    The field holds the related resource ID, or a list of IDs for to-many relationships. The
+    related resource type is the `resource_type` given alongside, or the relationship name.
+    """
+    fields = _relationship_fields.get(resource_class)
+    if fields is None:
+        fields_list = []
+        for field_name, field in getattr(resource_class, "model_fields", {}).items():
+            extra = field.json_schema_extra
+            if not isinstance(extra, dict) or not extra.get("relationship"):
+                continue
+            name = str(extra["relationship"])
+            resource_type = str(extra.get("resource_type", name))
+            fields_list.append(
+                RelationshipField(name, resource_type, attrgetter(field_name), _is_many(field.annotation))
+            )
+        fields = tuple(fields_list)
+        _relationship_fields[resource_class] = fields
+    return fields
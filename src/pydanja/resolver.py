@@ -0,0 +1,140 @@
+from operator import attrgetter
+from typing import Any, Callable, NamedTuple, Optional
+from weakref import WeakKeyDictionary
+
+
+class ResourceMetadata(NamedTuple):
+    """JSON:API metadata resolved once for a resource class"""
+
+    resource_name: str
+    resource_id: Optional[str]
+    id_getter: Optional[Callable[[Any], Any]]
+
+    def resource_values(self, resource: Any) -> dict[str, Any]:
+        """
+        The DANJASingleResource values wrapping a resource, as built by `from_basemodel`
+        """
+        if not self.id_getter:
+            raise Exception(f"No fields defined in {self.resource_name}")
+        try:
+            id_value = self.id_getter(resource)
+        except AttributeError:
+            raise Exception(f"Resource ID field not found in {self.resource_name}: {self.resource_id}")
+
+        values = {"type": self.resource_name, "lid": None, "attributes": resource}
+        if id_value:
+            values["id"] = str(id_value)
+        return values
+
+
+# Resolved and registered metadata keyed by resource class. Weak keys let
+# dynamically created model classes be collected along with their entry.
+_resolved: "WeakKeyDictionary[type, ResourceMetadata]" = WeakKeyDictionary()
+_registered: "WeakKeyDictionary[type, ResourceMetadata]" = WeakKeyDictionary()
+
+
+class ResourceResolver:
+    @classmethod
+    def resolve_resource_name(cls, resource) -> str:
+        return cls.resolve_metadata(resource.__class__).resource_name
+
+    @classmethod
+    def resolve_resource_id(cls, resource) -> Optional[str]:
+        return cls.resolve_metadata(resource.__class__).resource_id
+
+    @classmethod
+    def resolve_metadata(cls, resource_class: type) -> ResourceMetadata:
+        """
+        Return the (resource name, id field, id getter) metadata for a resource class.
+        Explicit registrations win, otherwise the class is inspected once and cached.
+        """
+        metadata = _registered.get(resource_class)
+        if metadata is None:
+            metadata = _resolved.get(resource_class)
+        if metadata is None:
+            metadata = cls._inspect(resource_class)
+            _resolved[resource_class] = metadata
+        return metadata
+
+    @classmethod
+    def resolve(
+        cls, resource_class: type, resource_name: Optional[str] = None, resource_id: Optional[str] = None
+    ) -> ResourceMetadata:
+        """
+        Resolve metadata for a resource class, preferring any explicitly supplied
+        resource name or id field. The class is only inspected when something is missing.
+        """
+        if resource_name and resource_id:
+            return ResourceMetadata(resource_name, resource_id, attrgetter(resource_id))
+        metadata = cls.resolve_metadata(resource_class)
+        if resource_name:
+            metadata = metadata._replace(resource_name=resource_name)
+        if resource_id:
+            metadata = metadata._replace(resource_id=resource_id, id_getter=attrgetter(resource_id))
+        return metadata
+
+    @classmethod
+    def register(
+        cls, resource_class: type, resource_name: Optional[str] = None, resource_id: Optional[str] = None
+    ) -> ResourceMetadata:
+        """
+        Explicitly register the resource name and/or id field for a class, usually at
+        startup, so no reflection happens at request time. Anything not supplied is
+        inspected from the class now.
+        """
+        inspected = cls._inspect(resource_class)
+        resource_name = resource_name or inspected.resource_name
+        resource_id = resource_id or inspected.resource_id
+        metadata = ResourceMetadata(resource_name, resource_id, attrgetter(resource_id) if resource_id else None)
+        _registered[resource_class] = metadata
+        return metadata
+
+    @classmethod
+    def invalidate(cls, resource_class: Optional[type] = None) -> None:
+        """
+        Forget cached and registered metadata for a class, or for every class when
+        none is given. Use this after changing a model's config or fields at runtime.
+        """
+        if resource_class is None:
+            _resolved.clear()
+            _registered.clear()
+            return
+        _resolved.pop(resource_class, None)
+        _registered.pop(resource_class, None)
+
+    @classmethod
+    def _inspect(cls, resource_class: type) -> ResourceMetadata:
+        resource_name = cls._inspect_resource_name(resource_class)
+        resource_id = cls._inspect_resource_id(resource_class)
+        return ResourceMetadata(resource_name, resource_id, attrgetter(resource_id) if resource_id else None)
+
+    @classmethod
+    def _inspect_resource_name(cls, resource_class: type) -> str:
+        model_config = getattr(resource_class, "model_config", {})
+        json_schema_extra = model_config.get("json_schema_extra", {})
+        if not isinstance(json_schema_extra, dict):
+            json_schema_extra = {}
+        return str(
+            model_config.get(
+                "resource_name",  # Previous method to ensure backwards compatability
+                json_schema_extra.get(  # New method which is type safe
+                    "resource_name", resource_class.__name__.lower()
+                ),
+            )
+        )
+
+    @classmethod
+    def _inspect_resource_id(cls, resource_class: type) -> Optional[str]:
+        for field_name, field in getattr(resource_class, "model_fields", {}).items():
+            if (
+                hasattr(field, "primary_key") and isinstance(field.primary_key, bool) and field.primary_key
+            ):  # Latest SQLMode
+                return field_name
+            # Support for older SQLModel versions
+            if hasattr(field, "json_schema_extra") and isinstance(field.json_schema_extra, dict):
+                if "resource_id" in field.json_schema_extra:
+                    return field_name
+            if hasattr(field, "schema_extra") and isinstance(field.schema_extra, dict):
+                if "resource_id" in field.schema_extra:
+                    return field_name
+        return None
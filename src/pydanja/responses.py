@@ -0,0 +1,167 @@
+"""
+FastAPI support, requires the `fastapi` extra: `pip install pydanja[fastapi]`
+"""
+
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.background import BackgroundTask
+
+from .cache import ResourceCache
+from .errors import danja_errors
+from .fieldsets import Fieldsets, sparse_fieldsets
+from .instrumentation import resource_count, stage_finished, stage_started
+from .models import DANJAError, DANJASource
+
+EndpointType = TypeVar("EndpointType", bound=Callable[..., Any])
+
+JSONAPI_MEDIA_TYPE = "application/vnd.api+json"
+
+
+class DANJAResponse(JSONResponse):
+    """
+    JSON:API response serializing its content once, straight to bytes in pydantic-core.
+    Fields with no value are left out by default, as most JSON:API members may not be null,
+    and fields are written by alias like FastAPI's `response_model` does. `fieldsets`
+    applies JSON:API sparse fieldsets to DANJA containers while serializing.
+    """
+
+    media_type = JSONAPI_MEDIA_TYPE
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[dict[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        exclude_none: bool = True,
+        fieldsets: Optional[Fieldsets] = None,
+        by_alias: bool = True,
+    ) -> None:
+        self.exclude_none = exclude_none
+        self.by_alias = by_alias
+        self.fieldsets = fieldsets
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            started = stage_started()
+            include = sparse_fieldsets(content, self.fieldsets) if self.fieldsets else None
+            body = content.__pydantic_serializer__.to_json(
+                content, include=include, exclude_none=self.exclude_none, by_alias=self.by_alias
+            )
+            stage_finished("serialize", started, resource_count(getattr(content, "data", None)))
+            return body
+        return to_json(content, exclude_none=self.exclude_none, by_alias=self.by_alias)
+
+
+def conditional_response(
+    cache: ResourceCache,
+    document: Any,
+    if_none_match: Optional[str] = None,
+    status_code: int = 200,
+    headers: Optional[dict[str, str]] = None,
+    exclude_none: bool = True,
+    by_alias: bool = True,
+) -> Response:
+    """
+    Respond with a document serialized from cached resource fragments and its ETag, or a
+    304 Not Modified with no body when `if_none_match` (the request's `If-None-Match`
+    header) already matches the ETag. Fields are written by alias, like DANJAResponse.
+    """
+    body, etag = cache.conditional(document, if_none_match, exclude_none, by_alias)
+    headers = {**(headers or {}), "ETag": etag}
+    if body is None:
+        return Response(status_code=304, headers=headers)
+    return DANJAResponse(body, status_code=status_code, headers=headers)
+
+
+def danja_route(
+    router: Union[APIRouter, FastAPI],
+    path: str,
+    *,
+    methods: Sequence[str] = ("GET",),
+    status_code: Optional[int] = None,
+    exclude_none: bool = True,
+    response_model_by_alias: bool = True,
+    **kwargs: Any,
+) -> Callable[[EndpointType], EndpointType]:
+    """
+    Register an endpoint returning DANJA containers so that its result is wrapped in a
+    DANJAResponse. FastAPI then skips validating the result against the response model
+    and encoding it again, while the response model (taken from the return annotation
+    or `response_model`) is still documented in OpenAPI.
+
+        @danja_route(app, "/articles")
+        async def articles() -> DANJAResourceList[Article]:
+            ...
+    """
+
+    def respond(result: Any) -> Any:
+        if isinstance(result, Response):
+            return result
+        return DANJAResponse(
+            result, status_code=status_code or 200, exclude_none=exclude_none, by_alias=response_model_by_alias
+        )
+
+    def decorator(endpoint: EndpointType) -> EndpointType:
+        if iscoroutinefunction(endpoint):
+
+            @wraps(endpoint)
+            async def wrapper(*args: Any, **wrapper_kwargs: Any) -> Any:
+                return respond(await endpoint(*args, **wrapper_kwargs))
+
+        else:
+
+            @wraps(endpoint)
+            def wrapper(*args: Any, **wrapper_kwargs: Any) -> Any:
+                return respond(endpoint(*args, **wrapper_kwargs))
+
+        router.add_api_route(
+            path,
+            wrapper,
+            methods=list(methods),
+            status_code=status_code,
+            response_class=DANJAResponse,
+            response_model_exclude_none=exclude_none,
+            response_model_by_alias=response_model_by_alias,
+            **kwargs,
+        )
+        return endpoint
+
+    return decorator
+
+
+async def validation_error_handler(request: Request, exc: RequestValidationError) -> Response:
+    """
+    Respond to a request validation error with a JSON:API error list, pointing into the
+    request body or naming the query, path or header parameter. Install it with
+    `app.add_exception_handler(RequestValidationError, validation_error_handler)`.
+    """
+    body = []
+    parameters = []
+    for error in exc.errors():
+        location, *loc = error["loc"] or ("body",)
+        if location == "body":
+            body.append({**error, "loc": tuple(loc)})
+        else:
+            name = str(loc[0]) if loc else None
+            source = DANJASource(header=name) if location == "header" else DANJASource(parameter=name)
+            parameters.append(
+                DANJAError(
+                    status="400", code=error["type"], title="Invalid parameter", detail=error["msg"], source=source
+                )
+            )
+
+    errors = danja_errors(body)
+    errors.errors[:0] = parameters
+    return DANJAResponse(errors, status_code=400 if parameters and not body else 422)
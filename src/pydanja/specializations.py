@@ -0,0 +1,100 @@
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple, Optional
+
+from .models import DANJAResource, DANJAResourceList, DANJASingleResource, _json_model
+from .relationships import relationship_fields
+from .resolver import ResourceResolver
+
+if TYPE_CHECKING:
+    from .registry import ResourceTypeRegistry
+
+# The generic containers compiled for each model, in dependency order
+_GENERICS: tuple[type, ...] = (DANJASingleResource, DANJAResource, DANJAResourceList)
+
+
+class SpecializationTiming(NamedTuple):
+    """How long one step of warming a model took"""
+
+    model: type
+    step: str
+    seconds: float
+
+
+class SpecializationRegistry:
+    """
+    Parametrizes and compiles the DANJA containers for a declared set of attribute models
+    up front, e.g. at startup or before forking workers, instead of on the first request.
+
+    Pydantic only caches parametrized generics weakly, so a specialization nothing refers
+    to can be collected and compiled again later. The registry keeps a strong reference to
+    every container it builds, so `DANJAResourceList[Article]` anywhere in request code
+    returns the compiled class. With `strict` the accessors raise a KeyError for models
+    that were not warmed, instead of compiling them on demand.
+
+        specializations = SpecializationRegistry()
+        specializations.warm([Article, Person])
+        specializations.timings  # [SpecializationTiming(Article, "DANJAResource", 0.002), ...]
+    """
+
+    def __init__(self, resource_types: Optional["ResourceTypeRegistry"] = None, strict: bool = False) -> None:
+        self.resource_types = resource_types
+        self.strict = strict
+        self.timings: list[SpecializationTiming] = []
+        self._containers: dict[tuple[type, Any], type] = {}
+
+    def _timed(self, model: type, step: str, build: Any) -> Any:
+        started = perf_counter()
+        result = build()
+        self.timings.append(SpecializationTiming(model, step, perf_counter() - started))
+        return result
+
+    def warm(self, models: Iterable[type]) -> list[SpecializationTiming]:
+        """
+        Compile the containers, JSON validation models and resource metadata of each
+        model, returning the timings of this call. Models already warmed are skipped.
+        """
+        first = len(self.timings)
+        for model in models:
+            if (DANJAResourceList, model) in self._containers:
+                continue
+            self._timed(model, "metadata", lambda: ResourceResolver.resolve_metadata(model))
+            self._timed(model, "relationships", lambda: relationship_fields(model))
+            for generic in _GENERICS:
+                container = self._timed(model, generic.__name__, lambda: generic[model])  # ty: ignore
+                self._containers[(generic, model)] = container
+                if generic is not DANJASingleResource:
+                    self._timed(model, f"{generic.__name__} JSON", lambda: self._warm_json(container))
+        return self.timings[first:]
+
+    def _warm_json(self, container: type) -> None:
+        _json_model(container)
+        if self.resource_types is not None:
+            _json_model(container, self.resource_types)
+
+    def specialize(self, generic: type, model: type) -> Any:
+        """
+        The compiled `generic[model]`, warming the model first unless `strict`
+        """
+        container = self._containers.get((generic, model))
+        if container is None:
+            if self.strict:
+                raise KeyError(f"{generic.__name__}[{model.__name__}] was not warmed up")
+            self.warm([model])
+            container = self._containers[(generic, model)]
+        return container
+
+    def resource(self, model: type) -> Any:
+        return self.specialize(DANJAResource, model)
+
+    def resource_list(self, model: type) -> Any:
+        return self.specialize(DANJAResourceList, model)
+
+    def single_resource(self, model: type) -> Any:
+        return self.specialize(DANJASingleResource, model)
+
+    def __contains__(self, model: type) -> bool:
+        return (DANJAResourceList, model) in self._containers
+
+    def total_seconds(self, model: Optional[type] = None) -> float:
+        """The time spent warming one model, or all of them"""
+        return sum(timing.seconds for timing in self.timings if model is None or timing.model is model)
@@ -0,0 +1,218 @@
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+from .columnar import Columns, resource_rows
+from .models import DANJAResourceList, DANJASingleResource, _linked_values, _RelationshipLinker
+from .resolver import ResourceMetadata, ResourceResolver
+
+_validate_resource = DANJASingleResource.__pydantic_validator__.validate_python
+_dump_resource = DANJASingleResource.__pydantic_serializer__.to_json
+_links_adapter: TypeAdapter = TypeAdapter(DANJAResourceList.model_fields["links"].annotation)
+_meta_adapter: TypeAdapter = TypeAdapter(DANJAResourceList.model_fields["meta"].annotation)
+
+
+def splice_document(
+    data: bytes, included: Optional[bytes], links: Any, meta: Any, exclude_none: bool = False
+) -> bytes:
+    """
+    Write a document exactly like `model_dump_json` around already serialized `data`
+    and `included` JSON, `included` being None when the document has none
+    """
+    parts = [b'{"data":', data]
+    if links is not None or not exclude_none:
+        parts.append(b',"links":' + _links_adapter.dump_json(links, exclude_none=exclude_none))
+    if meta is not None or not exclude_none:
+        parts.append(b',"meta":' + _meta_adapter.dump_json(meta, exclude_none=exclude_none))
+    if included is not None:
+        parts.append(b',"included":' + included)
+    elif not exclude_none:
+        parts.append(b',"included":null')
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+class _DocumentWriter:
+    """
+    Incrementally writes a JSON:API resource list document. Resources are wrapped
+    exactly like `DANJAResourceList.from_basemodel_list`, with the resource name and
+    ID field resolved from the first resource written. Declared relationships share
+    identifiers within a chunk.
+    """
+
+    def __init__(
+        self, resource_name: Optional[str], resource_id: Optional[str], exclude_none: bool, chunk_size: int
+    ) -> None:
+        self.resource_name = resource_name
+        self.resource_id = resource_id
+        self.exclude_none = exclude_none
+        self.chunk_size = max(chunk_size, 1)
+        self.metadata: Optional[ResourceMetadata] = None
+        self.linker: Optional[_RelationshipLinker] = None
+        self.buffer: list[bytes] = [b'{"data":[']
+        self.count = 0
+
+    def _append(self, encoded: bytes) -> Optional[bytes]:
+        if self.count:
+            self.buffer.append(b",")
+        self.buffer.append(encoded)
+        self.count += 1
+        if self.count % self.chunk_size == 0:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[bytes]:
+        if not self.buffer:
+            return None
+        chunk = b"".join(self.buffer)
+        self.buffer = []
+        if self.linker:
+            # Start each chunk afresh so shared identifiers stay bounded
+            self.linker = _RelationshipLinker(self.linker.fields)
+        return chunk
+
+    def data(self, resource: Any) -> Optional[bytes]:
+        if self.metadata is None:
+            self.metadata = ResourceResolver.resolve(resource.__class__, self.resource_name, self.resource_id)
+            self.linker = _RelationshipLinker.for_class(resource.__class__)
+
+        return self.values(_linked_values(self.metadata, resource, self.linker))
+
+    def values(self, values: dict[str, Any]) -> Optional[bytes]:
+        return self._append(_dump_resource(_validate_resource(values), exclude_none=self.exclude_none))
+
+    def end_data(self) -> None:
+        self.buffer.append(b"]")
+        self.count = 0
+
+    def start_included(self) -> None:
+        self.buffer.append(b',"included":[')
+
+    def included(self, include: Any) -> Optional[bytes]:
+        if not isinstance(include, DANJASingleResource):
+            include = DANJASingleResource(**include)
+        return self._append(_dump_resource(include, exclude_none=self.exclude_none))
+
+    def end_included(self) -> None:
+        self.buffer.append(b"]")
+
+    def finish(self, links: Any, meta: Any, included: bool) -> bytes:
+        if not included and not self.exclude_none:
+            self.buffer.append(b',"included":null')
+        if links is not None or not self.exclude_none:
+            self.buffer.append(b',"links":' + _links_adapter.dump_json(links, exclude_none=self.exclude_none))
+        if meta is not None or not self.exclude_none:
+            self.buffer.append(b',"meta":' + _meta_adapter.dump_json(meta, exclude_none=self.exclude_none))
+        self.buffer.append(b"}")
+        return self.flush() or b""
+
+
+def stream_resource_list(
+    resources: Iterable[Any],
+    resource_name: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    included: Optional[Iterable[Any]] = None,
+    links: Optional[dict[str, Any]] = None,
+    meta: Optional[dict[str, Any]] = None,
+    exclude_none: bool = False,
+    chunk_size: int = 100,
+) -> Iterator[bytes]:
+    """
+    Encode an iterable of BaseModels as a JSON:API resource list document, yielding
+    bytes chunks of `chunk_size` resources so the whole document is never held in
+    memory. `data` is written first, followed by `included`, `links` and `meta`.
+    `included` takes DANJASingleResource instances or dicts like `include_from_basemodels`.
+    """
+    writer = _DocumentWriter(resource_name, resource_id, exclude_none, chunk_size)
+
+    for resource in resources:
+        chunk = writer.data(resource)
+        if chunk:
+            yield chunk
+    writer.end_data()
+
+    if included is not None:
+        writer.start_included()
+        for include in included:
+            chunk = writer.included(include)
+            if chunk:
+                yield chunk
+        writer.end_included()
+
+    yield writer.finish(links, meta, included is not None)
+
+
+def stream_columns(
+    columns: Columns,
+    model: Optional[type[BaseModel]] = None,
+    resource_name: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    included: Optional[Iterable[Any]] = None,
+    links: Optional[dict[str, Any]] = None,
+    meta: Optional[dict[str, Any]] = None,
+    exclude_none: bool = False,
+    chunk_size: int = 100,
+) -> Iterator[bytes]:
+    """
+    Encode column arrays as a JSON:API resource list document like `stream_resource_list`,
+    with resources built as in `DANJAResourceList.from_columns`
+    """
+    writer = _DocumentWriter(resource_name, resource_id, exclude_none, chunk_size)
+
+    for values in resource_rows(columns, model, resource_name, resource_id):
+        chunk = writer.values(values)
+        if chunk:
+            yield chunk
+    writer.end_data()
+
+    if included is not None:
+        writer.start_included()
+        for include in included:
+            chunk = writer.included(include)
+            if chunk:
+                yield chunk
+        writer.end_included()
+
+    yield writer.finish(links, meta, included is not None)
+
+
+async def _aiterate(items: Union[AsyncIterable[Any], Iterable[Any]]) -> AsyncIterator[Any]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def astream_resource_list(
+    resources: Union[AsyncIterable[Any], Iterable[Any]],
+    resource_name: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    included: Union[AsyncIterable[Any], Iterable[Any], None] = None,
+    links: Optional[dict[str, Any]] = None,
+    meta: Optional[dict[str, Any]] = None,
+    exclude_none: bool = False,
+    chunk_size: int = 100,
+) -> AsyncIterator[bytes]:
+    """
+    Async version of `stream_resource_list`, `resources` and `included` may be
+    async or regular iterables. Suitable for a FastAPI `StreamingResponse`.
+    """
+    writer = _DocumentWriter(resource_name, resource_id, exclude_none, chunk_size)
+
+    async for resource in _aiterate(resources):
+        chunk = writer.data(resource)
+        if chunk:
+            yield chunk
+    writer.end_data()
+
+    if included is not None:
+        writer.start_included()
+        async for include in _aiterate(included):
+            chunk = writer.included(include)
+            if chunk:
+                yield chunk
+        writer.end_included()
+
+    yield writer.finish(links, meta, included is not None)
@@ -0,0 +1,113 @@
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from pydanja import DANJAResource, DANJAResourceList, register_accessor
+from pydanja.adapters import accessor_for
+
+
+class Book(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "books"})
+
+    id: int
+    title: str
+    year: Optional[int] = None
+
+
+@dataclass
+class BookRow:
+    id: int
+    title: str
+    year: Optional[int] = None
+
+
+BookTuple = namedtuple("BookTuple", ["id", "title", "year"])
+
+
+class Row:
+    """Stands in for an ORM row exposing its columns as a mapping"""
+
+    def __init__(self, **columns):
+        self.columns = columns
+
+    @property
+    def _mapping(self):
+        return self.columns
+
+
+MODELS = [Book(id=1, title="Dune", year=1965), Book(id=2, title="Emma")]
+
+
+def expected():
+    return DANJAResourceList.from_basemodel_list(MODELS, resource_id="id").model_dump()
+
+
+@pytest.mark.parametrize(
+    "sources",
+    [
+        [{"id": 1, "title": "Dune", "year": 1965}, {"id": 2, "title": "Emma", "year": None}],
+        [BookRow(1, "Dune", 1965), BookRow(2, "Emma")],
+        [BookTuple(1, "Dune", 1965), BookTuple(2, "Emma", None)],
+        [Row(id=1, title="Dune", year=1965), Row(id=2, title="Emma", year=None)],
+    ],
+)
+def test_it_wraps_objects_like_basemodels(sources):
+    document = DANJAResourceList.from_objects(sources, resource_name="books")
+
+    assert document.model_dump() == expected()
+    assert document.data[0].attributes == {"id": 1, "title": "Dune", "year": 1965}
+
+
+def test_it_validates_attributes_when_asked():
+    document = DANJAResourceList[Book].from_objects([BookRow(1, "Dune", 1965), BookRow(2, "Emma")], validate=True)
+
+    assert document.resources == MODELS
+    assert document.data[0].type == "bookrow"
+
+    single = DANJAResource[Book].from_object({"id": 2, "title": "Emma"}, resource_name="books", validate=True)
+    assert single.resource == MODELS[1]
+    assert single.data.id == "2"
+
+
+def test_it_builds_accessors_once_per_class():
+    assert accessor_for(BookRow) is accessor_for(BookRow)
+
+
+def test_it_rejects_unsupported_sources_and_missing_ids():
+    with pytest.raises(TypeError):
+        DANJAResourceList.from_objects([object()], resource_name="things")
+    with pytest.raises(Exception):
+        DANJAResourceList.from_objects([BookTuple(1, "Dune", 1965)], resource_name="books", resource_id="isbn")
+
+
+@pytest.mark.parametrize("source", [{"id": 1, "title": "Dune"}, BookTuple(1, "Dune", 1965), Row(id=1, title="Dune")])
+def test_it_needs_a_resource_name_for_generic_sources(source):
+    with pytest.raises(Exception, match="No resource name"):
+        DANJAResource.from_object(source)
+    with pytest.raises(Exception, match="No resource name"):
+        DANJAResourceList.from_objects([BookRow(2, "Emma"), source])
+
+
+def test_it_uses_registered_accessors():
+    class Slotted:
+        __slots__ = ("id", "name")
+
+        def __init__(self, id, name):
+            self.id, self.name = id, name
+
+    class SlotsAccessor:
+        def attributes(self, source):
+            return {name: getattr(source, name) for name in source.__slots__}
+
+        def getter(self, field):
+            return lambda source: getattr(source, field)
+
+    register_accessor(lambda source_class: SlotsAccessor() if source_class is Slotted else None)
+
+    document = DANJAResource.from_object(Slotted(7, "seven"), resource_name="numbers")
+
+    assert document.data.id == "7"
+    assert document.data.attributes == {"id": 7, "name": "seven"}
@@ -0,0 +1,176 @@
+import asyncio
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+from pydanja import (
+    AtomicDispatcher,
+    DANJAAtomicOperations,
+    DANJAAtomicResource,
+    DANJALocalIdentifier,
+    ResourceTypeRegistry,
+)
+
+
+class Author(BaseModel):
+    author_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+
+
+class Post(BaseModel):
+    post_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    title: str
+
+
+def registry():
+    resource_types = ResourceTypeRegistry()
+    resource_types.register(Author, "authors")
+    resource_types.register(Post, "posts")
+    return resource_types
+
+
+PAYLOAD = {
+    "atomic:operations": [
+        {"op": "add", "data": {"type": "authors", "lid": "a1", "attributes": {"name": "Ada"}}},
+        {"op": "add", "data": {"type": "authors", "lid": "a2", "attributes": {"name": "Grace"}}},
+        {
+            "op": "add",
+            "data": {
+                "type": "posts",
+                "lid": "p1",
+                "attributes": {"title": "Engines"},
+                "relationships": {"author": {"data": {"type": "authors", "lid": "a1"}}},
+            },
+        },
+        {
+            "op": "update",
+            "ref": {"type": "posts", "lid": "p1", "relationship": "author"},
+            "data": {"type": "authors", "lid": "a2"},
+        },
+        {"op": "remove", "ref": {"type": "authors", "id": "9"}},
+    ]
+}
+
+
+def test_it_validates_operation_data_by_type():
+    operations = DANJAAtomicOperations.from_json_bytes(json.dumps(PAYLOAD), registry())
+
+    first, _, post, linkage, remove = operations.operations
+    assert isinstance(first.data, DANJAAtomicResource[Author])
+    assert isinstance(post.data.attributes, Post)
+    assert post.data.relationships["author"].data == DANJALocalIdentifier(type="authors", lid="a1")
+    assert linkage.relationship == "author" and linkage.data.lid == "a2"
+    assert remove.data is None and remove.resource_type == "authors"
+
+
+def test_errors_point_at_the_operation():
+    payload = {
+        "atomic:operations": [
+            {"op": "add", "data": {"type": "authors", "attributes": {"name": "Ada"}}},
+            {"op": "add", "data": {"type": "posts", "attributes": {"title": 3}}},
+            {
+                "op": "update",
+                "ref": {"type": "posts", "id": "1", "relationship": "author"},
+                "data": {"type": "authors"},
+            },
+        ]
+    }
+    with pytest.raises(ValidationError) as error:
+        DANJAAtomicOperations.model_validate(payload, context={"resource_types": registry()})
+
+    assert [detail["loc"] for detail in error.value.errors()] == [
+        ("atomic:operations", 1, "data", "attributes", "title")
+    ]
+    with pytest.raises(ValidationError):
+        DANJAAtomicOperations.model_validate({"atomic:operations": payload["atomic:operations"][2:]})
+
+
+def test_it_dispatches_runs_to_batch_handlers_resolving_local_ids():
+    calls = []
+
+    def add_authors(operations):
+        calls.append(("add authors", len(operations)))
+        return [
+            Author(id=index + 1, name=operation.data.attributes.name) for index, operation in enumerate(operations)
+        ]
+
+    async def add_posts(operations):
+        calls.append(("add posts", [operation.data.relationships["author"].data.id for operation in operations]))
+        return [Post(id=10, title=operation.data.attributes.title) for operation in operations]
+
+    def update_posts(operations):
+        calls.append(("update posts", [(operation.ref.id, operation.data.id) for operation in operations]))
+        return [None]
+
+    def remove_authors(operations):
+        calls.append(("remove authors", [operation.ref.id for operation in operations]))
+        return [None]
+
+    dispatcher = AtomicDispatcher()
+    dispatcher.register("authors", "add", add_authors)
+    dispatcher.register("posts", "add", add_posts)
+    dispatcher.register("posts", "update", update_posts)
+    dispatcher.register("authors", "remove", remove_authors)
+
+    operations = DANJAAtomicOperations.model_validate(PAYLOAD, context={"resource_types": registry()})
+    results = asyncio.run(dispatcher.dispatch(operations))
+
+    assert calls == [
+        ("add authors", 2),
+        ("add posts", ["1"]),
+        ("update posts", [("10", "2")]),
+        ("remove authors", ["9"]),
+    ]
+    document = json.loads(results.model_dump_json(exclude_none=True))
+    assert document["atomic:results"][0] == {
+        "data": {"id": "1", "type": "author", "attributes": {"author_id": 1, "name": "Ada"}}
+    }
+    assert document["atomic:results"][3:] == [{}, {}]
+
+
+def test_dispatch_needs_a_handler_and_a_result_per_operation():
+    operations = DANJAAtomicOperations.model_validate(PAYLOAD)
+    dispatcher = AtomicDispatcher()
+    with pytest.raises(ValueError, match="No handler for add operations on authors"):
+        asyncio.run(dispatcher.dispatch(operations))
+
+    dispatcher.register("authors", "add", lambda operations: [])
+    with pytest.raises(ValueError, match="returned 0 results for 2"):
+        asyncio.run(dispatcher.dispatch(operations))
+
+
+def test_a_run_ends_before_an_operation_referring_to_a_local_id_added_in_it():
+    payload = {
+        "atomic:operations": [
+            {"op": "add", "data": {"type": "authors", "lid": "a1", "attributes": {"name": "Ada"}}},
+            {"op": "add", "data": {"type": "authors", "lid": "a2", "attributes": {"name": "Grace"}}},
+            {
+                "op": "add",
+                "data": {
+                    "type": "authors",
+                    "lid": "a3",
+                    "attributes": {"name": "Alan"},
+                    "relationships": {"mentor": {"data": {"type": "authors", "lid": "a1"}}},
+                },
+            },
+        ]
+    }
+    batches = []
+    mentors = []
+
+    def add_authors(operations):
+        batches.append([operation.data.lid for operation in operations])
+        for operation in operations:
+            if operation.data.relationships:
+                mentors.append(operation.data.relationships["mentor"].data.id)
+        return [Author(id=len(batches) * 10 + index, name="") for index in range(len(operations))]
+
+    dispatcher = AtomicDispatcher()
+    dispatcher.register("authors", "add", add_authors)
+    results = asyncio.run(dispatcher.dispatch(DANJAAtomicOperations.model_validate(payload)))
+
+    assert batches == [["a1", "a2"], ["a3"]]
+    assert mentors == ["10"]
+    assert len(results.results) == 3
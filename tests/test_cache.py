@@ -0,0 +1,111 @@
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from pydanja import DANJAResource, DANJAResourceList, ResourceCache
+from pydanja.cache import etag_matches
+
+
+class Product(BaseModel):
+    product_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+    revision: int = 1
+
+
+def products(revision=1):
+    return [Product(id=index, name=f"P{index}", revision=revision) for index in range(1, 4)]
+
+
+def by_revision(resource):
+    return resource.attributes.revision
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_it_splices_cached_fragments_into_the_same_json():
+    cache = ResourceCache(ttl=60)
+    document = DANJAResourceList.from_basemodel_list(products())
+    document.include_from_basemodels([{"type": "makers", "id": "1", "attributes": {"name": "Acme"}}])
+    document.meta = {"total": 3}
+
+    for exclude_none in (False, True):
+        assert cache.dump_json(document, exclude_none) == document.model_dump_json(exclude_none=exclude_none).encode()
+    single = DANJAResource.from_basemodel(products()[0])
+    assert cache.dump_json(single) == single.model_dump_json().encode()
+    assert cache.dump_json(single, by_alias=True) == single.model_dump_json(by_alias=True).encode()
+
+    cache.dump_json(document)
+    assert cache.stats.hits == 5
+    assert cache.stats.misses == 9
+    assert cache.stats.size == 9
+
+
+def test_it_keys_fragments_on_version_and_evicts_least_recently_used():
+    cache = ResourceCache(maxsize=3, version=by_revision)
+
+    cache.dump_json(DANJAResourceList.from_basemodel_list(products()))
+    updated = DANJAResourceList.from_basemodel_list(products(revision=2))
+    assert json.loads(cache.dump_json(updated))["data"][0]["attributes"]["revision"] == 2
+
+    assert cache.stats.misses == 6
+    assert cache.stats.evictions == 3
+    assert cache.invalidate("product", 1) == 1
+    assert cache.invalidate() == 2
+
+
+def test_it_expires_entries_after_the_ttl():
+    clock = Clock()
+    cache = ResourceCache(ttl=10, clock=clock)
+    document = DANJAResourceList.from_basemodel_list(products())
+
+    cache.dump_json(document)
+    clock.now = 5
+    cache.dump_json(document)
+    clock.now = 20
+    cache.dump_json(document)
+
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.expirations) == (3, 6, 3)
+
+
+def test_it_answers_matching_conditional_requests_without_serializing():
+    cache = ResourceCache(version=by_revision)
+    document = DANJAResourceList.from_basemodel_list(products())
+
+    body, etag = cache.conditional(document)
+    assert body == document.model_dump_json().encode()
+
+    assert cache.conditional(document, f'W/{etag}, "other"') == (None, etag)
+    assert cache.stats.misses == 3 and cache.stats.hits == 0
+
+    changed = DANJAResourceList.from_basemodel_list(products(revision=2))
+    body, changed_etag = cache.conditional(changed, etag)
+    assert body is not None and changed_etag != etag
+
+
+def test_unversioned_entries_expire_so_etags_follow_changes():
+    with pytest.raises(ValueError, match="version reader or a ttl"):
+        ResourceCache()
+
+    clock = Clock()
+    cache = ResourceCache(ttl=10, clock=clock)
+    stale = cache.etag(DANJAResourceList.from_basemodel_list(products()))
+    changed = DANJAResourceList.from_basemodel_list(products(revision=2))
+    assert cache.etag(changed) == stale
+    clock.now = 10
+    assert cache.etag(changed) != stale
+
+
+def test_it_compares_etags_weakly():
+    assert etag_matches('"a"', '"a"')
+    assert etag_matches('W/"a"', '"a"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches('"b", "c"', '"a"')
+    assert not etag_matches(None, '"a"')
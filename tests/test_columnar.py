@@ -0,0 +1,85 @@
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from pydanja import DANJAResourceList, stream_columns
+
+
+class Sale(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "sales"})
+
+    sale_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    region: str
+    total: Optional[float] = None
+
+
+COLUMNS = {"sale_id": [1, 2, 3], "region": ["EU", "US", "APAC"], "total": [10.5, None, 7.0], "ignored": [0, 0, 0]}
+
+MODELS = [Sale(id=1, region="EU", total=10.5), Sale(id=2, region="US"), Sale(id=3, region="APAC", total=7.0)]
+
+
+def test_it_builds_the_same_document_as_from_basemodel_list():
+    document = DANJAResourceList.from_columns(COLUMNS, Sale)
+
+    assert document.model_dump() == DANJAResourceList.from_basemodel_list(MODELS).model_dump()
+    assert document.data[0].attributes == {"sale_id": 1, "region": "EU", "total": 10.5}
+
+
+def test_it_validates_into_the_model_when_asked():
+    document = DANJAResourceList[Sale].from_columns(COLUMNS, Sale, validate=True)
+
+    assert document.resources == MODELS
+    assert [resource.id for resource in document.data] == ["1", "2", "3"]
+
+
+def test_it_builds_from_columns_without_a_model():
+    document = DANJAResourceList.from_columns(
+        {"code": ("a", "b"), "rate": (1, 2)}, resource_name="currencies", resource_id="code"
+    )
+
+    assert [(resource.type, resource.id, resource.attributes) for resource in document.data] == [
+        ("currencies", "a", {"code": "a", "rate": 1}),
+        ("currencies", "b", {"code": "b", "rate": 2}),
+    ]
+    with pytest.raises(Exception):
+        DANJAResourceList.from_columns({"code": ["a"]}, resource_name="currencies")
+
+
+def test_it_rejects_uneven_columns():
+    with pytest.raises(ValueError):
+        DANJAResourceList.from_columns({"sale_id": [1, 2], "region": ["EU"]}, Sale)
+
+
+def test_it_builds_from_record_tuples():
+    document = DANJAResourceList.from_records(
+        [(1, "EU", 10.5), (2, "US", None), (3, "APAC", 7.0)], Sale, names=["id", "region", "total"]
+    )
+
+    assert document.model_dump() == DANJAResourceList.from_basemodel_list(MODELS).model_dump()
+
+
+def test_it_converts_numpy_columns_and_records():
+    numpy = pytest.importorskip("numpy")
+
+    totals = numpy.ma.masked_array([10.5, 0.0, 7.0], mask=[False, True, False])
+    document = DANJAResourceList.from_columns(
+        {"sale_id": numpy.arange(1, 4), "region": numpy.array(["EU", "US", "APAC"]), "total": totals}, Sale
+    )
+    assert document.model_dump() == DANJAResourceList.from_basemodel_list(MODELS).model_dump()
+
+    records = numpy.array([(1, "EU", 10.5), (2, "US", 1.0)], dtype=[("id", "i8"), ("region", "U8"), ("total", "f8")])
+    document = DANJAResourceList[Sale].from_records(records, Sale, validate=True)
+    assert document.resources == [Sale(id=1, region="EU", total=10.5), Sale(id=2, region="US", total=1.0)]
+
+
+def test_it_streams_columns():
+    chunks = list(stream_columns(COLUMNS, Sale, meta={"count": 3}, chunk_size=2))
+
+    assert len(chunks) == 2
+    assert json.loads(b"".join(chunks)) == json.loads(
+        DANJAResourceList.from_basemodel_list(MODELS, trusted=True)
+        .model_copy(update={"meta": {"count": 3}})
+        .model_dump_json()
+    )
@@ -0,0 +1,100 @@
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from pydanja import CompoundDocument, DANJAResource, DANJAResourceList, DANJASingleResource
+
+
+class Article(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "articles"})
+
+    article_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    title: str
+
+
+class Person(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "people"})
+
+    person_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+
+
+def identifiers(resources):
+    return [(resource.type, resource.id) for resource in resources]
+
+
+def test_it_deduplicates_included_across_batches():
+    document = DANJAResourceList.from_basemodel_list([Article(id=index, title=f"A{index}") for index in range(1, 4)])
+    compound = CompoundDocument(document)
+
+    assert compound.add_included([Person(id=1, name="Ada"), Person(id=2, name="Grace"), Person(id=1, name="Ada")]) == 2
+    assert compound.add_included([Person(id=2, name="Grace"), Person(id=3, name="Linus")]) == 1
+    assert compound.add_included([{"type": "people", "id": "3", "attributes": {"name": "Linus"}}]) == 0
+    assert ("people", "3", None) in compound
+
+    compound.build()
+
+    assert identifiers(document.included) == [("people", "1"), ("people", "2"), ("people", "3")]
+    assert all(isinstance(resource, DANJASingleResource) for resource in document.included)
+    assert document.included[0].attributes == Person(id=1, name="Ada")
+
+
+def test_it_skips_resources_in_primary_data():
+    document = DANJAResource.from_basemodel(Article(id=1, title="Hello"))
+    compound = CompoundDocument(document)
+
+    added = compound.add_included(
+        [
+            Article(id=1, title="Hello"),
+            Article(id=2, title="Related"),
+            DANJASingleResource(type="articles", id="1", attributes={"title": "Hello"}),
+        ]
+    )
+
+    assert added == 1
+    assert identifiers(compound.build().included) == [("articles", "2")]
+
+
+def test_it_keeps_existing_included_and_unidentified_resources():
+    document = DANJAResource.from_basemodel(Article(id=1, title="Hello"))
+    document.include_from_basemodels([{"type": "people", "id": "9", "attributes": {"name": "Ada"}}])
+    compound = CompoundDocument(document)
+
+    compound.add_included([{"type": "people", "id": "9", "attributes": {"name": "Ada"}}])
+    compound.add_included([{"type": "people", "lid": "new", "attributes": {"name": "Local"}}] * 2)
+    compound.add_included([{"type": "people", "attributes": {"name": "Anonymous"}}] * 2)
+
+    assert len(compound) == 4
+    assert [(resource.id, resource.lid) for resource in compound.build().included] == [
+        ("9", None),
+        (None, "new"),
+        (None, None),
+        (None, None),
+    ]
+
+
+def test_it_builds_no_included_when_empty():
+    document = DANJAResource.from_basemodel(Article(id=1, title="Hello"))
+
+    assert CompoundDocument(document).build().included is None
+
+
+def test_it_rejects_unknown_resources():
+    compound = CompoundDocument(DANJAResource.from_basemodel(Article(id=1, title="Hello")))
+
+    with pytest.raises(TypeError):
+        compound.add_included([object()])
+
+
+def test_it_links_declared_relationships_of_included_models():
+    class Book(BaseModel):
+        book_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+        author_id: Optional[int] = Field(default=None, json_schema_extra={"relationship": "author"})
+
+    compound = CompoundDocument(DANJAResource.from_basemodel(Article(id=1, title="Hello")))
+    compound.add_included([Book(id=5, author_id=7)])
+    included = compound.build().included
+
+    assert included[0].relationships == DANJAResource.from_basemodel(Book(id=5, author_id=7)).data.relationships
+    assert included[0].relationships["author"].data.id == "7"
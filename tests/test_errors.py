@@ -0,0 +1,88 @@
+import json
+
+from pydantic import BaseModel, ValidationError
+
+from pydanja import DANJAResourceList, danja_errors, danja_errors_json
+from pydanja.errors import document_pointer, pointer_builder
+
+
+class Reading(BaseModel):
+    label: str
+    value: float
+
+
+def invalid_document(size=5):
+    return {
+        "data": [
+            {
+                "type": "readings",
+                "attributes": {"label": index, "value": "high"},
+                "relationships": {"sensor": {"data": {"type": "sensors"}}},
+            }
+            for index in range(size)
+        ]
+    }
+
+
+def validation_error(document):
+    try:
+        DANJAResourceList[Reading].model_validate(document)
+    except ValidationError as error:
+        return error
+    raise AssertionError("The document is valid")
+
+
+def test_it_points_at_members_without_union_labels():
+    document = invalid_document(1)
+    error = validation_error(document)
+
+    errors = danja_errors(error, DANJAResourceList[Reading])
+
+    assert [(item.code, item.source.pointer) for item in errors.errors] == [
+        ("string_type", "/data/0/attributes/label"),
+        ("float_parsing", "/data/0/attributes/value"),
+        ("missing", "/data/0/relationships/sensor/data/id"),
+        ("list_type", "/data/0/relationships/sensor/data"),
+    ]
+    assert [item.source.pointer for item in danja_errors(error, document=document).errors] == [
+        item.source.pointer for item in errors.errors
+    ]
+    assert errors.errors[0].status == "422" and errors.errors[0].detail == "Input should be a valid string"
+
+
+def test_pointers_are_escaped_and_follow_the_document():
+    assert pointer_builder().pointer(("meta", "a/b~c", 0)) == "/meta/a~1b~0c/0"
+    document = {"data": {"attributes": {}}}
+    assert (
+        document_pointer(("data", "Tagged", "attributes", "name"), document, missing=True) == "/data/attributes/name"
+    )
+    assert document_pointer(("data", "attributes", "list[str]"), document) == "/data/attributes"
+
+
+def test_it_caps_and_aggregates_errors():
+    error = validation_error(invalid_document(50))
+
+    capped = danja_errors(error, max_errors=10)
+    assert len(capped.errors) == 11
+    assert capped.errors[-1].code == "too_many_errors" and capped.errors[-1].meta == {"total": 200}
+
+    aggregated = danja_errors(error, aggregate=True)
+    assert [(item.code, item.source.pointer, item.meta) for item in aggregated.errors] == [
+        ("string_type", "/data/0/attributes/label", {"count": 50}),
+        ("float_parsing", "/data/0/attributes/value", {"count": 50}),
+        ("missing", "/data/0/relationships/sensor/data/id", {"count": 50}),
+        ("list_type", "/data/0/relationships/sensor/data", {"count": 50}),
+    ]
+    assert len(danja_errors(error, aggregate=True, max_errors=1).errors) == 2
+
+
+def test_it_serializes_without_empty_members():
+    payload = json.loads(danja_errors_json(validation_error(invalid_document(1)), max_errors=1))
+
+    assert payload["errors"][0] == {
+        "status": "422",
+        "code": "string_type",
+        "title": "Invalid value",
+        "detail": "Input should be a valid string",
+        "source": {"pointer": "/data/0/attributes/label"},
+    }
@@ -0,0 +1,76 @@
+import json
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from pydanja import DANJAResource, DANJAResourceList, parse_fieldsets, sparse_fieldsets
+
+
+class Article(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "articles"})
+
+    article_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    title: str
+    body: str
+    published_at: Optional[str] = Field(alias="publishedAt", default=None)
+
+
+def articles_document() -> DANJAResourceList:
+    document = DANJAResourceList.from_basemodel_list(
+        [Article(id=index, title=f"A{index}", body="...", publishedAt="2024") for index in range(1, 4)]
+    )
+    document.include_from_basemodels(
+        [
+            {"type": "people", "id": "1", "attributes": {"name": "Ada", "email": "ada@example.com"}},
+            {"type": "comments", "id": "9", "attributes": {"body": "Nice"}},
+        ]
+    )
+    return document
+
+
+def test_it_parses_fieldsets_from_query_parameters():
+    assert parse_fieldsets({"fields[articles]": "title,body", "fields[people]": "", "page[size]": "10"}) == {
+        "articles": frozenset({"title", "body"}),
+        "people": frozenset(),
+    }
+    assert parse_fieldsets([("fields[articles]", "title")]) == {"articles": frozenset({"title"})}
+
+
+def test_it_restricts_data_and_included_by_type():
+    document = articles_document()
+
+    dumped = document.model_dump_sparse({"articles": ["title"], "people": ["name"]})
+
+    assert [resource["attributes"] for resource in dumped["data"]] == [{"title": f"A{index}"} for index in range(1, 4)]
+    assert [resource["id"] for resource in dumped["data"]] == ["1", "2", "3"]
+    assert dumped["included"][0]["attributes"] == {"name": "Ada"}
+    assert dumped["included"][1]["attributes"] == {"body": "Nice"}
+
+
+def test_it_accepts_attribute_aliases_and_matches_json_output():
+    document = articles_document()
+    fieldsets = {"articles": {"publishedAt"}}
+
+    dumped = json.loads(document.model_dump_json_sparse(fieldsets, by_alias=True, exclude_none=True))
+
+    assert dumped["data"][0] == {"id": "1", "type": "articles", "attributes": {"publishedAt": "2024"}}
+    assert dumped == document.model_dump_sparse(fieldsets, mode="json", by_alias=True, exclude_none=True)
+
+
+def test_it_leaves_documents_without_fieldsets_whole():
+    document = articles_document()
+
+    assert document.model_dump_sparse({}) == document.model_dump()
+    assert document.model_dump_sparse({"tags": ["name"]}) == document.model_dump()
+
+
+def test_it_restricts_a_single_resource():
+    document = DANJAResource.from_basemodel(Article(id=1, title="A1", body="..."))
+
+    assert sparse_fieldsets(document, {"articles": []})["data"]["attributes"] == set()
+    assert document.model_dump_sparse({"articles": []})["data"]["attributes"] == {}
+    assert document.model_dump_sparse({"articles": ["body"]}, exclude_none=True)["data"] == {
+        "id": "1",
+        "type": "articles",
+        "attributes": {"body": "..."},
+    }
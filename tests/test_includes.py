@@ -0,0 +1,95 @@
+import asyncio
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from pydanja import DANJARelationship, DANJAResourceList, IncludeResolver, InMemoryLoader, parse_include
+
+
+class Person(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "people"})
+
+    person_id: int = Field(json_schema_extra={"resource_id": True})
+    name: str
+
+
+class Comment(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "comments"})
+
+    comment_id: int = Field(json_schema_extra={"resource_id": True})
+    body: str
+    author_id: int = Field(json_schema_extra={"relationship": "author", "resource_type": "people"})
+
+
+class Article(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "articles"})
+
+    article_id: int = Field(json_schema_extra={"resource_id": True})
+    author_id: Optional[int] = Field(
+        default=None, json_schema_extra={"relationship": "author", "resource_type": "people"}
+    )
+    comment_ids: list[int] = Field(
+        default=[], json_schema_extra={"relationship": "comments", "resource_type": "comments"}
+    )
+
+
+PEOPLE = {index: Person(person_id=index, name=f"P{index}") for index in range(1, 6)}
+COMMENTS = {index: Comment(comment_id=index, body=f"C{index}", author_id=index % 5 + 1) for index in range(1, 7)}
+ARTICLES = [
+    Article(article_id=1, author_id=1, comment_ids=[1, 2]),
+    Article(article_id=2, author_id=1, comment_ids=[2, 3, 4]),
+    Article(article_id=3, comment_ids=[5, 6]),
+]
+
+
+def resolver():
+    include_resolver = IncludeResolver()
+    people, comments = InMemoryLoader(PEOPLE), InMemoryLoader(COMMENTS)
+    include_resolver.register("people", people)
+    include_resolver.register("comments", comments)
+    return include_resolver, people, comments
+
+
+def test_it_parses_include_paths():
+    assert parse_include("author, comments.author,comments") == {"author": {}, "comments": {"author": {}}}
+    assert parse_include(["a.b.c", "a.d"]) == {"a": {"b": {"c": {}}, "d": {}}}
+
+
+def test_it_loads_each_type_once_per_level():
+    include_resolver, people, comments = resolver()
+    document = DANJAResourceList.from_basemodel_list(ARTICLES)
+
+    asyncio.run(include_resolver.include(document, "author,comments.author"))
+
+    assert comments.calls == [["1", "2", "3", "4", "5", "6"]]
+    # Authors of articles on the first level, then the comment authors still missing
+    assert people.calls == [["1"], ["2", "3", "4", "5"]]
+    assert [(resource.type, resource.id) for resource in document.included] == [
+        ("people", "1"),
+        *[("comments", str(index)) for index in range(1, 7)],
+        *[("people", str(index)) for index in range(2, 6)],
+    ]
+
+
+def test_it_skips_resources_already_in_the_document():
+    include_resolver, people, _ = resolver()
+    document = DANJAResourceList.from_basemodel_list([PEOPLE[1], PEOPLE[2]])
+    document.data[0].relationships = {"friend": DANJARelationship(data={"type": "people", "id": "2"})}
+
+    asyncio.run(include_resolver.include(document, "friend"))
+
+    assert people.calls == []
+    assert document.included is None
+
+
+def test_it_accepts_sync_loaders_and_rejects_unknown_types():
+    include_resolver = IncludeResolver()
+    include_resolver.register("people", lambda ids: [PEOPLE[int(resource_id)] for resource_id in ids])
+    document = DANJAResourceList.from_basemodel_list(ARTICLES[:1])
+
+    asyncio.run(include_resolver.include(document, ["author"]))
+    assert [resource.attributes for resource in document.included] == [PEOPLE[1]]
+
+    with pytest.raises(ValueError):
+        asyncio.run(include_resolver.include(document, "comments"))
@@ -0,0 +1,96 @@
+import json
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from pydanja import (
+    DANJAResource,
+    DANJAResourceList,
+    ResourceCache,
+    ResourceTypeRegistry,
+    StageCollector,
+    add_hook,
+    instrument,
+    parallel_dump_json,
+    remove_hook,
+)
+from pydanja.instrumentation import _hooks
+
+
+class Sensor(BaseModel):
+    sensor_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+
+
+class Site(BaseModel):
+    site_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    city: str
+
+
+def sensors(count=3):
+    return [Sensor(id=index, name=f"S{index}") for index in range(1, count + 1)]
+
+
+def test_it_records_building_stages_with_counts():
+    with instrument() as collector:
+        document = DANJAResourceList.from_basemodel_list(sensors())
+        document.include_from_basemodels([{"type": "sites", "id": "1", "attributes": {"city": "Oslo"}}])
+
+    assert collector.stages == ["resolve", "wrap", "validate", "included"]
+    assert collector.counts() == {"resolve": 1, "wrap": 3, "validate": 3, "included": 1}
+    assert all(duration >= 0 for duration in collector.totals().values())
+
+
+def test_trusted_building_skips_validation():
+    with instrument() as collector:
+        DANJAResourceList.from_basemodel_list(sensors(), trusted=True)
+        DANJAResource.from_basemodel(sensors()[0], trusted=True)
+
+    assert collector.stages == ["resolve", "wrap", "resolve", "wrap"]
+
+
+def test_it_records_validation_and_typed_included():
+    registry = ResourceTypeRegistry()
+    registry.register(Site)
+    payload = {
+        "data": [{"id": "1", "type": "sensor", "attributes": {"id": 1, "name": "S1"}}],
+        "included": [{"id": "1", "type": "site", "attributes": {"id": 1, "city": "Oslo"}}],
+    }
+
+    with instrument() as collector:
+        DANJAResourceList[Sensor].model_validate(payload, context={"resource_types": registry})
+        DANJAResourceList[Sensor].from_json_bytes(json.dumps(payload))
+
+    assert collector.stages == ["validate", "included", "validate"]
+    assert collector.counts() == {"validate": 2, "included": 1}
+
+
+def test_it_records_serialization():
+    document = DANJAResourceList.from_basemodel_list(sensors(), trusted=True)
+
+    with instrument() as collector:
+        parallel_dump_json(document)
+        ResourceCache(ttl=60).dump_json(document)
+
+    assert collector.records[0].stage == "serialize"
+    assert collector.counts() == {"serialize": 6}
+
+
+def test_hooks_are_removed_and_disabled_stages_are_not_reported():
+    calls = []
+
+    def hook(stage, duration, count):
+        calls.append(stage)
+
+    add_hook(hook)
+    DANJAResource.from_basemodel(sensors()[0])
+    remove_hook(hook)
+    DANJAResource.from_basemodel(sensors()[0])
+
+    assert calls == ["resolve", "wrap", "validate"]
+    assert _hooks == []
+
+    collector = StageCollector()
+    with instrument(collector) as installed:
+        assert installed is collector
+    assert _hooks == []
@@ -0,0 +1,87 @@
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+from pydanja import DANJAResource, DANJAResourceList
+
+
+class JSONTestType(BaseModel):
+    json_testtype_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+
+
+SINGLE = {
+    "data": {"id": "1", "type": "jsontesttype", "attributes": {"id": 1, "name": "One"}},
+    "links": {"self": {"href": "http://localhost/1"}},
+    "included": [{"id": "200", "type": "other", "attributes": {"title": "Other"}}],
+}
+LIST = {
+    "data": [
+        {"id": "1", "type": "jsontesttype", "attributes": {"id": 1, "name": "One"}},
+        {"type": "jsontesttype", "attributes": {"name": "Two"}},
+    ],
+    "meta": {"total": 2},
+    "included": [{"id": "200", "type": "other", "attributes": {"title": "Other"}}],
+}
+
+
+@pytest.mark.parametrize(
+    "container, payload",
+    [
+        (DANJAResource[JSONTestType], SINGLE),
+        (DANJAResourceList[JSONTestType], LIST),
+        (DANJAResourceList[JSONTestType], {"data": []}),
+    ],
+)
+@pytest.mark.parametrize("encode", [json.dumps, lambda payload: json.dumps(payload).encode()])
+def test_it_validates_json_like_python_payloads(container, payload, encode):
+    from_json = container.from_json_bytes(encode(payload))
+    from_python = container.model_validate(payload)
+
+    assert type(from_json) is container
+    assert from_json == from_python
+    assert from_json.model_fields_set == from_python.model_fields_set
+    assert from_json.included == payload.get("included")
+
+
+def test_it_validates_typed_attributes_from_json():
+    resource_list = DANJAResourceList[JSONTestType].from_json_bytes(json.dumps(LIST))
+
+    assert resource_list.resources == [JSONTestType(id=1, name="One"), JSONTestType(name="Two")]
+
+
+def test_it_rejects_invalid_json_payloads():
+    payload = {"data": [{"type": "jsontesttype", "attributes": {"id": "not a number"}}]}
+
+    with pytest.raises(ValidationError) as exc:
+        DANJAResourceList[JSONTestType].from_json_bytes(json.dumps(payload))
+
+    locations = {error["loc"] for error in exc.value.errors()}
+    assert ("data", 0, "attributes", "id") in locations
+    assert ("data", 0, "attributes", "name") in locations
+
+
+class StrictDocument(DANJAResourceList[JSONTestType]):
+    model_config = ConfigDict(extra="forbid")
+
+    @field_validator("meta")
+    @classmethod
+    def _no_total(cls, meta):
+        if meta and "total" in meta:
+            raise ValueError("total is not allowed")
+        return meta
+
+
+def test_subclasses_keep_their_config_and_validators():
+    for payload in ({**LIST, "extra": 1}, {**LIST, "included": None}):
+        with pytest.raises(ValidationError):
+            StrictDocument.model_validate_json(json.dumps(payload))
+        with pytest.raises(ValidationError):
+            StrictDocument.from_json_bytes(json.dumps(payload))
+
+    valid = {**LIST, "meta": {"count": 2}}
+    document = StrictDocument.from_json_bytes(json.dumps(valid))
+    assert type(document) is StrictDocument
+    assert document.included == LIST["included"]
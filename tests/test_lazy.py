@@ -0,0 +1,88 @@
+import json
+from typing import ClassVar, Optional
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+from pydanja import DANJADocumentView, DANJAResourceList, DANJASingleResource, ResourceTypeRegistry
+
+
+class Track(BaseModel):
+    track_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    title: str
+    seconds: int
+
+
+class Artist(BaseModel):
+    name: str
+
+
+class CountingTrack(Track):
+    validations: ClassVar[int] = 0
+
+    def model_post_init(self, context) -> None:
+        CountingTrack.validations += 1
+
+
+PAYLOAD = {
+    "data": [
+        {"id": str(index), "type": "track", "attributes": {"id": index, "title": f"T{index}", "seconds": index * 60}}
+        for index in range(1, 6)
+    ],
+    "links": {"self": "/tracks"},
+    "meta": {"total": 5},
+    "included": [{"id": "1", "type": "artist", "attributes": {"name": "Nina"}}],
+}
+
+
+def test_it_builds_attributes_only_when_read():
+    CountingTrack.validations = 0
+    view = DANJADocumentView(json.dumps(PAYLOAD).encode(), CountingTrack)
+
+    assert len(view) == 5
+    assert list(view.ids()) == ["1", "2", "3", "4", "5"]
+    assert CountingTrack.validations == 0
+
+    track = view.get("3")
+    assert track.title == "T3" and view.get(3) is track
+    assert view[2] is track and view[-3] is track
+    assert view.get("9") is None
+    assert CountingTrack.validations == 1
+
+
+def test_iterating_without_cache_holds_one_resource_at_a_time():
+    CountingTrack.validations = 0
+    view = DANJADocumentView(PAYLOAD, CountingTrack)
+
+    assert [track.seconds for track in view.iter_attributes(cache=False)] == [60, 120, 180, 240, 300]
+    assert view._attributes == {}
+    assert [track.title for track in view][-1] == "T5"
+    assert len(view._attributes) == 5
+    assert CountingTrack.validations == 10
+
+
+def test_it_materializes_the_same_document():
+    registry = ResourceTypeRegistry()
+    registry.register(Artist, "artist")
+    view = DANJADocumentView(PAYLOAD, Track, resource_types=registry)
+
+    resource = view.get_resource("2")
+    assert isinstance(resource, DANJASingleResource[Track]) and view.resource(1) is resource
+    assert view.links == {"self": "/tracks"} and view.meta == {"total": 5}
+    assert isinstance(view.included[0].attributes, Artist)
+
+    document = view.materialize()
+    expected = DANJAResourceList[Track].model_validate(PAYLOAD, context={"resource_types": registry})
+    assert document.model_dump() == expected.model_dump()
+    assert document.data[1] is resource
+
+
+def test_it_checks_the_envelope_up_front_and_attributes_on_access():
+    with pytest.raises(ValidationError):
+        DANJADocumentView({"data": [{"id": "1", "attributes": {}}]}, Track)
+
+    view = DANJADocumentView({"data": {"id": "1", "type": "track", "attributes": {"title": "T"}}}, Track)
+    assert not view.many and list(view.ids()) == ["1"]
+    with pytest.raises(ValidationError):
+        view.get("1")
+    assert view.raw(0)["attributes"] == {"title": "T"}
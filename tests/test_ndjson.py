@@ -0,0 +1,90 @@
+import asyncio
+import io
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from pydanja import (
+    DANJAResourceList,
+    DANJASingleResource,
+    NDJSONReader,
+    ResourceTypeRegistry,
+    awrite_ndjson,
+    write_ndjson,
+)
+
+
+class Shipment(BaseModel):
+    shipment_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    carrier: str
+    courier_id: Optional[int] = Field(default=None, json_schema_extra={"relationship": "courier"})
+
+
+class Courier(BaseModel):
+    courier_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+
+
+SHIPMENTS = [Shipment(id=index, carrier=f"C{index}", courier_id=index % 2) for index in range(1, 8)]
+
+
+def test_it_writes_one_resource_per_line_like_from_basemodel_list():
+    chunks = list(write_ndjson(iter(SHIPMENTS), batch_size=3))
+
+    assert len(chunks) == 3
+    lines = b"".join(chunks).splitlines()
+    expected = DANJAResourceList.from_basemodel_list(SHIPMENTS).model_dump(mode="json")["data"]
+    assert [json.loads(line) for line in lines] == expected
+
+
+def test_it_writes_asynchronously():
+    async def shipments():
+        for shipment in SHIPMENTS:
+            yield shipment
+
+    async def collect():
+        return [chunk async for chunk in awrite_ndjson(shipments(), exclude_none=True, batch_size=5)]
+
+    assert b"".join(asyncio.run(collect())) == b"".join(write_ndjson(SHIPMENTS, exclude_none=True))
+
+
+@pytest.mark.parametrize("chunk_size", [7, 65536])
+def test_it_reads_typed_resources_in_batches(chunk_size):
+    source = io.BytesIO(b"".join(write_ndjson(SHIPMENTS)) + b"\n\n")
+    reader = NDJSONReader(source, Shipment, batch_size=3, chunk_size=chunk_size)
+
+    batches = list(reader.batches())
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    resources = [resource for batch in batches for resource in batch]
+    assert [resource.id for resource in resources] == [str(shipment.shipment_id) for shipment in SHIPMENTS]
+    assert [resource.attributes.carrier for resource in resources] == [shipment.carrier for shipment in SHIPMENTS]
+    assert isinstance(batches[0][0], DANJASingleResource[Shipment])
+    assert reader.count == 7
+
+
+def test_it_reads_mixed_types_and_async_sources():
+    registry = ResourceTypeRegistry()
+    registry.register(Shipment)
+    registry.register(Courier)
+    lines = list(write_ndjson(SHIPMENTS[:2])) + list(write_ndjson([Courier(id=1, name="Ada")]))
+
+    async def chunks():
+        for line in lines:
+            yield line
+
+    async def collect():
+        return [resource async for resource in NDJSONReader(chunks(), resource_types=registry)]
+
+    resources = asyncio.run(collect())
+    assert [type(resource.attributes) for resource in resources] == [Shipment, Shipment, Courier]
+
+
+def test_it_reports_the_invalid_line():
+    lines = list(write_ndjson(SHIPMENTS[:2]))
+    source = lines + [b"\n", b'{"type": "shipment", "attributes": {"id": 3}}\n']
+
+    with pytest.raises(ValueError, match="line 4"):
+        list(NDJSONReader(source, Shipment))
@@ -0,0 +1,83 @@
+import copy
+import json
+
+from pydanja import danja_openapi
+
+
+def ref(name: str) -> dict:
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def response(schema: dict) -> dict:
+    return {"get": {"responses": {"200": {"content": {"application/json": {"schema": schema}}}}}}
+
+
+SCHEMA = {
+    "openapi": "3.1.0",
+    "paths": {
+        "/": response({"anyOf": [ref("DANJAResource_Thing_"), ref("DANJAError")]}),
+        "/list": response({"anyOf": [ref("DANJAResourceList_Thing_"), ref("DANJAErrorList")]}),
+    },
+    "components": {
+        "schemas": {
+            "DANJAError": {"properties": {"title": {"type": "string"}}, "type": "object"},
+            "DANJAErrorList": {"properties": {"errors": {"items": ref("DANJAError")}}, "type": "object"},
+            "DANJASingleResource_Thing_": {"properties": {"attributes": ref("Thing")}, "type": "object"},
+            "DANJAResource_Thing_": {"properties": {"data": ref("DANJASingleResource_Thing_")}, "type": "object"},
+            "DANJAResourceList_Thing_": {
+                "properties": {"data": {"items": ref("DANJASingleResource_Thing_")}},
+                "type": "object",
+            },
+            "Thing": {"properties": {"name": {"type": "string"}}, "type": "object"},
+        }
+    },
+}
+THING = {"properties": {"name": {"type": "string"}}, "type": "object"}
+
+
+def test_it_renames_and_flattens_danja_schemas():
+    schema = danja_openapi(copy.deepcopy(SCHEMA), cache=False)
+
+    schemas = schema["components"]["schemas"]
+    assert list(schemas) == ["DANJAError", "Error_List", "Thing", "Thing_List"]
+    assert schemas["Thing"] == {
+        "properties": {"data": {"properties": {"attributes": THING}, "type": "object"}},
+        "type": "object",
+    }
+    assert schemas["Thing_List"]["properties"]["data"]["items"]["properties"]["attributes"] == THING
+    assert schemas["Error_List"]["properties"]["errors"]["items"] == schemas["DANJAError"]
+
+    paths = schema["paths"]
+    assert paths["/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]["anyOf"] == [
+        ref("Thing"),
+        ref("DANJAError"),
+    ]
+    assert paths["/list"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]["anyOf"] == [
+        ref("Thing_List"),
+        ref("Error_List"),
+    ]
+
+
+def test_it_keeps_recursive_schemas():
+    recursive = copy.deepcopy(SCHEMA)
+    recursive["components"]["schemas"]["Thing"]["properties"]["children"] = {"items": ref("Thing")}
+
+    schema = danja_openapi(recursive, cache=False)
+
+    schemas = schema["components"]["schemas"]
+    json.dumps(schema)
+    assert schemas["Thing"]["properties"]["name"] == {"type": "string"}
+    assert schemas["Thing"]["properties"]["children"] == {"items": ref("Thing")}
+    # The renamed container cannot take the name of the recursive model
+    assert schemas["DANJAResource_Thing_"]["properties"]["data"]["properties"]["attributes"] is schemas["Thing"]
+
+
+def test_it_caches_unchanged_schemas():
+    first = danja_openapi(copy.deepcopy(SCHEMA))
+    second = danja_openapi(copy.deepcopy(SCHEMA))
+
+    assert second == first
+    assert second is not first
+    second["components"]["schemas"].clear()
+    assert danja_openapi(copy.deepcopy(SCHEMA)) == first
+    assert danja_openapi(copy.deepcopy(SCHEMA), cache=False) == first
@@ -0,0 +1,126 @@
+import asyncio
+from itertools import count
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from pydantic import BaseModel, Field
+
+from pydanja import (
+    DANJAResourceList,
+    apaginate_cursor,
+    apaginate_offset,
+    atake_page,
+    decode_cursor,
+    encode_cursor,
+    paginate_cursor,
+    paginate_offset,
+    take_page,
+)
+
+URL = "https://example.com/invoices?sort=id&page[size]=99"
+
+
+class Invoice(BaseModel):
+    invoice_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    total: float
+
+
+def invoices(start: int = 1):
+    for index in count(start):
+        yield Invoice(id=index, total=index * 1.5)
+
+
+def page_params(link: Optional[str]) -> dict[str, str]:
+    assert link is not None
+    return {key: value[0] for key, value in parse_qs(urlsplit(link).query).items()}
+
+
+def test_cursors_round_trip_and_reject_garbage():
+    cursor = encode_cursor({"id": 12, "created": "2024-01-01"})
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == {"id": 12, "created": "2024-01-01"}
+    with pytest.raises(ValueError, match="Invalid page cursor"):
+        decode_cursor("not a cursor!")
+
+
+def test_take_page_reads_one_item_past_the_page():
+    source = iter(range(10))
+
+    assert take_page(source, 3) == ([0, 1, 2], True)
+    assert next(source) == 4
+    assert take_page(iter(range(3)), 3) == ([0, 1, 2], False)
+
+
+def test_atake_page_stops_and_closes_an_async_iterator():
+    consumed = []
+
+    async def numbers():
+        for number in range(10):
+            consumed.append(number)
+            yield number
+
+    assert asyncio.run(atake_page(numbers(), 3)) == ([0, 1, 2], True)
+    assert consumed == [0, 1, 2, 3]
+
+
+def test_paginate_cursor_builds_the_page_and_links():
+    page = paginate_cursor(invoices(), 3, URL, lambda invoice: invoice.invoice_id, total=1000, estimated=True)
+
+    assert isinstance(page, DANJAResourceList)
+    assert page.model_dump(exclude={"links", "meta"}) == DANJAResourceList.from_basemodel_list(
+        [Invoice(id=index, total=index * 1.5) for index in range(1, 4)]
+    ).model_dump(exclude={"links", "meta"})
+    assert page.meta == {"page": {"size": 3, "estimatedTotal": {"bestGuess": 1000}}}
+    assert page.links is not None
+    assert page_params(page.links["first"]) == {"sort": "id", "page[size]": "3"}
+    assert page.links["prev"] is None
+    assert page.links["last"] is None
+    after = page_params(page.links["next"])["page[after]"]
+    assert decode_cursor(after) == 3
+
+    following = paginate_cursor(invoices(decode_cursor(after) + 1), 3, URL, lambda invoice: invoice.invoice_id, after)
+    assert [resource.id for resource in following.data] == ["4", "5", "6"]
+    assert decode_cursor(page_params(following.links["prev"])["page[before]"]) == 4  # ty: ignore
+
+
+def test_paginate_cursor_last_page_and_before():
+    last = paginate_cursor(iter([Invoice(id=9, total=1.0)]), 3, URL, lambda invoice: invoice.invoice_id, "abc")
+    assert last.links["next"] is None  # ty: ignore
+    assert last.links["prev"] is not None  # ty: ignore
+
+    # Paginating backwards the resources come in reverse order
+    backwards = (Invoice(id=index, total=1.0) for index in range(5, 0, -1))
+    before = paginate_cursor(backwards, 3, URL, lambda invoice: invoice.invoice_id, before=encode_cursor(6))
+    assert [resource.id for resource in before.data] == ["3", "4", "5"]
+    assert decode_cursor(page_params(before.links["next"])["page[after]"]) == 5  # ty: ignore
+    assert decode_cursor(page_params(before.links["prev"])["page[before]"]) == 3  # ty: ignore
+
+
+def test_paginate_offset_links():
+    page = paginate_offset(invoices(21), URL, offset=20, limit=10, total=45, trusted=True)
+
+    assert len(page.data) == 10
+    assert page.meta == {"page": {"offset": 20, "limit": 10, "total": 45}}
+    assert page_params(page.links["first"])["page[offset]"] == "0"  # ty: ignore
+    assert page_params(page.links["prev"])["page[offset]"] == "10"  # ty: ignore
+    assert page_params(page.links["next"])["page[offset]"] == "30"  # ty: ignore
+    assert page_params(page.links["last"])["page[offset]"] == "40"  # ty: ignore
+
+    first = paginate_offset(iter([Invoice(id=1, total=1.0)]), URL, limit=10, total=5000, estimated=True)
+    assert first.links == {"first": first.links["first"], "prev": None, "next": None, "last": None}  # ty: ignore
+    assert first.meta == {"page": {"offset": 0, "limit": 10, "estimatedTotal": {"bestGuess": 5000}}}
+
+
+def test_async_pagination():
+    async def source():
+        for invoice in invoices():
+            yield invoice
+
+    cursor_page = asyncio.run(apaginate_cursor(source(), 2, URL, lambda invoice: invoice.invoice_id))
+    offset_page = asyncio.run(apaginate_offset(source(), URL, limit=2))
+
+    assert [resource.id for resource in cursor_page.data] == ["1", "2"]
+    assert [resource.id for resource in offset_page.data] == ["1", "2"]
+    assert offset_page.links["next"] is not None  # ty: ignore
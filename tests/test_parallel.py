@@ -0,0 +1,68 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from pydanja import DANJAResource, DANJAResourceList, default_executor, parallel_dump_json
+from pydanja.parallel import free_threaded
+
+
+class Measurement(BaseModel):
+    measurement_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    sensor: str
+    value: Optional[float] = None
+
+
+def document(size=95):
+    document = DANJAResourceList.from_basemodel_list(
+        [
+            Measurement(id=index, sensor=f"s{index % 7}", value=index / 3 if index % 2 else None)
+            for index in range(size)
+        ]
+    )
+    document.include_from_basemodels(
+        [{"type": "sensors", "id": str(index), "attributes": {"name": f"s{index}"}} for index in range(7)]
+    )
+    document.meta = {"count": size}
+    return document
+
+
+@pytest.mark.parametrize("exclude_none", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 10, 1000])
+def test_it_matches_model_dump_json_on_threads(chunk_size, exclude_none):
+    with ThreadPoolExecutor(4) as executor:
+        encoded = parallel_dump_json(document(), executor, chunk_size=chunk_size, exclude_none=exclude_none)
+
+    assert encoded == document().model_dump_json(exclude_none=exclude_none).encode()
+
+
+def test_it_matches_model_dump_json_on_processes():
+    with ProcessPoolExecutor(2) as executor:
+        encoded = parallel_dump_json(document(), executor, chunk_size=20)
+
+    assert encoded == document().model_dump_json().encode()
+
+
+def test_it_sends_parametrized_resources_to_processes():
+    typed = DANJAResourceList[Measurement].model_validate(document().model_dump(by_alias=True, exclude={"included"}))
+
+    with ProcessPoolExecutor(2) as executor:
+        for exclude_none in (False, True):
+            encoded = parallel_dump_json(typed, executor, chunk_size=20, exclude_none=exclude_none)
+            assert encoded == typed.model_dump_json(exclude_none=exclude_none).encode()
+
+
+def test_it_serializes_small_documents_inline():
+    single = DANJAResource.from_basemodel(Measurement(id=1, sensor="a"))
+
+    assert parallel_dump_json(single) == single.model_dump_json().encode()
+    assert parallel_dump_json(document(10), chunk_size=100) == document(10).model_dump_json().encode()
+
+
+def test_it_picks_the_executor_for_the_build():
+    executor = default_executor(1)
+    try:
+        assert isinstance(executor, ThreadPoolExecutor if free_threaded() else ProcessPoolExecutor)
+    finally:
+        executor.shutdown()
@@ -0,0 +1,144 @@
+import asyncio
+import io
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+from pydanja import (
+    DANJAResourceList,
+    DANJASingleResource,
+    ResourceListParser,
+    ResourceListReader,
+    ResourceTypeRegistry,
+)
+
+
+class Item(BaseModel):
+    item_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+    price: float
+
+
+ITEMS = [Item(id=index, name=f"Item \u00e9 {index}", price=index * 1.5) for index in range(1, 51)]
+
+
+def document_bytes(**members):
+    document = DANJAResourceList.from_basemodel_list(ITEMS)
+    for key, value in members.items():
+        setattr(document, key, value)
+    return document.model_dump_json(by_alias=True).encode()
+
+
+def chunked(data, size):
+    return [data[index : index + size] for index in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_it_yields_validated_resources_from_any_chunking(size):
+    reader = ResourceListReader(chunked(document_bytes(meta={"total": 50}), size), Item)
+
+    resources = list(reader)
+
+    assert [resource.attributes for resource in resources] == ITEMS
+    assert all(isinstance(resource, DANJASingleResource[Item]) for resource in resources)
+    assert reader.meta == {"total": 50}
+    assert reader.count == 50
+
+
+def test_it_reads_file_like_objects_and_exposes_leading_members():
+    data = (
+        b'{"meta": {"page": 2}, "links": {"self": "/items"}, "data": '
+        + json.dumps([{"type": "item", "id": "1", "attributes": {"id": 1, "name": "A", "price": 1.0}}]).encode()
+        + b"}"
+    )
+    reader = ResourceListReader(io.BytesIO(data), Item, chunk_size=16)
+
+    iterator = iter(reader)
+    first = next(iterator)
+    assert reader.meta == {"page": 2} and reader.links == {"self": "/items"}
+    assert first.attributes == Item(id=1, name="A", price=1.0)
+    assert list(iterator) == []
+
+
+def test_it_reads_async_sources():
+    async def stream():
+        for chunk in chunked(document_bytes(), 100):
+            yield chunk
+
+    async def read():
+        return [resource async for resource in ResourceListReader(stream(), Item)]
+
+    assert [resource.attributes for resource in asyncio.run(read())] == ITEMS
+
+
+def test_it_validates_included_through_a_registry():
+    resource_types = ResourceTypeRegistry()
+    resource_types.register(Item, "items")
+    included = [{"type": "items", "id": "9", "attributes": {"id": 9, "name": "I", "price": 2.0}}]
+    parser = ResourceListParser(Item, resource_types)
+
+    parser.feed(json.dumps({"data": [], "included": included}))
+    parser.close()
+
+    assert parser.included[0].attributes == Item(id=9, name="I", price=2.0)
+
+
+def test_it_rejects_invalid_and_incomplete_documents():
+    parser = ResourceListParser(Item)
+    parser.feed(document_bytes()[:-10])
+    with pytest.raises(ValueError):
+        parser.close()
+
+    with pytest.raises(ValueError):
+        ResourceListParser().feed(b'{"data": [1 2]}')
+
+    with pytest.raises(ValidationError):
+        ResourceListParser(Item).feed(b'{"data": [{"type": "item", "attributes": {"name": "A"}}]}')
+
+    empty = ResourceListParser()
+    assert empty.feed(b'{"data": []}') == [] and empty.close() == []
+
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_it_reads_included_spanning_many_chunks(size):
+    included = [
+        {"type": "notes", "id": str(index), "attributes": {"text": 'say "hi" \\ {not [a] bracket}' * 20}}
+        for index in range(200)
+    ]
+    parser = ResourceListParser(Item)
+
+    resources = []
+    document = {**json.loads(document_bytes(meta={"total": 50})), "included": included}
+    for chunk in chunked(json.dumps(document).encode(), size):
+        resources.extend(parser.feed(chunk))
+    resources.extend(parser.close())
+
+    assert len(resources) == 50
+    assert parser.included == included
+    assert parser.meta == {"total": 50}
+
+
+def test_it_rejects_invalid_tokens_before_the_value_ends():
+    parser = ResourceListParser()
+
+    with pytest.raises(ValueError, match="unexpected 'o'"):
+        parser.feed(b'{"data": [], "included": [{"type": "notes", "id": nope')
+
+    with pytest.raises(ValueError, match="unexpected ']'"):
+        ResourceListParser().feed(b'{"data": [], "included": [{"type": "notes"]')
+
+
+@pytest.mark.parametrize("size", [1, 3, 4096])
+def test_it_reads_literals(size):
+    document = b'{"data":[{"type":"a","id":"1","attributes":{"flag":false,"on":true,"gone":null}}],"meta":false}'
+    parser = ResourceListParser()
+
+    resources = []
+    for chunk in chunked(document, size):
+        resources.extend(parser.feed(chunk))
+    resources.extend(parser.close())
+
+    assert resources[0].attributes == {"flag": False, "on": True, "gone": None}
+    assert parser.meta is False
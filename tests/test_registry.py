@@ -0,0 +1,108 @@
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from pydanja import DANJAResource, DANJAResourceList, DANJASingleResource, ResourceTypeRegistry
+
+
+class Article(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "articles"})
+
+    article_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    title: str
+
+
+class Person(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "people"})
+
+    person_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+
+
+class Comment(BaseModel):
+    body: str
+
+
+PAYLOAD = {
+    "data": [{"id": "1", "type": "articles", "attributes": {"id": 1, "title": "Hello"}}],
+    "included": [
+        {"id": "9", "type": "people", "attributes": {"id": 9, "name": "Ada"}},
+        {"id": "5", "type": "comments", "attributes": {"body": "Nice"}},
+        {"id": "3", "type": "tags", "attributes": {"label": "python"}},
+    ],
+}
+
+
+@pytest.fixture
+def registry():
+    registry = ResourceTypeRegistry()
+    assert registry.register(Person) == "people"
+    assert registry.register(Comment, "comments") == "comments"
+    return registry
+
+
+def assert_typed(included):
+    person, comment, tag = included
+    assert isinstance(person, DANJASingleResource[Person])
+    assert person.attributes == Person(id=9, name="Ada")
+    assert isinstance(comment, DANJASingleResource[Comment])
+    assert comment.attributes == Comment(body="Nice")
+    assert tag.attributes == {"label": "python"}
+
+
+def test_it_validates_included_through_the_validation_context(registry):
+    resource_list = DANJAResourceList[Article].model_validate(PAYLOAD, context={"resource_types": registry})
+
+    assert resource_list.resources == [Article(id=1, title="Hello")]
+    assert_typed(resource_list.included)
+
+
+def test_it_validates_included_from_json(registry):
+    resource_list = DANJAResourceList[Article].from_json_bytes(json.dumps(PAYLOAD), resource_types=registry)
+
+    assert_typed(resource_list.included)
+
+
+def test_it_keeps_included_untyped_without_a_registry():
+    resource_list = DANJAResourceList[Article].model_validate(PAYLOAD)
+
+    assert resource_list.included == PAYLOAD["included"]
+
+
+def test_it_validates_included_added_from_models(registry):
+    resource = DANJAResource.from_basemodel(Article(id=1, title="Hello"))
+    resource.include_from_basemodels(PAYLOAD["included"])
+
+    revalidated = DANJAResource[Article].model_validate(resource, context={"resource_types": registry})
+
+    assert_typed(revalidated.included)
+
+
+def test_it_rejects_invalid_included_attributes(registry):
+    payload = {**PAYLOAD, "included": [{"id": "9", "type": "people", "attributes": {"id": "x"}}]}
+
+    with pytest.raises(ValidationError):
+        DANJAResourceList[Article].model_validate(payload, context={"resource_types": registry})
+
+
+def test_it_can_reject_unknown_types():
+    registry = ResourceTypeRegistry(allow_unknown=False)
+    registry.register(Person)
+
+    with pytest.raises(ValidationError):
+        registry.validate_included(PAYLOAD["included"])
+
+    empty = ResourceTypeRegistry(allow_unknown=False)
+    with pytest.raises(ValidationError):
+        empty.validate_included(PAYLOAD["included"])
+    assert empty.validate_included(None) is None
+
+
+def test_registries_with_the_same_types_share_a_schema(registry):
+    other = ResourceTypeRegistry()
+    other.register(Person)
+    other.register(Comment, "comments")
+
+    assert other.included_adapter is registry.included_adapter
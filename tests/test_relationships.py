@@ -0,0 +1,68 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from pydanja import DANJAResource, DANJAResourceList
+
+
+class Person(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "people"})
+
+    person_id: int = Field(json_schema_extra={"resource_id": True})
+    name: str
+
+
+class Article(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "articles"})
+
+    article_id: int = Field(json_schema_extra={"resource_id": True})
+    title: str
+    author_id: Optional[int] = Field(
+        default=None, json_schema_extra={"relationship": "author", "resource_type": "people"}
+    )
+    tag_ids: list[str] = Field(default=[], json_schema_extra={"relationship": "tags"})
+
+
+ARTICLES = [
+    Article(article_id=1, title="One", author_id=7, tag_ids=["a", "b"]),
+    Article(article_id=2, title="Two", author_id=7, tag_ids=["b"]),
+    Article(article_id=3, title="Three"),
+]
+
+
+def test_it_links_to_one_and_to_many_relationships():
+    document = DANJAResourceList.from_basemodel_list(ARTICLES)
+
+    dumped = document.model_dump(exclude_none=True)
+
+    assert dumped["data"][0]["relationships"] == {
+        "author": {"data": {"type": "people", "id": "7"}},
+        "tags": {"data": [{"type": "tags", "id": "a"}, {"type": "tags", "id": "b"}]},
+    }
+    assert dumped["data"][2]["relationships"] == {"author": {}, "tags": {"data": []}}
+    assert document.model_dump()["data"][2]["relationships"]["author"]["data"] is None
+
+
+def test_it_shares_identifiers_and_relationships_across_the_list():
+    for trusted in (False, True):
+        document = DANJAResourceList[Article].from_basemodel_list(ARTICLES, trusted=trusted)
+        first, second, _ = (resource.relationships for resource in document.data)
+
+        assert first["author"] is second["author"]
+        assert first["tags"].data[1] is second["tags"].data[0]
+
+
+def test_it_links_a_single_resource_and_related_models():
+    class Post(BaseModel):
+        post_id: int = Field(json_schema_extra={"resource_id": True})
+        author: Person = Field(json_schema_extra={"relationship": "author", "resource_type": "people"})
+
+    document = DANJAResource.from_basemodel(Post(post_id=1, author=Person(person_id=3, name="Ada")))
+
+    assert document.data.relationships["author"].data.model_dump() == {"type": "people", "id": "3", "lid": None}
+
+
+def test_it_leaves_models_without_relationships_alone():
+    document = DANJAResourceList.from_basemodel_list([Person(person_id=1, name="Ada")])
+
+    assert document.data[0].relationships is None
@@ -0,0 +1,74 @@
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+from pydanja import DANJAResource, DANJAResourceList, ResourceResolver
+
+
+class Article(BaseModel):
+    model_config = ConfigDict(json_schema_extra={"resource_name": "articles"})
+
+    article_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    title: str
+
+
+class Comment(BaseModel):
+    comment_id: int
+    body: str
+
+
+@pytest.fixture(autouse=True)
+def clean_resolver():
+    ResourceResolver.invalidate()
+    yield
+    ResourceResolver.invalidate()
+
+
+def test_it_resolves_metadata_once_per_class(monkeypatch):
+    calls = []
+    inspect = ResourceResolver._inspect.__func__
+
+    def counting_inspect(cls, resource_class):
+        calls.append(resource_class)
+        return inspect(cls, resource_class)
+
+    monkeypatch.setattr(ResourceResolver, "_inspect", classmethod(counting_inspect))
+
+    DANJAResourceList.from_basemodel_list([Article(id=1, title="One"), Article(id=2, title="Two")])
+    DANJAResource.from_basemodel(Article(id=3, title="Three"))
+
+    assert calls == [Article]
+    metadata = ResourceResolver.resolve_metadata(Article)
+    assert metadata.resource_name == "articles"
+    assert metadata.resource_id == "article_id"
+    assert metadata.id_getter(Article(id=4, title="Four")) == 4
+
+
+def test_it_uses_registered_overrides():
+    ResourceResolver.register(Comment, resource_name="comments", resource_id="comment_id")
+
+    resource = DANJAResource.from_basemodel(Comment(comment_id=7, body="Nice"))
+
+    assert resource.data.type == "comments"
+    assert resource.data.id == "7"
+
+
+def test_explicit_arguments_win_over_registered_metadata():
+    ResourceResolver.register(Comment, resource_name="comments", resource_id="comment_id")
+
+    resource = DANJAResource.from_basemodel(Comment(comment_id=7, body="Nice"), resource_name="remarks")
+
+    assert resource.data.type == "remarks"
+    assert resource.data.id == "7"
+
+
+def test_it_invalidates_dynamically_created_classes():
+    Dynamic = create_model("Dynamic", key=(int, Field(json_schema_extra={"resource_id": True})))
+    assert ResourceResolver.resolve_metadata(Dynamic).resource_id == "key"
+
+    Dynamic.model_config["resource_name"] = "renamed"
+    assert ResourceResolver.resolve_metadata(Dynamic).resource_name == "dynamic"
+
+    ResourceResolver.invalidate(Dynamic)
+    assert ResourceResolver.resolve_metadata(Dynamic).resource_name == "renamed"
@@ -193,3 +193,68 @@ def test_it_does_not_warn_for_resource_list_with_included():
 
     assert resource_list.included == payload["included"]
     assert not any("Returning anything other than `self`" in str(w.message) for w in warning_records)
+
+
+def test_it_does_not_mutate_the_validated_payload():
+    payload = {
+        "data": {
+            "id": "1",
+            "type": "fixturetesttype",
+            "attributes": {"id": 1, "name": "Stuff!", "description": "This is desc!"},
+        },
+        "included": [
+            {
+                "id": "200",
+                "type": "other",
+                "attributes": {"name": "Included model"},
+            }
+        ],
+    }
+    snapshot = json.loads(json.dumps(payload))
+
+    resource = DANJAResource[FixtureTestType].model_validate(payload)
+
+    assert payload == snapshot
+    assert resource.included == snapshot["included"]
+
+
+def test_it_does_not_mutate_a_validated_model():
+    resource = DANJAResource.from_basemodel(FixtureTestType(id=1, name="Stuff!", description="This is desc!"))
+    resource.include_from_basemodels([{"id": "200", "type": "other", "attributes": {"name": "Included model"}}])
+    included = resource.included
+
+    revalidated = DANJAResource[FixtureTestType].model_validate(resource)
+
+    assert resource.included is included
+    assert revalidated.included == included
+    assert revalidated.resource == resource.resource
+
+
+@pytest.mark.parametrize("container", [DANJAResourceList, DANJAResourceList[FixtureTestType]])
+def test_it_builds_identical_trusted_resource_lists(container):
+    basemodel_instances = [
+        FixtureTestType(id=1, name="Stuff!", description="This is desc!"),
+        FixtureTestType(name="More Stuff!", description="This is more desc!"),
+    ]
+
+    validated = container.from_basemodel_list(basemodel_instances)
+    trusted = container.from_basemodel_list(basemodel_instances, trusted=True)
+
+    assert type(trusted) is type(validated)
+    assert [type(item) for item in trusted.data] == [type(item) for item in validated.data]
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert [item.model_fields_set for item in trusted.data] == [item.model_fields_set for item in validated.data]
+    assert trusted.model_dump_json() == validated.model_dump_json()
+    assert trusted.resources == basemodel_instances
+
+
+@pytest.mark.parametrize("container", [DANJAResource, DANJAResource[FixtureTestType]])
+def test_it_builds_identical_trusted_resources(container):
+    basemodel_instance = FixtureTestType(id=1, name="Stuff!", description="This is desc!")
+
+    validated = container.from_basemodel(basemodel_instance)
+    trusted = container.from_basemodel(basemodel_instance, trusted=True)
+
+    assert type(trusted.data) is type(validated.data)
+    assert trusted.model_dump_json() == validated.model_dump_json()
+    assert trusted.resource is basemodel_instance
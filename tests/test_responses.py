@@ -0,0 +1,151 @@
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from pydanja import DANJAResource, DANJAResourceList, ResourceCache  # noqa: E402
+from pydanja.responses import DANJAResponse, conditional_response, danja_route  # noqa: E402
+
+
+class ResponseTestType(BaseModel):
+    response_testtype_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+    description: Optional[str] = None
+
+
+MODELS = [ResponseTestType(id=1, name="One"), ResponseTestType(id=2, name="Two", description="Second")]
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @danja_route(app, "/things")
+    async def things() -> DANJAResourceList[ResponseTestType]:
+        return DANJAResourceList.from_basemodel_list(MODELS)
+
+    @danja_route(app, "/things", methods=["POST"], status_code=201)
+    def create_thing(payload: DANJAResource[ResponseTestType]) -> DANJAResource[ResponseTestType]:
+        return DANJAResource.from_basemodel(payload.resource)
+
+    return TestClient(app)
+
+
+def test_it_serializes_once_with_the_jsonapi_media_type(client):
+    response = client.get("/things")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.api+json"
+    assert response.json() == json.loads(
+        DANJAResourceList.from_basemodel_list(MODELS).model_dump_json(exclude_none=True, by_alias=True)
+    )
+
+
+def test_it_writes_fields_by_alias_like_response_model():
+    app = FastAPI()
+
+    @app.get("/plain", response_model_exclude_none=True)
+    def plain() -> DANJAResourceList[ResponseTestType]:
+        return DANJAResourceList.from_basemodel_list(MODELS)
+
+    @danja_route(app, "/danja")
+    def danja() -> DANJAResourceList[ResponseTestType]:
+        return DANJAResourceList.from_basemodel_list(MODELS)
+
+    @danja_route(app, "/names", response_model_by_alias=False)
+    def names() -> DANJAResourceList[ResponseTestType]:
+        return DANJAResourceList.from_basemodel_list(MODELS)
+
+    client = TestClient(app)
+    assert client.get("/danja").json() == client.get("/plain").json()
+    assert client.get("/danja").json()["data"][0]["attributes"] == {"id": 1, "name": "One"}
+    assert client.get("/names").json()["data"][0]["attributes"] == {"response_testtype_id": 1, "name": "One"}
+
+
+def test_it_supports_sync_endpoints_and_status_codes(client):
+    payload = DANJAResource.from_basemodel(MODELS[1]).model_dump(exclude_none=True, by_alias=True)
+
+    response = client.post("/things", json=payload)
+
+    assert response.status_code == 201
+    assert response.json()["data"] == {
+        "id": "2",
+        "type": "responsetesttype",
+        "attributes": {"id": 2, "name": "Two", "description": "Second"},
+    }
+
+
+def test_it_documents_the_response_model(client):
+    operation = client.get("/openapi.json").json()["paths"]["/things"]["get"]
+
+    content = operation["responses"]["200"]["content"]
+    assert list(content) == ["application/vnd.api+json"]
+    assert content["application/vnd.api+json"]["schema"]["$ref"].endswith("DANJAResourceList_ResponseTestType_")
+
+
+def test_it_can_keep_null_members():
+    response = DANJAResponse(DANJAResource.from_basemodel(MODELS[0]), exclude_none=False)
+
+    assert json.loads(response.body)["data"]["attributes"]["description"] is None
+
+
+def test_it_applies_sparse_fieldsets():
+    response = DANJAResponse(DANJAResourceList.from_basemodel_list(MODELS), fieldsets={"responsetesttype": ["name"]})
+
+    assert [resource["attributes"] for resource in json.loads(response.body)["data"]] == [
+        {"name": "One"},
+        {"name": "Two"},
+    ]
+
+
+def test_it_answers_conditional_requests_from_the_cache():
+    app = FastAPI()
+    cache = ResourceCache(ttl=60)
+
+    @app.get("/cached")
+    def cached(request: Request):
+        document = DANJAResourceList.from_basemodel_list(MODELS)
+        return conditional_response(cache, document, request.headers.get("if-none-match"))
+
+    client = TestClient(app)
+    response = client.get("/cached")
+    assert response.status_code == 200
+    assert response.json() == json.loads(
+        DANJAResourceList.from_basemodel_list(MODELS).model_dump_json(exclude_none=True, by_alias=True)
+    )
+    assert response.json()["data"][0]["attributes"]["id"] == 1
+
+    not_modified = client.get("/cached", headers={"If-None-Match": response.headers["etag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == response.headers["etag"]
+
+
+def test_validation_errors_respond_with_a_jsonapi_error_list():
+    from fastapi.exceptions import RequestValidationError
+
+    from pydanja.responses import validation_error_handler
+
+    app = FastAPI()
+    app.add_exception_handler(RequestValidationError, validation_error_handler)  # ty: ignore
+
+    @app.post("/things")
+    async def create(document: DANJAResource[ResponseTestType], limit: int = 10) -> dict:
+        return {}
+
+    client = TestClient(app)
+    response = client.post("/things?limit=many", json={"data": {"type": "things", "attributes": {"id": 1}}})
+
+    assert response.status_code == 422
+    assert response.headers["content-type"] == "application/vnd.api+json"
+    assert [(error["status"], error.get("source")) for error in response.json()["errors"]] == [
+        ("400", {"parameter": "limit"}),
+        ("422", {"pointer": "/data/attributes/name"}),
+    ]
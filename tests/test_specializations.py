@@ -0,0 +1,68 @@
+import gc
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from pydanja import DANJAResource, DANJAResourceList, ResourceTypeRegistry, SpecializationRegistry
+from pydanja.models import _json_models
+
+
+class Gauge(BaseModel):
+    gauge_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    reading: float
+
+
+class Station(BaseModel):
+    station_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+
+
+def test_it_warms_every_container_and_reports_timings():
+    registry = ResourceTypeRegistry()
+    registry.register(Station)
+    specializations = SpecializationRegistry(resource_types=registry)
+
+    timings = specializations.warm([Gauge, Station])
+
+    assert [timing.step for timing in timings if timing.model is Gauge] == [
+        "metadata",
+        "relationships",
+        "DANJASingleResource",
+        "DANJAResource",
+        "DANJAResource JSON",
+        "DANJAResourceList",
+        "DANJAResourceList JSON",
+    ]
+    assert all(timing.seconds >= 0 for timing in timings)
+    assert specializations.total_seconds() == pytest.approx(sum(timing.seconds for timing in timings))
+    assert Gauge in specializations
+    assert len(_json_models[specializations.resource_list(Gauge)]) == 2
+
+    # Warming again compiles nothing
+    assert specializations.warm([Gauge]) == []
+
+
+def test_request_code_reuses_the_compiled_containers():
+    specializations = SpecializationRegistry()
+    specializations.warm([Gauge])
+    compiled = specializations.resource_list(Gauge)
+    gc.collect()
+
+    assert DANJAResourceList[Gauge] is compiled
+    assert DANJAResource[Gauge] is specializations.resource(Gauge)
+    document = DANJAResourceList[Gauge].from_json_bytes(
+        json.dumps({"data": [{"id": "1", "type": "gauge", "attributes": {"id": 1, "reading": 1.5}}]})
+    )
+    assert document.resources == [Gauge(id=1, reading=1.5)]
+
+
+def test_strict_registries_only_serve_warmed_models():
+    specializations = SpecializationRegistry(strict=True)
+    with pytest.raises(KeyError):
+        specializations.resource(Station)
+
+    lenient = SpecializationRegistry()
+    assert lenient.single_resource(Station) is not None
+    assert Station in lenient
@@ -0,0 +1,96 @@
+import asyncio
+import json
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from pydanja import DANJALink, DANJAResourceList, DANJASingleResource, astream_resource_list, stream_resource_list
+
+
+class StreamTestType(BaseModel):
+    stream_testtype_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    name: str
+
+
+MODELS = [StreamTestType(id=index or None, name=f"Name {index}") for index in range(7)]
+INCLUDED = [
+    {"id": "200", "type": "people", "attributes": {"name": "Ada"}},
+    DANJASingleResource(id="201", type="people", attributes={"name": "Grace"}),
+]
+LINKS = {"self": DANJALink(href="http://localhost/things"), "next": None}
+META = {"total": 7}
+
+
+def materialized(exclude_none: bool) -> dict:
+    document = DANJAResourceList.from_basemodel_list(MODELS)
+    document.include_from_basemodels([INCLUDED[0], INCLUDED[1].model_dump()])
+    document.links = LINKS
+    document.meta = META
+    return json.loads(document.model_dump_json(exclude_none=exclude_none))
+
+
+@pytest.mark.parametrize("exclude_none", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_it_streams_the_same_document(exclude_none, chunk_size):
+    chunks = list(
+        stream_resource_list(
+            iter(MODELS),
+            included=INCLUDED,
+            links=LINKS,
+            meta=META,
+            exclude_none=exclude_none,
+            chunk_size=chunk_size,
+        )
+    )
+
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert len(chunks) == len(MODELS) // chunk_size + len(INCLUDED) // chunk_size + 1
+    assert json.loads(b"".join(chunks)) == materialized(exclude_none)
+
+
+def test_it_streams_an_empty_document():
+    document = b"".join(stream_resource_list([]))
+
+    assert json.loads(document) == json.loads(DANJAResourceList.from_basemodel_list([]).model_dump_json())
+
+
+def test_it_streams_from_async_iterables():
+    async def models():
+        for model in MODELS:
+            yield model
+
+    async def collect():
+        return [
+            chunk
+            async for chunk in astream_resource_list(
+                models(), included=INCLUDED, links=LINKS, meta=META, exclude_none=True, chunk_size=2
+            )
+        ]
+
+    assert json.loads(b"".join(asyncio.run(collect()))) == materialized(True)
+
+
+def test_it_uses_explicit_resource_name_and_id():
+    document = json.loads(b"".join(stream_resource_list(MODELS[1:2], resource_name="things", resource_id="name")))
+
+    assert document["data"][0]["type"] == "things"
+    assert document["data"][0]["id"] == "Name 1"
+
+
+class Chapter(BaseModel):
+    chapter_id: Optional[int] = Field(alias="id", default=None, json_schema_extra={"resource_id": True})
+    title: str
+    author_id: Optional[int] = Field(
+        default=None, json_schema_extra={"relationship": "author", "resource_type": "people"}
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100])
+def test_it_streams_declared_relationships_like_from_basemodel_list(chunk_size):
+    chapters = [Chapter(id=index, title=f"C{index}", author_id=index % 2 or None) for index in range(1, 5)]
+
+    streamed = json.loads(b"".join(stream_resource_list(chapters, chunk_size=chunk_size)))
+
+    assert streamed == json.loads(DANJAResourceList.from_basemodel_list(chapters).model_dump_json())
+    assert streamed["data"][0]["relationships"]["author"]["data"]["id"] == "1"